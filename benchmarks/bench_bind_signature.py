@@ -0,0 +1,132 @@
+"""Per-call overhead of functions wrapped by `bind_signature_to_function`.
+
+Compares a plain call of a function against the wrapper generated by
+`bind_signature_to_function`, against a wrapper that uses `inspect.Signature.bind`, and against
+the functions returned with ``validate_calls=False`` and ``validate_calls=100``. Also times the
+construction of objects at the end of a chain of ``super().__init__(**kwargs)`` calls with each
+``validate_calls`` option.
+
+Run with ``python benchmarks/bench_bind_signature.py``.
+"""
+import functools
+import inspect
+import timeit
+
+from docerator import bind_signature_to_function
+
+
+def signature_bind_wrapper(signature, func):
+    # The wrapper as it was implemented before argument binders were generated.
+    @functools.wraps(func)
+    def bind_signature(*args, **kwargs):
+        try:
+            params = signature.bind(*args, **kwargs)
+        except TypeError as err:
+            raise TypeError(f"{func.__qualname__}(): {err}") from None
+        return func(*params.args, **params.kwargs)
+
+    bind_signature.__signature__ = signature
+    return bind_signature
+
+
+def target(self, arg1, arg2=None, **kwargs):
+    pass
+
+
+def signature_for(n_kwargs):
+    P = inspect.Parameter
+    params = list(inspect.signature(target).parameters.values())[:-1]
+    params += [P(f"kw{i}", P.KEYWORD_ONLY, default=None) for i in range(n_kwargs)]
+    return inspect.Signature(params)
+
+
+def time_call(func, args, kwargs, number):
+    return min(timeit.repeat(lambda: func(*args, **kwargs), number=number, repeat=5)) / number
+
+
+def call_overhead(n_kwargs=4, number=100_000):
+    """Time per call (in seconds) for the plain function and each kind of wrapper."""
+    signature = signature_for(n_kwargs)
+    args = (None, 1)
+    kwargs = {f"kw{i}": i for i in range(n_kwargs)}
+    return {
+        "plain": time_call(target, args, kwargs, number),
+        "generated": time_call(bind_signature_to_function(signature, target), args, kwargs, number),
+        "signature_bind": time_call(signature_bind_wrapper(signature, target), args, kwargs, number),
+        "unvalidated": time_call(
+            bind_signature_to_function(signature, target, validate_calls=False), args, kwargs, number
+        ),
+        "sampled_100": time_call(
+            bind_signature_to_function(signature, target, validate_calls=100), args, kwargs, number
+        ),
+    }
+
+
+def chain(depth, validate_calls):
+    """The last of a chain of `depth` classes, each passing its ``**kwargs`` on to its parent's ``__init__``."""
+    lines = ["import docerator", ""]
+    for d in range(depth):
+        base = "metaclass=docerator.DoceratorMeta" if d == 0 else f"C{d - 1}"
+        lines += [
+            f"class C{d}({base}, validate_calls={validate_calls!r}):",
+            f'    """C{d}',
+            "",
+            "    Parameters",
+            "    ----------",
+            f"    p{d} : int, optional",
+            f"        The p{d}.",
+            "    %(super.*)" if d else "",
+            '    """',
+            f"    def __init__(self, p{d}=0, **kwargs):",
+            "        super().__init__(**kwargs)" if d else "        pass",
+            "",
+        ]
+    namespace = {}
+    exec(compile("\n".join(lines), "<benchmark chain>", "exec"), namespace)
+    return namespace[f"C{depth - 1}"]
+
+
+def chain_overhead(depths=(1, 2, 4, 8), number=20_000):
+    """Time to construct (in seconds) the leaf of a chain of each depth, for each `validate_calls`."""
+    results = {}
+    for validate_calls in [True, "outermost", False]:
+        times = results[str(validate_calls)] = {}
+        for depth in depths:
+            cls = chain(depth, validate_calls)
+            times[str(depth)] = time_call(cls, (), {"p0": 1}, number)
+    return results
+
+
+def per_level(times):
+    """The time each level of a chain adds, fitted over the depths of one of `chain_overhead`'s results.
+
+    With ``validate_calls="outermost"``, only the outermost call is checked, so each level should
+    only add its wrapper, and one more parameter for the outermost call to bind: the same at every
+    depth, like with ``validate_calls=False``.
+    """
+    depths = [int(depth) for depth in times]
+    values = list(times.values())
+    mean_depth = sum(depths) / len(depths)
+    mean_value = sum(values) / len(values)
+    covariance = sum((d - mean_depth) * (v - mean_value) for d, v in zip(depths, values))
+    return covariance / sum((d - mean_depth) ** 2 for d in depths)
+
+
+def main():
+    chains = chain_overhead()
+    for validate_calls, times in chains.items():
+        print(f"validate_calls={validate_calls}:")
+        for depth, value in times.items():
+            print(f"    depth {depth:>2}: {value * 1e9:8.1f} ns")
+        level = per_level(times)
+        print(f"    per level: {level * 1e9:8.1f} ns ({level / per_level(chains['False']):5.2f}x unchecked)")
+    for n_kwargs in [0, 4, 16]:
+        times = call_overhead(n_kwargs)
+        plain = times["plain"]
+        print(f"{n_kwargs} keyword arguments:")
+        for name, value in times.items():
+            print(f"    {name:>15}: {value * 1e9:8.1f} ns ({value / plain:5.2f}x plain)")
+
+
+if __name__ == "__main__":
+    main()
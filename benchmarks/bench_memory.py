@@ -0,0 +1,145 @@
+"""Memory retained by the classes of a large synthetic `DoceratorMeta` hierarchy.
+
+Builds a module of `n_classes` classes (in chains of `depth`) while tracing allocations with
+`tracemalloc`, and compares the memory it retains against the same classes without the metaclass,
+and against what it still retains after `docerator.reclaim`.
+
+Run with ``python -m benchmarks.bench_memory``. To compare against another checkout, write its
+results with ``--output baseline.json`` (with that checkout first on ``PYTHONPATH``), and pass them
+back with ``--baseline baseline.json``: this reports what is retained, before and after
+`docerator.reclaim`, as fractions of what the baseline retains by default, both in total and
+above the classes without the metaclass. Results files written by ``python -m benchmarks.run``
+can also be used as the baseline. Versions of docerator without `docerator.reclaim` report the
+same memory before and after it.
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+import docerator
+from docerator._params import DescribedParameter
+
+from benchmarks.synthetic import build_module, hierarchy_source
+
+
+def _traced(build, then=None):
+    # the bytes retained after `build`, the peak, and the bytes retained after `then(result)`.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        after = retained
+        if then is not None:
+            then(result)
+            gc.collect()
+            after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, retained, peak, after
+
+
+def _count_parameters(module):
+    parameters = [
+        param
+        for cls in vars(module).values() if isinstance(cls, type)
+        for arg_dict in cls._arg_dict.values()
+        for param in arg_dict.values()
+    ]
+    n_parameters = sum(isinstance(param, DescribedParameter) for param in parameters)
+    n_descriptions = len({id(param.long_description) for param in parameters})
+    return n_parameters, n_descriptions
+
+
+def memory_usage(n_classes=2000, depth=20, n_params=5):
+    """Bytes retained (and at peak) while creating a hierarchy of `n_classes` classes."""
+    width = max(n_classes // depth, 1)
+    source = hierarchy_source(depth, width, n_params)
+    module_name = "_docerator_memory_benchmark"
+    counts = []
+
+    def reclaim(module):
+        counts.extend(_count_parameters(module))
+        if hasattr(docerator, "reclaim"):
+            docerator.reclaim(module_name)
+
+    module, retained, peak, reclaimed = _traced(lambda: build_module(module_name, source), reclaim)
+    n_parameters, n_descriptions = counts
+    del sys.modules[module_name]
+    del module
+
+    plain = source.replace("metaclass=docerator.DoceratorMeta", "")
+
+    def build_plain():
+        # (the namespace is returned to keep its classes alive while they are measured)
+        namespace = {}
+        exec(compile(plain, "<benchmark>", "exec"), namespace)
+        return namespace
+
+    _, plain_retained, plain_peak, _ = _traced(build_plain)
+    n_classes = depth * width
+    return {
+        "n_classes": n_classes,
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "plain_retained_bytes": plain_retained,
+        "plain_peak_bytes": plain_peak,
+        "bytes_per_class": (retained - plain_retained) / n_classes,
+        "reclaimed_retained_bytes": reclaimed,
+        "reclaimed_bytes_per_class": (reclaimed - plain_retained) / n_classes,
+        "described_parameters": n_parameters,
+        "distinct_descriptions": n_descriptions,
+    }
+
+
+def compare_to_baseline(usage, baseline):
+    """The memory retained in `usage`, as fractions of the memory the baseline retains by default.
+
+    `baseline` is the results of ``python -m benchmarks.run`` on another checkout, for the same
+    number of classes. Both what `usage` retains by default and what it still retains after
+    `docerator.reclaim` are compared against what the baseline retains *by default* (without
+    calling `docerator.reclaim`): a fraction above 1 is more memory than the baseline needs. The
+    ``overhead`` fractions only count the memory retained above the same classes without the
+    metaclass, that is the memory docerator itself retains.
+    """
+    baseline = baseline["results"]["memory"]
+    if baseline["n_classes"] != usage["n_classes"]:
+        raise ValueError(f"the baseline has {baseline['n_classes']} classes, not {usage['n_classes']}")
+    return {
+        "retained_vs_baseline": usage["retained_bytes"] / baseline["retained_bytes"],
+        "overhead_vs_baseline": usage["bytes_per_class"] / baseline["bytes_per_class"],
+        "reclaimed_vs_baseline": usage["reclaimed_retained_bytes"] / baseline["retained_bytes"],
+        "reclaimed_overhead_vs_baseline": usage["reclaimed_bytes_per_class"] / baseline["bytes_per_class"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the memory retained by docerator classes.")
+    parser.add_argument("--classes", type=int, default=2000, help="number of classes")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--output", help="write the results to this file")
+    args = parser.parse_args(argv)
+    usage = memory_usage(args.classes)
+    for name, value in usage.items():
+        print(f"{name:>30}: {value:,.0f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": {"memory": usage}}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        compared = compare_to_baseline(usage, baseline)
+        for name, value in compared.items():
+            print(f"{name:>30}: {value:.3f}")
+        retained, reclaimed = compared["retained_vs_baseline"], compared["reclaimed_vs_baseline"]
+        print(
+            f"retained memory compared to the baseline's default: {retained - 1:+.1%} by default, "
+            f"{reclaimed - 1:+.1%} after reclaim()"
+        )
+
+
+if __name__ == "__main__":
+    main()
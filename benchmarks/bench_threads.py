@@ -0,0 +1,73 @@
+"""Throughput of `DoceratorMeta` class creation from several threads at once.
+
+Builds the same number of synthetic modules with 1, 2, 4, ... threads, each thread building its
+share of the modules, and reports the time each took. Only a free-threaded build of CPython
+(``python3.13t`` or later) can actually run the threads in parallel, with the GIL the times
+should stay about the same.
+
+Run with ``python -m benchmarks.bench_threads``.
+"""
+import sys
+import sysconfig
+import threading
+import time
+
+from docerator.parsers import NumpydocParser
+
+from benchmarks.synthetic import build_module, hierarchy_source
+
+
+def _build_modules(names, source, barrier):
+    barrier.wait()
+    for name in names:
+        build_module(name, source)
+
+
+def thread_scaling(n_modules=16, threads=(1, 2, 4, 8), depth=4, width=10, n_params=5):
+    """Time building `n_modules` modules of synthetic classes, split over each number of `threads`."""
+    source = hierarchy_source(depth, width, n_params)
+    results = {}
+    for n_threads in threads:
+        names = [f"_docerator_thread_benchmark_{i}" for i in range(n_modules)]
+        NumpydocParser.cache_clear()
+        barrier = threading.Barrier(n_threads + 1)
+        workers = [
+            threading.Thread(target=_build_modules, args=(names[i::n_threads], source, barrier))
+            for i in range(n_threads)
+        ]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        for name in names:
+            del sys.modules[name]
+        results[str(n_threads)] = {
+            "time": elapsed,
+            "classes_per_second": n_modules * depth * width / elapsed,
+        }
+    single = results[str(threads[0])]["time"]
+    for result in results.values():
+        result["speedup"] = single / result["time"]
+    return {
+        "n_classes": n_modules * depth * width,
+        "free_threaded": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "threads": results,
+    }
+
+
+def main():
+    results = thread_scaling()
+    print(f"free threaded: {results['free_threaded']}, classes: {results['n_classes']}")
+    print(f"{'threads':>8} {'time (s)':>10} {'classes/s':>10} {'speedup':>8}")
+    for n_threads, result in results["threads"].items():
+        print(
+            f"{n_threads:>8} {result['time']:>10.3f} {result['classes_per_second']:>10.0f} "
+            f"{result['speedup']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
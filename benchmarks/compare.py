@@ -0,0 +1,50 @@
+"""Compare two results files written by ``python -m benchmarks.run``.
+
+Run with ``python -m benchmarks.compare old.json new.json``.
+"""
+import argparse
+import json
+
+
+def _flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(old, new):
+    """Pair up the numeric results of two runs, as ``{name: (old, new, new / old)}``."""
+    old = _flatten(old["results"])
+    new = _flatten(new["results"])
+    comparison = {}
+    for name in old.keys() & new.keys():
+        ratio = new[name] / old[name] if old[name] else float("nan")
+        comparison[name] = (old[name], new[name], ratio)
+    return dict(sorted(comparison.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two docerator benchmark results files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    args = parser.parse_args(argv)
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    if old["parameters"] != new["parameters"]:
+        print("warning: the benchmarks were run with different parameters.")
+    comparison = compare(old, new)
+    width = max([len("benchmark")] + [len(name) for name in comparison])
+    print(f"{'benchmark':<{width}} {'old':>12} {'new':>12} {'new/old':>8}")
+    for name, (old_value, new_value, ratio) in comparison.items():
+        print(f"{name:<{width}} {old_value:>12.4g} {new_value:>12.4g} {ratio:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
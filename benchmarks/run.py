@@ -0,0 +1,167 @@
+"""Benchmark suite for docerator.
+
+Measures the time to create synthetic `DoceratorMeta` hierarchies, the memory retained by a large
+one, how class creation scales with threads, the throughput of
+`NumpydocParser.parse_parameters` on large docstrings, and the per-call
+overhead of functions wrapped by `bind_signature_to_function`, also along chains of
+``super().__init__(**kwargs)`` calls. Results are written as JSON, and two results files
+can be compared with ``python -m benchmarks.compare old.json new.json``.
+
+Run from the repository root with::
+
+    python -m benchmarks.run --output results.json
+"""
+import argparse
+import inspect
+import json
+import platform
+import sys
+import time
+import timeit
+
+import docerator
+from docerator.parsers import NumpydocParser
+
+from benchmarks.bench_bind_signature import call_overhead, chain_overhead, per_level
+from benchmarks.bench_memory import memory_usage
+from benchmarks.bench_threads import thread_scaling
+from benchmarks.synthetic import build_module, hierarchy_source, large_docstring
+
+_MODULE_COUNTER = 0
+
+
+def _unique_module_name():
+    global _MODULE_COUNTER
+    _MODULE_COUNTER += 1
+    return f"_docerator_benchmark_{_MODULE_COUNTER}"
+
+
+def bench_class_creation(depth, width, n_params, repeat, class_kwargs=None):
+    source = hierarchy_source(depth, width, n_params, class_kwargs)
+    times = []
+    for _ in range(repeat):
+        module_name = _unique_module_name()
+        # each repeat starts without any previously parsed docstrings.
+        NumpydocParser.cache_clear()
+        start = time.perf_counter()
+        build_module(module_name, source)
+        times.append(time.perf_counter() - start)
+        del sys.modules[module_name]
+    # baseline: the same classes without the metaclass doing any work.
+    plain = source.replace("metaclass=docerator.DoceratorMeta", "")
+    for key in (class_kwargs or {}):
+        plain = plain.replace(f", {key}={class_kwargs[key]!r}", "")
+    plain_code = compile(plain, "<benchmark>", "exec")
+    plain_times = timeit.repeat(lambda: exec(plain_code, {}), number=1, repeat=repeat)
+    n_classes = depth * width
+    return {
+        "n_classes": n_classes,
+        "time": min(times),
+        "time_per_class": min(times) / n_classes,
+        "plain_time": min(plain_times),
+    }
+
+
+def bench_parse(n_params, repeat, number):
+    names, docstring = large_docstring(n_params)
+    namespace = {}
+    exec(f"def func({', '.join(names)}): ...", namespace)
+    func = namespace["func"]
+    func.__doc__ = docstring
+    cached_time = min(timeit.repeat(
+        lambda: NumpydocParser.doc_parameter_parser(docstring), number=number, repeat=repeat
+    )) / number
+    cache_size = NumpydocParser.cache_info().maxsize
+    # time the parsing itself, without the cache of parsed docstrings.
+    NumpydocParser.set_cache_size(0)
+    try:
+        parse_time = min(timeit.repeat(
+            lambda: NumpydocParser.doc_parameter_parser(docstring), number=number, repeat=repeat
+        )) / number
+        parameters_time = min(timeit.repeat(
+            lambda: NumpydocParser.parse_parameters(func), number=number, repeat=repeat
+        )) / number
+    finally:
+        NumpydocParser.set_cache_size(cache_size)
+    return {
+        "docstring_length": len(docstring),
+        "n_params": n_params,
+        "doc_parameter_parser_time": parse_time,
+        "cached_doc_parameter_parser_time": cached_time,
+        "parse_parameters_time": parameters_time,
+        "parse_parameters_per_second": 1 / parameters_time,
+        "megabytes_per_second": len(docstring) / parameters_time / 1e6,
+    }
+
+
+def bench_calls(n_kwargs, number):
+    return call_overhead(n_kwargs, number)
+
+
+def run(
+        depth=4, width=10, n_params=5, repeat=5, parse_params=200, call_kwargs=4, memory_classes=2000,
+        quick=False,
+):
+    """Run all of the benchmarks, and return the results as a dictionary."""
+    number = 10 if quick else 100
+    call_number = 1_000 if quick else 100_000
+    chain = chain_overhead(number=call_number // 5)
+    results = {
+        "class_creation": bench_class_creation(depth, width, n_params, repeat),
+        "class_creation_lazy": bench_class_creation(depth, width, n_params, repeat, {"lazy": True}),
+        "parse": bench_parse(parse_params, repeat, number),
+        "calls": bench_calls(call_kwargs, call_number),
+        "chain": chain,
+        "chain_per_level": {validate_calls: per_level(times) for validate_calls, times in chain.items()},
+        "memory": memory_usage(memory_classes, n_params=n_params),
+        "threads": thread_scaling(4 if quick else 16, (1, 2, 4), depth, width, n_params),
+    }
+    return {
+        "metadata": {
+            "docerator": getattr(docerator, "__version__", None),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "parameters": {
+            "depth": depth,
+            "width": width,
+            "n_params": n_params,
+            "repeat": repeat,
+            "parse_params": parse_params,
+            "call_kwargs": call_kwargs,
+            "memory_classes": memory_classes,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=inspect.cleandoc(__doc__).split("\n")[0])
+    parser.add_argument("--depth", type=int, default=4, help="depth of each synthetic class chain")
+    parser.add_argument("--width", type=int, default=10, help="number of synthetic class chains")
+    parser.add_argument("--params", type=int, default=5, help="parameters documented by each class")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats of each timing (the best is kept)")
+    parser.add_argument("--parse-params", type=int, default=200, help="parameters in the parsed docstring")
+    parser.add_argument("--call-kwargs", type=int, default=4, help="keyword arguments of the wrapped call")
+    parser.add_argument("--memory-classes", type=int, default=2000, help="classes in the memory benchmark")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for smoke testing")
+    parser.add_argument("--output", "-o", help="file to write the JSON results to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(
+        depth=args.depth, width=args.width, n_params=args.params, repeat=args.repeat,
+        parse_params=args.parse_params, call_kwargs=args.call_kwargs,
+        memory_classes=args.memory_classes, quick=args.quick,
+    )
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Generators of synthetic `DoceratorMeta` class hierarchies and docstrings for benchmarking."""
+import sys
+import types
+
+
+def _param_lines(names, indent):
+    lines = []
+    for name in names:
+        lines += [
+            f"{indent}{name} : int, optional",
+            f"{indent}    The description of {name}, which is long enough",
+            f"{indent}    to span a couple of lines.",
+        ]
+    return lines
+
+
+def hierarchy_source(depth=4, width=10, n_params=5, class_kwargs=None):
+    """Python source of a module with `width` chains of `depth` classes each.
+
+    The root of every chain uses `DoceratorMeta` and documents `n_params` parameters. Every
+    subclass adds `n_params` of its own, pulls in its parent's with ``%(super.*)``, and
+    overrides a method that pulls its parameters from the parent with ``%(super.x)``.
+
+    Parameters
+    ----------
+    depth, width, n_params : int
+    class_kwargs : dict, optional
+        Extra keyword arguments given to every class (e.g. ``{"lazy": True}``).
+
+    Returns
+    -------
+    str
+    """
+    extra = "".join(f", {key}={value!r}" for key, value in (class_kwargs or {}).items())
+    lines = ["import docerator", ""]
+    for w in range(width):
+        for d in range(depth):
+            params = [f"p{d}_{i}" for i in range(n_params)]
+            if d == 0:
+                bases = f"metaclass=docerator.DoceratorMeta{extra}"
+                init_args = ", ".join(params)
+            else:
+                bases = f"C{w}_{d - 1}{extra}"
+                init_args = ", ".join(params + ["**kwargs"])
+            lines += [
+                f"class C{w}_{d}({bases}):",
+                f'    """Class {d} of chain {w}.',
+                "",
+                "    Parameters",
+                "    ----------",
+                *_param_lines(params, "    "),
+            ]
+            if d > 0:
+                lines.append("    %(super.*)")
+            lines += [
+                '    """',
+                f"    def __init__(self, {init_args}): ...",
+                "",
+                "    def compute(self, x, y=None):",
+                '        """Compute something.',
+                "",
+                "        Parameters",
+                "        ----------",
+            ]
+            if d == 0:
+                lines += _param_lines(["x", "y"], "        ")
+            else:
+                lines += ["        %(super.x)", "        %(super.y)"]
+            lines += [
+                "",
+                "        Returns",
+                "        -------",
+                "        int",
+                '        """',
+                "",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def build_module(module_name, source):
+    """Execute `source` as a new module named `module_name`, registered in `sys.modules`."""
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+    exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+    return module
+
+
+def large_docstring(n_params=200):
+    """A numpydoc style docstring with `n_params` parameters and a few other sections."""
+    names = [f"param_{i}" for i in range(n_params)]
+    lines = [
+        "A summary line.",
+        "",
+        "An extended summary " * 20,
+        "",
+        "Parameters",
+        "----------",
+        *_param_lines(names[:n_params // 2], ""),
+        "",
+        "Returns",
+        "-------",
+        "out : int",
+        "    Something.",
+        "",
+        "Other Parameters",
+        "----------------",
+        *_param_lines(names[n_params // 2:], ""),
+        "",
+        "Notes",
+        "-----",
+        "Some notes. " * 50,
+    ]
+    return names, "\n".join(lines)
@@ -1,3 +1,8 @@
 from ._base import DoceratorParsingError, DocstringInheritWarning, get_debug_level, set_debug_level
+from ._disk_cache import disable_disk_cache, enable_disk_cache, flush_disk_cache
+from ._stats import disable_stats, enable_stats, reset_stats, stats
 
-from .doc_inherit import DoceratorMeta, bind_signature_to_function, doc_wrap
\ No newline at end of file
+from .doc_inherit import (
+    DoceratorMeta, bind_signature_to_function, disable_reloading, doc_wrap, enable_reloading, finalize, inherit,
+    reclaim, refresh,
+)
\ No newline at end of file
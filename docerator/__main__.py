@@ -0,0 +1,44 @@
+"""Command line interface of docerator.
+
+Usage::
+
+    python -m docerator freeze <package>
+    python -m docerator profile <package>
+"""
+import argparse
+import sys
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m docerator")
+    commands = parser.add_subparsers(dest="command", required=True)
+    freeze_parser = commands.add_parser(
+        "freeze",
+        help="Pre-render the docstrings and signatures of a package into a generated module.",
+    )
+    freeze_parser.add_argument("package", help="The importable name of a top level package.")
+    profile_parser = commands.add_parser(
+        "profile",
+        help="Report the import time docerator adds to each module and class of a package.",
+        add_help=False,
+    )
+    profile_parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    if args.command == "freeze":
+        from docerator._freeze import freeze
+
+        path, regenerated, failed = freeze(args.package)
+        for module_name in failed:
+            print(f"Unable to import {module_name}, it was not frozen.", file=sys.stderr)
+        print(f"Wrote {path} ({len(regenerated)} module(s) regenerated).")
+        return 1 if failed else 0
+    if args.command == "profile":
+        from docerator.profile import main as profile_main
+
+        return profile_main(args.args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
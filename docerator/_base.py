@@ -1,5 +1,11 @@
 
+import inspect
 import re
+import threading
+import types
+import weakref
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Optional
 
 REPLACE_REGEX: re.Pattern = re.compile(r"%\((?P<replace_key>.*)\)")
 REPLACE_ARG_SPLIT_REGEX: re.Pattern = re.compile(r"\s*,\s*")
@@ -19,4 +25,93 @@ def set_debug_level(level: int) -> int:
     return DEBUG_LEVEL
 
 def get_debug_level() -> int:
-    return DEBUG_LEVEL
\ No newline at end of file
+    return DEBUG_LEVEL
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _LRUCache:
+    """A bounded mapping that evicts its least recently used items.
+
+    It is safe to use from multiple threads, each cache has its own lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# Maps plain functions to the attributes their signature was computed from, and that signature.
+# It is only ever read and written one item at a time (which is atomic), and two threads computing
+# the same signature at once just store equal values, so it needs no lock.
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[types.FunctionType, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _signature_sources(func: types.FunctionType) -> tuple:
+    return func.__code__, func.__defaults__, func.__kwdefaults__, func.__annotations__
+
+
+def signature(func: Callable) -> inspect.Signature:
+    """A cached `inspect.signature`.
+
+    Signatures of plain functions are remembered until the function is garbage collected, or
+    until one of the attributes its signature is computed from is reassigned. An explicitly
+    set ``__signature__`` is always returned as is, so reassigning it is seen immediately.
+    Everything else (classes, methods, wrapped functions, ...) is passed on to `inspect.signature`.
+    """
+    if type(func) is not types.FunctionType:
+        return inspect.signature(func)
+    attrs = func.__dict__
+    sig = attrs.get("__signature__")
+    if isinstance(sig, inspect.Signature):
+        return sig
+    if sig is not None or "__wrapped__" in attrs:
+        # the signature depends on more than this function's own attributes.
+        return inspect.signature(func)
+    sources = _signature_sources(func)
+    cached = _SIGNATURE_CACHE.get(func)
+    if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+        return cached[1]
+    sig = inspect.signature(func)
+    _SIGNATURE_CACHE[func] = (sources, sig)
+    return sig
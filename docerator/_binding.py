@@ -0,0 +1,303 @@
+import functools
+import inspect
+import threading
+import weakref
+from typing import Callable, Optional
+
+_PREFIX = "_docerator_"
+
+# Argument binders are generated as python source. Every name that the generated code uses
+# internally is prefixed to avoid collisions with the parameter names of the signature.
+# A binder only depends on the parameters of a signature, so every signature with the same
+# parameters shares the same generated binder, and they are all executed in the same namespace.
+_BINDER_TEMPLATE = """\
+def {prefix}bind({parameters}):
+{body}
+    return {prefix}args, {prefix}kwargs
+"""
+
+
+class _Missing:
+    """Marks an argument that was not passed to a generated binder."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _can_generate(signature: inspect.Signature) -> bool:
+    for name, param in signature.parameters.items():
+        # positional only parameters are handled differently by `Signature.bind` and the interpreter
+        # when they are passed as keywords, so leave those to the generic binder.
+        if param.kind == inspect.Parameter.POSITIONAL_ONLY:
+            return False
+        if name.startswith(_PREFIX):
+            return False
+    return True
+
+
+def _shape(signature: inspect.Signature) -> tuple:
+    # The only things about a signature that the generated binder depends on.
+    return tuple(
+        (name, param.kind, param.default is not inspect.Parameter.empty)
+        for name, param in signature.parameters.items()
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _generated_binder(shape: tuple) -> Callable:
+    namespace = {}
+    exec(compile(_binder_source(shape), "<docerator binder>", "exec"), _NAMESPACE, namespace)
+    return namespace[f"{_PREFIX}bind"]
+
+
+def _indent(text: str, spaces: int) -> str:
+    return "\n".join(" " * spaces + line for line in text.split("\n"))
+
+
+def _binder_source(shape: tuple) -> str:
+    # Generates a function with the parameters of shape, that returns the arguments the same way
+    # that `inspect.BoundArguments.args` and `inspect.BoundArguments.kwargs` would.
+    # Defaults are replaced by a sentinel, because `Signature.bind` does not apply them.
+    P = inspect.Parameter
+    parameters = []
+    required = []
+    body = []
+    positional = True
+    star_added = False
+    for name, kind, has_default in shape:
+        if kind == P.POSITIONAL_OR_KEYWORD:
+            parameters.append(f"{name}={_PREFIX}missing" if has_default else name)
+            if not has_default:
+                # required positional arguments always come first.
+                required.append(name)
+            else:
+                if positional:
+                    positional = False
+                    body.append(f"{_PREFIX}positional = True")
+                body.extend([
+                    f"if {_PREFIX}positional and {name} is not {_PREFIX}missing:",
+                    f"    {_PREFIX}args.append({name})",
+                    "else:",
+                    f"    {_PREFIX}positional = False",
+                    f"    if {name} is not {_PREFIX}missing:",
+                    f"        {_PREFIX}kwargs[{name!r}] = {name}",
+                ])
+        elif kind == P.VAR_POSITIONAL:
+            star_added = True
+            parameters.append(f"*{name}")
+            body.append(f"{_PREFIX}args.extend({name})")
+        elif kind == P.KEYWORD_ONLY:
+            if not star_added:
+                star_added = True
+                parameters.append("*")
+            if has_default:
+                parameters.append(f"{name}={_PREFIX}missing")
+                body.extend([
+                    f"if {name} is not {_PREFIX}missing:",
+                    f"    {_PREFIX}kwargs[{name!r}] = {name}",
+                ])
+            else:
+                parameters.append(name)
+                body.append(f"{_PREFIX}kwargs[{name!r}] = {name}")
+        else:  # VAR_KEYWORD
+            parameters.append(f"**{name}")
+            body.append(f"{_PREFIX}kwargs.update({name})")
+
+    body = [f"{_PREFIX}args = [{', '.join(required)}]", f"{_PREFIX}kwargs = {{}}"] + body
+    return _BINDER_TEMPLATE.format(
+        prefix=_PREFIX,
+        parameters=", ".join(parameters),
+        body=_indent("\n".join(body), 4),
+    )
+
+
+def _bind_error(
+        signature: inspect.Signature, func: Callable, err: TypeError, args: tuple, kwargs: dict
+) -> TypeError:
+    # rebind with `Signature.bind` to produce its error message.
+    try:
+        signature.bind(*args, **kwargs)
+    except TypeError as bind_err:
+        err = bind_err
+    return TypeError(f"{func.__qualname__}(): {err}")
+
+
+class _LazyBinder:
+    """The binder of a wrapper until its binder is generated, on its first call.
+
+    Most wrapped functions are never called (or only called much later than their class is
+    created), so the binder is only generated when it is first needed. It then replaces this in
+    the wrapper's closure.
+    """
+
+    __slots__ = ("signature", "cell")
+
+    def __init__(self, signature: inspect.Signature) -> None:
+        self.signature = signature
+        self.cell = None
+
+    def __call__(self, /, *args, **kwargs) -> tuple:
+        bind = self.cell.cell_contents
+        if bind is self:
+            bind = self.cell.cell_contents = _generated_binder(_shape(self.signature))
+        return bind(*args, **kwargs)
+
+
+def _signature_binder(signature: inspect.Signature) -> Callable:
+    # The binder of the signatures that the generated binders do not handle.
+    def binder(*args, **kwargs):
+        params = signature.bind(*args, **kwargs)
+        return params.args, params.kwargs
+    return binder
+
+
+def _checked(bind: Callable, signature: inspect.Signature, func: Callable) -> Callable:
+    def bind_signature(*args, **kwargs):
+        try:
+            args, kwargs = bind(*args, **kwargs)
+        except TypeError as err:
+            raise _bind_error(signature, func, err, args, kwargs) from None
+        return func(*args, **kwargs)
+    return bind_signature
+
+
+def _checked_outermost(
+        bind: Callable, signature: inspect.Signature, func: Callable, calls: "_Calls", owner: str
+) -> Callable:
+    # A call whose first argument is already the first argument of a call in progress (to a
+    # wrapper of a method with the same name, in the same thread) goes straight to the wrapped
+    # method, if its class comes after that call's in the MRO of the first argument (as in a
+    # chain of ``super()`` calls).
+    def bind_signature(*args, **kwargs):
+        if args:
+            active = calls.active
+            receiver = id(args[0])
+            chain = active.get(receiver)
+            if chain is None:
+                active[receiver] = _chain(type(args[0]), owner)
+                try:
+                    try:
+                        args, kwargs = bind(*args, **kwargs)
+                    except TypeError as err:
+                        raise _bind_error(signature, func, err, args, kwargs) from None
+                    return func(*args, **kwargs)
+                finally:
+                    del active[receiver]
+            if chain[owner]:
+                return func(*args, **kwargs)
+        try:
+            args, kwargs = bind(*args, **kwargs)
+        except TypeError as err:
+            raise _bind_error(signature, func, err, args, kwargs) from None
+        return func(*args, **kwargs)
+    return bind_signature
+
+
+# Where the binder is in the closures of the wrappers.
+_CHECKED_BIND = _checked(None, None, None).__code__.co_freevars.index("bind")
+_CHECKED_OUTERMOST_BIND = _checked_outermost(None, None, None, None, None).__code__.co_freevars.index("bind")
+
+
+class _Calls(threading.local):
+    """The calls in progress in each thread: the chain of each call, by the id of its first argument."""
+
+    def __init__(self) -> None:
+        self.active: dict[int, _Chain] = {}
+
+
+# The calls in progress of the ``outermost`` wrappers, by the name of the method they wrap.
+_OUTERMOST: dict[str, _Calls] = {}
+
+
+def _outermost_calls(name: str) -> _Calls:
+    calls = _OUTERMOST.get(name)
+    if calls is None:
+        calls = _OUTERMOST.setdefault(name, _Calls())
+    return calls
+
+
+def _method_owner(func: Callable) -> Optional[str]:
+    # The qualified name of the class that defines func, or None if func is not a method.
+    owner = getattr(func, "__qualname__", "").rpartition(".")[0]
+    if not owner or owner.endswith("<locals>"):
+        return None
+    return owner
+
+
+class _Chain(dict):
+    """The classes after a class in an MRO: whether each qualified name is one of them, as they are looked up."""
+
+    __slots__ = ("_names",)
+
+    def __init__(self, names: list[str]) -> None:
+        super().__init__()
+        self._names = names
+
+    def __missing__(self, name: str) -> bool:
+        found = self[name] = name in self._names
+        return found
+
+
+# The chain of each class that starts at each class of its MRO, by qualified name.
+_CHAINS: "weakref.WeakKeyDictionary[type, dict[str, _Chain]]" = weakref.WeakKeyDictionary()
+
+
+def _chain(cls: type, owner: str) -> _Chain:
+    # The chain of the calls to the methods of cls, that starts at a method of the class named `owner`.
+    chains = _CHAINS.get(cls)
+    if chains is None:
+        chains = _CHAINS.setdefault(cls, {})
+    chain = chains.get(owner)
+    if chain is None:
+        names = [base.__qualname__ for base in cls.__mro__]
+        chain = chains[owner] = _Chain(names[names.index(owner):] if owner in names else [])
+    return chain
+
+
+# The namespace that every generated binder is executed in.
+_NAMESPACE = {f"{_PREFIX}missing": _MISSING}
+
+
+def make_binder(
+        signature: inspect.Signature, func: Callable, outermost: bool = False
+) -> tuple[Callable, Callable]:
+    """Create an argument binder and a validating wrapper of func for signature.
+
+    Parameters
+    ----------
+    signature : inspect.Signature
+        The signature to validate arguments against.
+    func : callable
+        The function to call with the bound arguments.
+    outermost : bool, optional
+        If ``True`` and `func` is a method, the wrapper only checks the outermost of a chain of
+        ``super()`` calls with the same first argument (to wrappers of methods with the same name
+        as `func`, of the classes after the outermost one's in the first argument's MRO, in the
+        same thread), such as a chain of ``super().__init__(**kwargs)`` calls. The inner ones call
+        `func` directly. Functions that are not methods check every call.
+
+    Returns
+    -------
+    binder : callable
+        Called as ``binder(*args, **kwargs)``, returns the ``(args, kwargs)`` to pass on to `func`.
+        Raises a `TypeError` if the arguments do not match `signature`.
+    bind_signature : callable
+        Calls `func` with the bound arguments. Raises a `TypeError`, with the same message as
+        `inspect.Signature.bind` would give, if the arguments do not match `signature`.
+    """
+    owner = _method_owner(func) if outermost else None
+    binder = _LazyBinder(signature) if _can_generate(signature) else _signature_binder(signature)
+    if owner is not None:
+        bind_signature = _checked_outermost(binder, signature, func, _outermost_calls(func.__name__), owner)
+        index = _CHECKED_OUTERMOST_BIND
+    else:
+        bind_signature = _checked(binder, signature, func)
+        index = _CHECKED_BIND
+    if type(binder) is _LazyBinder:
+        binder.cell = bind_signature.__closure__[index]
+    return binder, bind_signature
@@ -0,0 +1,287 @@
+"""A persistent cache of parsed parameter tables and resolved docstrings.
+
+Similar to ``__pycache__``, each module that defines classes using `DoceratorMeta` gets a cache
+file, which by default lives in the ``__pycache__`` directory next to the module's source file.
+The file is keyed by a hash of the module's source and the version of docerator that wrote it, and
+stores, for every class in the module (and docstring style):
+
+* ``digest`` : a hash of the docstring templates the entry was built from (the class's own, its
+  ancestors', and those of any ``%(module.Class.arg)`` targets), as docstrings can be built at
+  runtime from other modules.
+* ``tables`` : the parameter table of each member, as returned by
+  `ParameterParser.doc_parameter_parser`.
+* ``docs`` : the resolved docstring of each member.
+* ``depends`` : the source hashes of the modules the resolved docstrings were built from
+  (the modules of the class's ancestors and of any ``%(module.Class.arg)`` targets).
+
+An entry is discarded when its digest changes, and resolved docstrings are only used if none of
+the modules they depend on have changed either.
+"""
+import atexit
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+from typing import Callable, Iterable, Optional
+
+_ENABLED: bool = False
+_DIRECTORY: Optional[str] = None
+_MODULE_CACHES: dict = {}
+# Only held while reading the cache file of a module.
+_MODULE_CACHES_LOCK = threading.Lock()
+_SOURCE_HASHES: dict = {}
+_FINGERPRINT: Optional[str] = None
+
+
+def enable_disk_cache(directory: Optional[str] = None) -> None:
+    """Enable the persistent cache of parsed docstrings.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory to store the cache files in. By default, they are stored in the
+        ``__pycache__`` directory next to each module's source file.
+
+    Notes
+    -----
+    The cache can also be enabled by setting the ``DOCERATOR_CACHE`` environment variable before
+    importing docerator, to either ``1`` or the directory to store the cache files in.
+
+    Updated cache files are written when the interpreter exits, or when `flush_disk_cache` is called.
+    """
+    global _ENABLED, _DIRECTORY
+    if directory is not None:
+        directory = os.fspath(directory)
+    if directory != _DIRECTORY:
+        flush_disk_cache()
+        _MODULE_CACHES.clear()
+    _DIRECTORY = directory
+    _ENABLED = True
+
+
+def disable_disk_cache() -> None:
+    """Disable the persistent cache of parsed docstrings, writing any pending updates."""
+    global _ENABLED
+    flush_disk_cache()
+    _MODULE_CACHES.clear()
+    _ENABLED = False
+
+
+def flush_disk_cache() -> None:
+    """Write all updated cache entries to disk."""
+    for module_cache in list(_MODULE_CACHES.values()):
+        module_cache.write()
+
+
+def docerator_fingerprint() -> str:
+    """The version of docerator, used to invalidate caches written by other versions."""
+    global _FINGERPRINT
+    if _FINGERPRINT is None:
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+            try:
+                _FINGERPRINT = version("docerator")
+            except PackageNotFoundError:
+                _FINGERPRINT = None
+        except ImportError:
+            _FINGERPRINT = None
+        if _FINGERPRINT is None:
+            # Not installed, so fall back to the contents of docerator itself.
+            hasher = hashlib.sha256()
+            root = os.path.dirname(__file__)
+            for directory, dirs, files in sorted(os.walk(root)):
+                dirs.sort()
+                for file in sorted(files):
+                    if file.endswith(".py"):
+                        with open(os.path.join(directory, file), "rb") as f:
+                            hasher.update(f.read())
+            _FINGERPRINT = f"src-{hasher.hexdigest()[:16]}"
+    return _FINGERPRINT
+
+
+def _module_source_path(module_name: str) -> Optional[str]:
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if path is None or not path.endswith(".py"):
+        return None
+    return path
+
+
+def module_source_hash(module_name: str) -> Optional[str]:
+    """Hash of the source file of a module, or None if it does not have one.
+
+    Hashes are remembered as long as the file's modification time and size do not change.
+    """
+    path = _module_source_path(module_name)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _SOURCE_HASHES.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, "rb") as f:
+            source_hash = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    _SOURCE_HASHES[path] = (key, source_hash)
+    return source_hash
+
+
+class _CacheEntry:
+    """The cached data of one class (and docstring style) in a module."""
+
+    def __init__(self, module_cache: "_ModuleCache", data: dict) -> None:
+        self._module_cache = module_cache
+        self.tables: dict = data.setdefault("tables", {})
+        self.docs: dict = data.setdefault("docs", {})
+        self.depends: dict = data.setdefault("depends", {})
+        self._docs_valid: Optional[bool] = None
+
+    def store_table(self, name: str, table: dict) -> None:
+        with self._module_cache.lock:
+            self.tables[name] = table
+            self._module_cache.dirty = True
+
+    def resolved_doc(self, name: str) -> Optional[str]:
+        if self._docs_valid is None:
+            with self._module_cache.lock:
+                docs_valid = all(
+                    module_source_hash(module) == source_hash
+                    for module, source_hash in self.depends.items()
+                )
+                if not docs_valid:
+                    self.docs.clear()
+                    self.depends.clear()
+                    self._module_cache.dirty = True
+                self._docs_valid = True
+        return self.docs.get(name)
+
+    def resolved_signature(self, name: str, func: Callable) -> Optional[inspect.Signature]:
+        # Signatures can hold arbitrary objects, so they are not stored.
+        return None
+
+    def store_doc(self, name: str, doc: str, depends: Iterable[str], func: Optional[Callable] = None) -> None:
+        source_hashes = {}
+        for module in depends:
+            source_hash = module_source_hash(module)
+            if source_hash is None:
+                # can't tell if this docstring would ever be out of date.
+                return
+            source_hashes[module] = source_hash
+        with self._module_cache.lock:
+            self.depends.update(source_hashes)
+            self.docs[name] = doc
+            self._module_cache.dirty = True
+
+
+class _ModuleCache:
+    """The cache file of one module.
+
+    Its lock guards every update of its entries, as classes of the module can be created (or
+    resolved) by several threads at once.
+    """
+
+    def __init__(self, module_name: str, path: str, source_hash: str) -> None:
+        self.module_name = module_name
+        self.source_hash = source_hash
+        self.dirty = False
+        self.lock = threading.Lock()
+        if _DIRECTORY is None:
+            directory = os.path.join(os.path.dirname(path), "__pycache__")
+            stem = os.path.splitext(os.path.basename(path))[0]
+        else:
+            directory = _DIRECTORY
+            stem = module_name
+        self.cache_path = os.path.join(directory, f"{stem}.docerator-{docerator_fingerprint()}.json")
+        self.classes = self._read()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict) or
+            data.get("docerator") != docerator_fingerprint() or
+            data.get("source_hash") != self.source_hash
+        ):
+            return {}
+        return data.get("classes", {})
+
+    def entry(self, qualname: str, doc_style: str, digest: str) -> _CacheEntry:
+        with self.lock:
+            data = self.classes.setdefault(f"{qualname}:{doc_style}", {})
+            if data.get("digest") != digest:
+                # its templates changed since it was stored.
+                data.clear()
+                data["digest"] = digest
+                self.dirty = True
+            return _CacheEntry(self, data)
+
+    def write(self) -> None:
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {
+                "docerator": docerator_fingerprint(),
+                "module": self.module_name,
+                "source_hash": self.source_hash,
+                "classes": self.classes,
+            }
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.cache_path)
+            except OSError:
+                # Just like __pycache__, failing to write the cache is not an error.
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            self.dirty = False
+
+
+def lookup(
+        module_name: Optional[str], qualname: str, doc_style: str, digest: Callable[[], Optional[str]]
+) -> Optional[_CacheEntry]:
+    """Get the cache entry of a class, or None if the cache is disabled or unavailable for it.
+
+    `digest` returns the hash of the docstring templates of the class, or None if it can not be
+    known, in which case the class is not cached.
+    """
+    if not _ENABLED or module_name is None:
+        return None
+    path = _module_source_path(module_name)
+    if path is None:
+        return None
+    source_hash = module_source_hash(module_name)
+    if source_hash is None:
+        return None
+    template_digest = digest()
+    if template_digest is None:
+        return None
+    module_cache = _MODULE_CACHES.get(module_name)
+    if module_cache is None or module_cache.source_hash != source_hash:
+        with _MODULE_CACHES_LOCK:
+            # another thread may have read it in the meantime.
+            module_cache = _MODULE_CACHES.get(module_name)
+            if module_cache is None or module_cache.source_hash != source_hash:
+                module_cache = _ModuleCache(module_name, path, source_hash)
+                _MODULE_CACHES[module_name] = module_cache
+    return module_cache.entry(qualname, doc_style, template_digest)
+
+
+atexit.register(flush_disk_cache)
+
+if _cache_setting := os.environ.get("DOCERATOR_CACHE"):
+    enable_disk_cache(None if _cache_setting == "1" else _cache_setting)
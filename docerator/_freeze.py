@@ -0,0 +1,469 @@
+"""Ahead of time rendering of the docstrings and signatures of a package.
+
+``python -m docerator freeze <package>`` imports every module of a package once, and writes the
+parameter tables, resolved docstrings and new signatures of every class (and function wrapped with
+`doc_wrap`) into a generated module, ``<package>/_docerator_frozen.py``. When that module exists,
+`DoceratorMeta` and `doc_wrap` use it instead of parsing docstrings and performing replacements.
+
+Under ``python -OO`` docstrings are stripped, so nothing is parsed or replaced at all, and the
+frozen signatures are the only ones applied.
+
+Each module's entry is only used if the source of that module, and of every module its docstrings
+were built from, is unchanged since it was frozen. Each class (or function) is also only used if
+its docstring templates, and those of the classes and targets it was built from, are unchanged,
+as docstrings can be built at runtime from other modules. Running the freeze command again only
+regenerates the entries of modules (and classes) that changed.
+
+Signatures can only be frozen if their defaults and annotations are literals, objects (or enum
+members) importable by their qualified name, or the defaults and annotations of the function being
+wrapped. Members with any other signature fall back to the normal replacement, using their frozen
+docstring.
+"""
+import enum
+import importlib
+import inspect
+import os
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+from docerator._base import signature as _signature
+from docerator._disk_cache import docerator_fingerprint, module_source_hash
+from docerator._params import DescribedParameter
+
+ARTIFACT_NAME = "_docerator_frozen"
+
+_ENABLED: bool = os.environ.get("DOCERATOR_FROZEN", "1") != "0"
+# The frozen modules of each top level package (or None if it has no artifact).
+_ARTIFACTS: dict[str, Optional[dict]] = {}
+# Whether the frozen entry of each module is up to date.
+_VALID: dict[str, bool] = {}
+# Frozen modules supplied at runtime (e.g. by `docerator.sphinx`), used instead of an artifact.
+_SUPPLIED: dict[str, dict] = {}
+# The entries recorded for each module while freezing a package.
+_RECORDING: Optional[dict[str, "_ModuleRecord"]] = None
+# The modules whose recorded entries changed since `recorded` last returned them.
+_CHANGED: set[str] = set()
+
+
+class _Unfreezable(Exception):
+    pass
+
+
+def _encode_value(value: Any, own_value: Any) -> tuple:
+    # (only needed while freezing, so not imported with docerator)
+    import ast
+
+    try:
+        literal = ast.literal_eval(repr(value))
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        pass
+    else:
+        if type(literal) is type(value) and literal == value:
+            return ("value", value)
+    if value is own_value:
+        return ("own", )
+    if isinstance(value, enum.Enum):
+        module, qualname = type(value).__module__, f"{type(value).__qualname__}.{value.name}"
+    else:
+        module, qualname = getattr(value, "__module__", None), getattr(value, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str) and "<" not in qualname:
+        try:
+            if _lookup(module, qualname) is value:
+                return ("ref", module, qualname)
+        except (ImportError, AttributeError):
+            pass
+    raise _Unfreezable(value)
+
+
+def _lookup(module: str, qualname: str) -> Any:
+    target = importlib.import_module(module)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    return target
+
+
+def _decode_value(encoded: tuple, own_value: Callable[[], Any]) -> Any:
+    if encoded[0] == "value":
+        return encoded[1]
+    if encoded[0] == "own":
+        return own_value()
+    return _lookup(encoded[1], encoded[2])
+
+
+def encode_signature(signature: inspect.Signature, func: Callable) -> Optional[dict]:
+    """Encode the new `signature` of `func` as literals, or None if it is not possible."""
+    own_parameters = _signature(func).parameters
+    parameters = []
+    try:
+        for param in signature.parameters.values():
+            own = own_parameters.get(param.name)
+            encoded = {"name": param.name, "kind": int(param.kind)}
+            if param.default is not inspect.Parameter.empty:
+                encoded["default"] = _encode_value(param.default, getattr(own, "default", None))
+            if param.annotation is not inspect.Parameter.empty:
+                encoded["annotation"] = _encode_value(param.annotation, getattr(own, "annotation", None))
+            if isinstance(param, DescribedParameter):
+                encoded["type_description"] = param.type_description
+                encoded["long_description"] = param.long_description
+            parameters.append(encoded)
+        encoded = {"parameters": parameters}
+        if signature.return_annotation is not inspect.Signature.empty:
+            own_return = _signature(func).return_annotation
+            encoded["return_annotation"] = _encode_value(signature.return_annotation, own_return)
+    except _Unfreezable:
+        return None
+    return encoded
+
+
+def decode_signature(encoded: dict, func: Callable) -> inspect.Signature:
+    """Rebuild a signature encoded by `encode_signature` for the same `func`."""
+    own_parameters = None
+
+    def own(name, attribute):
+        nonlocal own_parameters
+        if own_parameters is None:
+            own_parameters = _signature(func).parameters
+        return getattr(own_parameters[name], attribute)
+
+    parameters = []
+    for param in encoded["parameters"]:
+        name = param["name"]
+        kwargs = {}
+        for attribute in ["default", "annotation"]:
+            if attribute in param:
+                kwargs[attribute] = _decode_value(param[attribute], lambda: own(name, attribute))
+        if "type_description" in param:
+            parameters.append(DescribedParameter(
+                name, param["kind"], type_description=param["type_description"],
+                long_description=param["long_description"], **kwargs
+            ))
+        else:
+            parameters.append(inspect.Parameter(name, param["kind"], **kwargs))
+    return_annotation = inspect.Signature.empty
+    if "return_annotation" in encoded:
+        return_annotation = _decode_value(
+            encoded["return_annotation"], lambda: _signature(func).return_annotation
+        )
+    return inspect.Signature(parameters, return_annotation=return_annotation)
+
+
+class _FrozenEntry:
+    """The frozen data of one class (and docstring style), or of one function.
+
+    This has the same interface as the entries of the persistent cache in `docerator._disk_cache`.
+    """
+
+    def __init__(self, data: dict) -> None:
+        self.tables: dict = data.setdefault("tables", {})
+        self.docs: dict = data.setdefault("docs", {})
+        self.signatures: dict = data.setdefault("signatures", {})
+
+    def store_table(self, name: str, table: dict) -> None:
+        pass
+
+    def resolved_doc(self, name: str) -> Optional[str]:
+        return self.docs.get(name)
+
+    def resolved_signature(self, name: str, func: Callable) -> Optional[inspect.Signature]:
+        encoded = self.signatures.get(name)
+        if encoded is None:
+            return None
+        try:
+            return decode_signature(encoded, func)
+        except (ImportError, AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    def store_doc(self, name: str, doc: str, depends, func: Optional[Callable] = None) -> None:
+        pass
+
+
+class _RecordingEntry(_FrozenEntry):
+    """A class (or function) of a module that is being frozen."""
+
+    def __init__(self, record: "_ModuleRecord", data: dict) -> None:
+        super().__init__(data)
+        self._record = record
+
+    def store_table(self, name: str, table: dict) -> None:
+        self.tables[name] = table
+        _CHANGED.add(self._record.module_name)
+
+    def resolved_doc(self, name: str) -> Optional[str]:
+        return None
+
+    def store_doc(self, name: str, doc: str, depends, func: Optional[Callable] = None) -> None:
+        self.docs[name] = doc
+        _CHANGED.add(self._record.module_name)
+        with self._record.lock:
+            self._record.depends.update(depends)
+        wrapped = getattr(func, "__wrapped__", None)
+        if wrapped is not None:
+            encoded = encode_signature(_signature(func), wrapped)
+            if encoded is not None:
+                self.signatures[name] = encoded
+
+
+class _ModuleRecord:
+    """Everything recorded for one module while freezing a package."""
+
+    def __init__(self, module_name: str) -> None:
+        self.module_name = module_name
+        self.depends: set[str] = set()
+        self.entries: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def entry(self, key: str, digest: str) -> _RecordingEntry:
+        data = self.entries.setdefault(key, {})
+        data["digest"] = digest
+        _CHANGED.add(self.module_name)
+        return _RecordingEntry(self, data)
+
+    def frozen(self) -> Optional[dict]:
+        source_hash = module_source_hash(self.module_name)
+        if source_hash is None:
+            return None
+        with self.lock:
+            recorded_depends = set(self.depends)
+            entries = dict(self.entries)
+        previous = _module_data(self.module_name)
+        if previous is not None and _is_valid(self.module_name, previous):
+            # only some of its classes were out of date, keep the others.
+            recorded_depends.update(previous["depends"])
+            entries = {**previous["entries"], **entries}
+        modules = sorted(recorded_depends - {self.module_name})
+        depends = {}
+        for module in modules:
+            depends[module] = module_source_hash(module)
+            if depends[module] is None:
+                # can't tell if this module's entry would ever be out of date.
+                return None
+        return {"source_hash": source_hash, "depends": depends, "entries": entries}
+
+
+def _artifact(module_name: str) -> Optional[dict]:
+    # The frozen modules of the package that module_name is in.
+    package_name = module_name.partition(".")[0]
+    if package_name in _ARTIFACTS:
+        return _ARTIFACTS[package_name]
+    modules = None
+    paths = getattr(sys.modules.get(package_name), "__path__", None) or []
+    if any(os.path.exists(os.path.join(path, f"{ARTIFACT_NAME}.py")) for path in paths):
+        try:
+            artifact = importlib.import_module(f"{package_name}.{ARTIFACT_NAME}")
+        except Exception:
+            artifact = None
+        if getattr(artifact, "DOCERATOR", None) == docerator_fingerprint():
+            modules = artifact.MODULES
+    _ARTIFACTS[package_name] = modules
+    return modules
+
+
+def _dependency_hash(module_name: str) -> Optional[str]:
+    if module_name not in sys.modules:
+        # Resolving the replacements would import it anyways.
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            return None
+    return module_source_hash(module_name)
+
+
+def _is_valid(module_name: str, module_data: dict) -> bool:
+    valid = _VALID.get(module_name)
+    if valid is None:
+        valid = module_source_hash(module_name) == module_data["source_hash"] and all(
+            _dependency_hash(module) == source_hash for module, source_hash in module_data["depends"].items()
+        )
+        _VALID[module_name] = valid
+    return valid
+
+
+def _module_data(module_name: str) -> Optional[dict]:
+    # The supplied (or else generated) frozen entry of a module.
+    module_data = _SUPPLIED.get(module_name)
+    if module_data is None:
+        modules = _artifact(module_name)
+        module_data = None if modules is None else modules.get(module_name)
+    return module_data
+
+
+def in_use(module_name: Optional[str]) -> bool:
+    """Whether frozen entries may be looked up (or recorded) for the classes of a module."""
+    if not _ENABLED or module_name is None:
+        return False
+    return _RECORDING is not None or bool(_SUPPLIED) or _artifact(module_name) is not None
+
+
+def lookup(
+        module_name: Optional[str],
+        qualname: str,
+        doc_style: str,
+        digest: Optional[Callable[[], Optional[str]]] = None,
+) -> Optional[_FrozenEntry]:
+    """Get the frozen entry of a class (or function), or None if it was not frozen.
+
+    `digest` returns the hash of the docstring templates of the class, or None if it can not be
+    known. The frozen entry is only used if it was frozen with the same hash. Without `digest`
+    (under ``python -OO``, where there are no docstrings), it is not checked.
+
+    While freezing a package, this returns an entry that records the class instead, if its frozen
+    entry is out of date.
+    """
+    if not _ENABLED or module_name is None or "<" in qualname:
+        return None
+    key = f"{qualname}:{doc_style}"
+    template_digest = None
+    module_data = _module_data(module_name)
+    if module_data is not None and _is_valid(module_name, module_data):
+        data = module_data["entries"].get(key)
+        if data is None:
+            return None
+        if digest is None:
+            return _FrozenEntry(data)
+        template_digest = digest()
+        if template_digest is not None and data.get("digest") == template_digest:
+            return _FrozenEntry(data)
+    if _RECORDING is not None and digest is not None:
+        if template_digest is None:
+            template_digest = digest()
+        if template_digest is None:
+            # can't tell if this entry would ever be out of date.
+            return None
+        record = _RECORDING.get(module_name)
+        if record is None:
+            record = _RECORDING.setdefault(module_name, _ModuleRecord(module_name))
+        return record.entry(key, template_digest)
+    return None
+
+
+def supply(modules: dict[str, dict]) -> None:
+    """Use already frozen modules, as returned by `recorded`, before any generated artifact."""
+    _SUPPLIED.update(modules)
+    for module_name in modules:
+        _VALID.pop(module_name, None)
+
+
+def start_recording() -> None:
+    """Record every class (and function) whose module does not have an up to date frozen entry."""
+    global _RECORDING
+    if _RECORDING is None:
+        _RECORDING = {}
+        _CHANGED.clear()
+
+
+def recorded(changed_only: bool = False) -> dict[str, dict]:
+    """The frozen data of every module recorded since `start_recording`.
+
+    If `changed_only`, only of the modules whose entries changed since this last returned them.
+    """
+    modules = {}
+    records = _RECORDING or {}
+    if changed_only:
+        changed = set()
+        while _CHANGED:
+            changed.add(_CHANGED.pop())
+        records = {module_name: records[module_name] for module_name in changed if module_name in records}
+    else:
+        _CHANGED.clear()
+    for module_name, record in list(records.items()):
+        module_data = record.frozen()
+        if module_data is not None:
+            modules[module_name] = module_data
+    return modules
+
+
+def stop_recording() -> None:
+    """Stop recording, and forget about all supplied modules."""
+    global _RECORDING
+    _RECORDING = None
+    _CHANGED.clear()
+    for module_name in _SUPPLIED:
+        _VALID.pop(module_name, None)
+    _SUPPLIED.clear()
+
+
+def dependencies(module_name: str) -> set[str]:
+    """The other modules that the frozen (or recorded) entries of a module were built from."""
+    record = None if _RECORDING is None else _RECORDING.get(module_name)
+    if record is not None:
+        with record.lock:
+            return record.depends - {module_name}
+    module_data = _module_data(module_name)
+    return set() if module_data is None else set(module_data["depends"])
+
+
+def freeze(package_name: str) -> tuple[str, list[str], list[str]]:
+    """Freeze the docstrings and signatures of every module in a package.
+
+    Parameters
+    ----------
+    package_name : str
+        The importable name of a top level package.
+
+    Returns
+    -------
+    path : str
+        The path of the generated module.
+    regenerated : list of str
+        The modules whose entries were regenerated.
+    failed : list of str
+        The modules that could not be imported.
+    """
+    import pkgutil
+    import pprint
+
+    global _RECORDING
+    if "." in package_name:
+        raise ValueError(f"{package_name} is not a top level package")
+    if sys.flags.optimize >= 2:
+        raise RuntimeError("Can not freeze a package under python -OO, its docstrings are stripped.")
+    _RECORDING = {}
+    failed = []
+    try:
+        package = importlib.import_module(package_name)
+        if not hasattr(package, "__path__"):
+            raise ValueError(f"{package_name} is not a package")
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package_name}.", failed.append):
+            if module_info.name == f"{package_name}.{ARTIFACT_NAME}":
+                continue
+            try:
+                importlib.import_module(module_info.name)
+            except Exception:
+                failed.append(module_info.name)
+        recording = _RECORDING
+    finally:
+        _RECORDING = None
+
+    old_modules = _artifact(package_name) or {}
+    modules = {
+        module_name: module_data for module_name, module_data in old_modules.items()
+        if module_name in sys.modules and _is_valid(module_name, module_data)
+    }
+    regenerated = []
+    for module_name, record in recording.items():
+        if module_name != package_name and not module_name.startswith(f"{package_name}."):
+            continue
+        module_data = record.frozen()
+        if module_data is not None:
+            modules[module_name] = module_data
+            regenerated.append(module_name)
+
+    path = os.path.join(next(iter(package.__path__)), f"{ARTIFACT_NAME}.py")
+    contents = (
+        f"# Generated by `python -m docerator freeze {package_name}`, do not edit.\n"
+        f"DOCERATOR = {docerator_fingerprint()!r}\n"
+        f"MODULES = {pprint.pformat(dict(sorted(modules.items())), width=120, sort_dicts=False)}\n"
+    )
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(contents)
+    os.replace(tmp_path, path)
+
+    # use the new artifact from now on.
+    _ARTIFACTS.pop(package_name, None)
+    sys.modules.pop(f"{package_name}.{ARTIFACT_NAME}", None)
+    for module_name in modules:
+        _VALID.pop(module_name, None)
+    importlib.invalidate_caches()
+    return path, sorted(regenerated), failed
@@ -1,5 +1,6 @@
 from __future__ import annotations  # used for lookahead returns
 import inspect
+import re
 import textwrap
 from typing import Optional
 
@@ -9,9 +10,54 @@ class _void():
 # note that there are custom types to describe empty defaults and annotations
 # because None is a perfectly valid thing to be there.
 
+_ParameterKind = type(inspect.Parameter.POSITIONAL_ONLY)
+_VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+# A line that textwrap.dedent would change, even if nothing else needs dedenting.
+_WHITESPACE_LINE_REGEX = re.compile(r"^[ \t]+$", re.MULTILINE)
+# The one copy of each description that is kept, see `_shared`. `docerator.reclaim` empties it.
+_DESCRIPTIONS: dict[str, str] = {}
+# Beyond this many descriptions, the copies are forgotten and collected again from scratch.
+_MAX_DESCRIPTIONS = 1 << 16
+
+
+def _shared(description: str) -> str:
+    # The same descriptions are shared by many parameters (e.g. ``a, b : int``, or the same
+    # parameter inherited by many classes), so only keep one copy of each. (Not with `sys.intern`,
+    # which would keep every description alive for good on python 3.12 and later.)
+    shared = _DESCRIPTIONS.get(description)
+    if shared is None:
+        if len(_DESCRIPTIONS) >= _MAX_DESCRIPTIONS:
+            _DESCRIPTIONS.clear()
+        shared = _DESCRIPTIONS.setdefault(description, description)
+    return shared
+
+
+def _clean_type_description(type_description: Optional[str]) -> Optional[str]:
+    if type_description is None:
+        return None
+    if not isinstance(type_description, str):
+        raise TypeError(
+            f"type_description must be a str, not a {type(type_description).__name__}"
+        )
+    return _shared(type_description)
+
+
+def _clean_long_description(long_description: Optional[str]) -> Optional[str]:
+    if long_description is None:
+        return None
+    if not isinstance(long_description, str):
+        raise TypeError(
+            f"long_description must be a str, not a {type(long_description).__name__}"
+        )
+    if long_description[:1] in (" ", "\t", "\n") or _WHITESPACE_LINE_REGEX.search(long_description):
+        long_description = textwrap.dedent(long_description)
+    return _shared(long_description)
+
+
 class DescribedParameter(inspect.Parameter):
 
-    __slots__ = inspect.Parameter.__slots__ + ('_type_description', '_long_description')
+    # (inspect.Parameter's own slots are inherited)
+    __slots__ = ('_type_description', '_long_description', '_hash', '_formatted')
 
     def __init__(
             self,
@@ -25,18 +71,11 @@ class DescribedParameter(inspect.Parameter):
 
     ) -> None:
         super().__init__(name, kind, default=default, annotation=annotation)
-        if type_description is not None and not isinstance(type_description, str):
-            TypeError(
-                f"type_description must be a str, not a {type(type_description).__name__}"
-            )
-        self._type_description = type_description
-        if long_description is not None:
-            if not isinstance(long_description, str):
-                TypeError(
-                    f"type_description must be a str, not a {type(type_description).__name__}"
-                )
-            long_description = textwrap.dedent(long_description)
-        self._long_description = long_description
+        self._type_description = _clean_type_description(type_description)
+        self._long_description = _clean_long_description(long_description)
+        self._hash = None
+        # the text each parser formatted this parameter as (see `ParameterParser.format_parameter`).
+        self._formatted = None
 
     @property
     def type_description(self) -> Optional[str]:
@@ -69,11 +108,33 @@ class DescribedParameter(inspect.Parameter):
         if long_description is _void:
             long_description = self._long_description
 
-        return type(self)(
-            name, kind, default=default, annotation=annotation,
-            type_description=type_description,
-            long_description=long_description,
-        )
+        if name != self._name or (default is not inspect.Parameter.empty and kind in _VAR_KINDS):
+            # These could be invalid, so let `inspect.Parameter` check them.
+            return type(self)(
+                name, kind, default=default, annotation=annotation,
+                type_description=type_description,
+                long_description=long_description,
+            )
+
+        # Otherwise everything was already checked when this parameter was created.
+        new = object.__new__(type(self))
+        new._name = name
+        new._kind = _ParameterKind(kind)
+        new._default = default
+        new._annotation = annotation
+        if type_description is not self._type_description:
+            type_description = _clean_type_description(type_description)
+        new._type_description = type_description
+        if long_description is not self._long_description:
+            long_description = _clean_long_description(long_description)
+        new._long_description = long_description
+        new._hash = None
+        # the formatted text only depends on the name and descriptions.
+        if type_description is self._type_description and long_description is self._long_description:
+            new._formatted = self._formatted
+        else:
+            new._formatted = None
+        return new
 
     def __str__(self) -> str:
         formatted = super().__str__()
@@ -84,11 +145,15 @@ class DescribedParameter(inspect.Parameter):
         return formatted
 
     def __hash__(self) -> int:
-        hashed = super().__hash__()
-        if self._type_description is not None:
-            hashed = hash((hashed, self._type_description))
-        if self._long_description is not None:
-            hashed = hash((hashed, self._long_description))
+        # Parameters are immutable, so only compute this once.
+        hashed = self._hash
+        if hashed is None:
+            hashed = super().__hash__()
+            if self._type_description is not None:
+                hashed = hash((hashed, self._type_description))
+            if self._long_description is not None:
+                hashed = hash((hashed, self._long_description))
+            self._hash = hashed
         return hashed
 
     def __eq__(self, other) -> bool:
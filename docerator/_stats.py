@@ -0,0 +1,130 @@
+"""Opt-in instrumentation of the work docerator does for each class and function.
+
+When enabled, docerator records how many times, and for how long, it runs each phase of its
+processing, broken down by the class (or function) it was working on. The phases are:
+
+* ``"total"`` : all of the processing of a class in `DoceratorMeta.__new__` (and of its deferred
+  replacements when it is ``lazy``), or of a function wrapped with `doc_wrap`.
+* ``"parse"`` : parsing docstrings into parameter dictionaries.
+* ``"mro_merge"`` : merging the parameter dictionaries of the class's parents for ``super`` keys.
+* ``"target_import"`` : importing the targets of ``%(module.Class.arg)`` keys.
+* ``"replace"`` : formatting parameters and substituting them into the docstring.
+* ``"signature"`` : building the new signature, and binding it to the function.
+
+When disabled (the default), each phase only costs a check of a module level flag.
+"""
+import os
+import threading
+import time
+from typing import Any
+
+_ENABLED: bool = False
+_STATS: dict[str, dict[str, list]] = {}
+# Guards the updates of _STATS, which are only made while recording.
+_LOCK = threading.Lock()
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("key", "name", "start")
+
+    def __init__(self, key: str, name: str) -> None:
+        self.key = key
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        with _LOCK:
+            record = _STATS.setdefault(self.key, {}).setdefault(self.name, [0, 0.0])
+            record[0] += 1
+            record[1] += elapsed
+        return False
+
+
+def stats_key(owner: Any) -> str:
+    """The key that the statistics of a class or function are stored under."""
+    return f"{getattr(owner, '__module__', None)}:{getattr(owner, '__qualname__', repr(owner))}"
+
+
+def phase(owner: Any, name: str):
+    """A context manager that times one phase of the processing of `owner`."""
+    if not _ENABLED:
+        return _NULL_PHASE
+    return _Phase(stats_key(owner), name)
+
+
+def enable_stats() -> None:
+    """Start recording the processing cost of docerator for each class and function.
+
+    The recording can also be enabled by setting the ``DOCERATOR_STATS`` environment variable
+    to ``1`` before importing docerator.
+    """
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable_stats() -> None:
+    """Stop recording the processing cost of docerator. Already recorded statistics are kept."""
+    global _ENABLED
+    _ENABLED = False
+
+
+def stats_enabled() -> bool:
+    """Whether docerator is recording its processing cost."""
+    return _ENABLED
+
+
+def reset_stats() -> None:
+    """Discard all recorded statistics."""
+    with _LOCK:
+        _STATS.clear()
+
+
+def stats() -> dict[str, dict[str, dict[str, float]]]:
+    """The recorded processing cost of docerator.
+
+    Returns
+    -------
+    dict[str, dict[str, dict[str, float]]]
+        A dictionary keyed by ``"module:qualname"`` of each processed class or function, containing a
+        dictionary keyed by each phase name, of the number of times it ran (``"count"``) and the total
+        time it took in seconds (``"time"``).
+
+    Examples
+    --------
+    >>> import docerator
+    >>> docerator.enable_stats()
+    >>> class A(metaclass=docerator.DoceratorMeta):
+    ...     '''Parameters
+    ...     ----------
+    ...     a : int
+    ...     '''
+    ...     def __init__(self, a): ...
+    >>> sorted(docerator.stats()[f"{__name__}:A"])
+    ['parse', 'total']
+    """
+    with _LOCK:
+        return {
+            key: {name: {"count": count, "time": elapsed} for name, (count, elapsed) in phases.items()}
+            for key, phases in _STATS.items()
+        }
+
+
+if os.environ.get("DOCERATOR_STATS", "0") not in ("", "0"):
+    enable_stats()
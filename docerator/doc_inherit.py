@@ -1,15 +1,26 @@
 import inspect
 import re
 import importlib
+import contextvars
 import functools
+import hashlib
+import itertools
+import os
+import sys
 import textwrap
-from turtledemo.penrose import start
-from typing import Callable, Optional
+import threading
+import types
+import weakref
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, Union
 
 __all__ = ["bind_signature_to_function"]
 
-from docerator._base import REPLACE_REGEX
+from docerator import _disk_cache, _freeze, _params, _stats
+from docerator._base import _SIGNATURE_CACHE, REPLACE_REGEX, get_debug_level, signature as _signature
+from docerator._binding import make_binder
 from docerator.parsers import PARSERS, ParameterParser
+from docerator._params import DescribedParameter, _void
 
 ARG_SPLIT_REGEX = re.compile(r"\s*,\s*")
 
@@ -25,21 +36,92 @@ def _skip_first_and_empty():
 
     return func
 
-def _get_indent(target: str, docstring: str):
-    # Return the indentation between target and the new line character before it.
-    return re.search(rf"^\s*(?={re.escape(target)})", docstring, re.MULTILINE)[0]
+def _substitute(doc: str, replacements: dict[str, str]) -> str:
+    # Replace every %(replace_key) in doc that has a replacement, in a single pass over doc.
+    pieces = []
+    position = 0
+    for match in REPLACE_REGEX.finditer(doc):
+        replacement = replacements.get(match.group("replace_key"))
+        if replacement is None:
+            continue
+        start = match.start()
+        # the indentation of the line the key is on.
+        line_start = doc.rfind("\n", 0, start) + 1
+        line = doc[line_start:start]
+        indent = line[:len(line) - len(line.lstrip())]
+        pieces.append(doc[position:start])
+        if indent:
+            # prepend indent to all lines except the first
+            replacement = textwrap.indent(replacement, indent, _skip_first_and_empty())
+        pieces.append(replacement)
+        position = match.end()
+    if not pieces:
+        return doc
+    pieces.append(doc[position:])
+    return "".join(pieces)
 
 
 def _replace_doc_args(replace_key: str, replacement: str, doc: str):
-    # find the indentation
-    target = f"%({replace_key})"
-    indent = _get_indent(target, doc)
+    return _substitute(doc, {replace_key: replacement})
+
+# Resolved targets, as the module they were found in and the attributes to look up on it.
+_TARGET_CACHE: dict[str, tuple[ModuleType, tuple[str, ...]]] = {}
+
+
+def _clear_target_cache() -> None:
+    _TARGET_CACHE.clear()
+
+
+# Under ``python -OO`` there are no docstrings to parse. Classes and functions only get the
+# signatures that ``python -m docerator freeze`` stored for them.
+_OPTIMIZED: bool = sys.flags.optimize >= 2
+
+# Set while `docerator.static` creates stand-ins of classes from their source, to look targets up
+# among those stand-ins instead of importing their modules.
+_STATIC_TARGETS: contextvars.ContextVar[Optional[Callable[[str], Any]]] = contextvars.ContextVar(
+    "_STATIC_TARGETS", default=None
+)
 
-    # prepend indent to all lines except the first
-    formatted = textwrap.indent(replacement, indent, _skip_first_and_empty())
-    return doc.replace(target, formatted)
 
 def _import_target(source_name):
+    static_targets = _STATIC_TARGETS.get()
+    if static_targets is not None:
+        return static_targets(source_name)
+    cached = _TARGET_CACHE.get(source_name)
+    if cached is not None:
+        module, attributes = cached
+        # Only the module is cached, the attributes are always looked up again. Reloading
+        # a module re-executes it in the same module object, so this picks up the new targets.
+        if sys.modules.get(module.__name__) is module:
+            try:
+                target = module
+                for attribute in attributes:
+                    target = getattr(target, attribute)
+                    if _REFRESHING:
+                        target = _latest(target)
+                return target
+            except AttributeError:
+                pass
+    target, module, attributes = _resolve_target(source_name)
+    _TARGET_CACHE[source_name] = (module, attributes)
+    if _REFRESHING:
+        return _import_target(source_name)
+    return target
+
+
+def _import_module(module_name):
+    # The ``module.Class`` of a ``module.Class.function`` target is first tried as a module. Once
+    # ``module`` is imported, that can be ruled out without searching for it (and without caching
+    # the failure, as a module that can not be imported now might be importable later).
+    if module_name not in sys.modules:
+        package_name, _, attribute = module_name.rpartition(".")
+        value = getattr(sys.modules.get(package_name), attribute, None)
+        if value is not None and not isinstance(value, ModuleType):
+            raise ImportError(f"No module named {module_name!r}")
+    return importlib.import_module(module_name)
+
+
+def _resolve_target(source_name):
     # three possibilities here for the target function.
     # (1) target is a module.Class or
     # (2) target is module.function or
@@ -47,7 +129,9 @@ def _import_target(source_name):
     try:
         # catch cases 1 and 2
         module_name, target = source_name.rsplit(".", 1)
-        target = getattr(importlib.import_module(module_name), target)
+        module = _import_module(module_name)
+        attributes = (target, )
+        target = getattr(module, target)
     except ValueError:
         raise ValueError(
             f"{source_name} does not include the module information. "
@@ -57,20 +141,23 @@ def _import_target(source_name):
         # try case 3
         try:
             module_name, class_target, func_target = source_name.rsplit(".", 2)
-            target = getattr(importlib.import_module(module_name), class_target)
+            module = _import_module(module_name)
+            attributes = (class_target, func_target)
+            target = getattr(module, class_target)
             target = getattr(target, func_target)
         except (ImportError, TypeError):
             raise ImportError(
                 f"Unable to import class {source_name} for docstring replacement"
             )
-    return target
+    return target, module, attributes
 
 
 
 def doc_wrap(
         doc_style: str=None,
         star_excludes: set[str]=None,
-        update_signature: bool=True
+        update_signature: bool=True,
+        validate_calls: Union[bool, int, str]=True,
 ) -> Callable:
     if doc_style is None:
         doc_style = 'numpydoc'
@@ -79,20 +166,69 @@ def doc_wrap(
     star_excludes = set(star_excludes) if star_excludes is not None else set()
     def wrapper(func):
         if inspect.ismethod(func) or inspect.isfunction(func):
-            return _doc_wrap(func, star_excludes, parser, update_signature=update_signature)
+            if _OPTIMIZED and _STATIC_TARGETS.get() is None:
+                return _frozen_function(func, validate_calls, doc_style)
+            template = func.__doc__
+            with _stats.phase(func, "total"):
+                new_func = _resolve_function(func, star_excludes, parser, update_signature, validate_calls, doc_style)
+            _function_created(func, template, new_func, star_excludes, parser, update_signature, validate_calls)
+            return new_func
         else:
             raise TypeError("func must be a callable function or method.")
     return wrapper
 
 
+def _frozen_function(func: Callable, validate_calls: Union[bool, int, str], doc_style: str) -> Callable:
+    frozen_entry = _freeze.lookup(func.__module__, func.__qualname__, doc_style)
+    signature = None if frozen_entry is None else frozen_entry.resolved_signature("__doc__", func)
+    if signature is None:
+        return func
+    return bind_signature_to_function(signature, func, validate_calls)
+
+
+def _resolve_function(
+        func: Callable,
+        star_excludes: set[str],
+        parser: ParameterParser,
+        update_signature: bool,
+        validate_calls: Union[bool, int, str],
+        doc_style: str,
+) -> Callable:
+    digest = functools.partial(_template_digest, _own_digest([("__doc__", func.__doc__)], ()))
+    frozen_entry = _freeze.lookup(func.__module__, func.__qualname__, doc_style, digest)
+    if frozen_entry is None:
+        return _doc_wrap(
+            func, star_excludes, parser, update_signature=update_signature, validate_calls=validate_calls
+        )
+    docstring = func.__doc__
+    resolved_doc = frozen_entry.resolved_doc("__doc__")
+    if resolved_doc is not None:
+        signature = frozen_entry.resolved_signature("__doc__", func)
+        if signature is not None:
+            new_func = bind_signature_to_function(signature, func, validate_calls)
+            new_func.__doc__ = resolved_doc
+            return new_func
+    new_func = _doc_wrap(
+        func, star_excludes, parser, update_signature=update_signature, resolved_doc=resolved_doc,
+        validate_calls=validate_calls,
+    )
+    if resolved_doc is None and new_func.__doc__ != docstring:
+        frozen_entry.store_doc("__doc__", new_func.__doc__, _doc_dependencies(None, docstring), new_func)
+    return new_func
+
+
 def _doc_wrap(
         func: Callable,
         star_excludes: set[str],
         parser: ParameterParser,
         cls_context: Optional[type]=None,
-        update_signature: bool=True
-) -> tuple[str, inspect.Signature]:
+        update_signature: bool=True,
+        resolved_doc: Optional[str]=None,
+        validate_calls: Union[bool, int, str]=True,
+) -> Callable:
     doc = func.__doc__
+    # the class (or function) that the statistics are recorded for.
+    owner = func if cls_context is None else cls_context
     if inspect.isclass(func):
         func = func.__init__
         func_name = "__init__"
@@ -123,26 +259,29 @@ def _doc_wrap(
     if not args_to_insert:
         return func
 
-    signature = inspect.signature(func)
+    with _stats.phase(owner, "signature"):
+        signature = _signature(func)
     sig_params = signature.parameters
     super_doc_dict = {}
     # build the super argument dictionary if we will need it.
     if had_super:
         if cls_context is None:
             raise ValueError("cls_context must be set for super lookups")
-        for base in inspect.getmro(cls_context)[:-1][::-1]:  # don't bother checking myself or `object`
-            if base_arg_dict := getattr(base, "_arg_dict", None):
-                super_doc_dict.update(base_arg_dict.get(func_name, {}))
+        with _stats.phase(owner, "mro_merge"):
+            super_doc_dict = _inherited_arguments(cls_context)[func_name]
 
     # need to also know what was already described on myself:
     func_arg_dict = {}
     if had_star:
         if cls_context is None:
-            func_arg_dict =  parser.parse_parameters(func)
+            with _stats.phase(owner, "parse"):
+                func_arg_dict =  parser.parse_parameters(func)
         else:
             func_arg_dict = cls_context._arg_dict[func_name]
 
     inserted_parameters = {}
+    # the formatted replacement of each key
+    replacements = {}
     for replace_key, args in args_to_insert.items():
         parameters = []
         for source_name, arg in args:
@@ -155,10 +294,12 @@ def _doc_wrap(
                             f"Argument {arg} not found in {cls_context.__name__}'s inheritance tree of {func_name}."
                         )
                 else:
-                    target = _import_target(source_name)
+                    with _stats.phase(owner, "target_import"):
+                        target = _registered_target(source_name)
                     arg_dict = getattr(target, "_arg_dict", None)
                     if arg_dict is None:
-                        arg_dict = {func_name:parser.parse_parameters(target)}
+                        with _stats.phase(owner, "parse"):
+                            arg_dict = {func_name:parser.parse_parameters(target)}
                     if func_name not in arg_dict:
                         raise KeyError(
                             f"{target} does not have an argument dictionary for {func_name}"
@@ -170,8 +311,9 @@ def _doc_wrap(
                         )
                 parameters.append(arg_dict[arg])
         if parameters:
-            formatted = parser.format_parameter(parameters)
-            doc = _replace_doc_args(replace_key, formatted, doc)
+            if resolved_doc is None:
+                with _stats.phase(owner, "replace"):
+                    replacements[replace_key] = parser.format_parameter(parameters)
             for param in parameters:
                 inserted_parameters[param.name] = param
 
@@ -185,10 +327,12 @@ def _doc_wrap(
                 replaced_super_star = True
                 star_arg_dict = super_doc_dict
             else:
-                target = _import_target(source_name)
+                with _stats.phase(owner, "target_import"):
+                    target = _registered_target(source_name)
                 star_arg_dict = getattr(target, "_arg_dict", None)
                 if star_arg_dict is None:
-                    star_arg_dict = {func_name:parser.parse_parameters(target)}
+                    with _stats.phase(owner, "parse"):
+                        star_arg_dict = {func_name:parser.parse_parameters(target)}
                 if func_name not in star_arg_dict:
                     raise TypeError(f"{target} does not have {func_name} described.")
                 star_arg_dict = star_arg_dict[func_name]
@@ -218,50 +362,178 @@ def _doc_wrap(
                     parameters[param.name] = param
 
         if parameters:
-            # build up the replacement string
-            formatted = "\n".join(parser.format_parameter(par) for par in parameters.values())
-            doc = _replace_doc_args(replace_key, formatted, doc)
+            if resolved_doc is None:
+                # build up the replacement string
+                with _stats.phase(owner, "replace"):
+                    formatted = "\n".join(parser.format_parameter(par) for par in parameters.values())
+                    if replace_key in replacements:
+                        # a key that mixes specific arguments with a `*`
+                        formatted = f"{replacements[replace_key]}\n{formatted}"
+                    replacements[replace_key] = formatted
 
             for param in parameters.values():
                 inserted_parameters[param.name] = param
 
 
-    if update_signature:
-        var_kwarg = None
-        new_params = []
-        # filter out the variational keyword argument
-        for arg, param in sig_params.items():
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                var_kwarg = param
-            elif param.name in star_excludes:
-                # if this parameter was meant to be excluded, skip over it.
-                continue
-            else:
-                if param.name in inserted_parameters:
-                    # update it with the inherited parameters
-                    # and be sure not to change the kind of the parameter
-                    # or its default
-                    param = inserted_parameters[param.name].replace(kind=param.kind, default=param.default)
-
-                new_params.append(param)
-        for param in inserted_parameters.values():
-            if param.name not in sig_params and var_kwarg:
-                new_params.append(
-                    param.replace(kind=inspect.Parameter.KEYWORD_ONLY)
-                )
-        # If I had a variation keyword argument, and I did not do a super.* include
-        # add the variational keyword argument back in
-        if var_kwarg and not replaced_super_star:
-            new_params.append(var_kwarg)
-        signature = inspect.Signature(parameters=new_params)
-
-    func = bind_signature_to_function(signature, func)
-    func.__doc__ = doc
+    if replacements:
+        with _stats.phase(owner, "replace"):
+            doc = _substitute(doc, replacements)
+
+    with _stats.phase(owner, "signature"):
+        if update_signature:
+            var_kwarg = None
+            new_params = []
+            # filter out the variational keyword argument
+            for arg, param in sig_params.items():
+                if param.kind == inspect.Parameter.VAR_KEYWORD:
+                    var_kwarg = param
+                elif param.name in star_excludes:
+                    # if this parameter was meant to be excluded, skip over it.
+                    continue
+                else:
+                    if param.name in inserted_parameters:
+                        # update it with the inherited parameters
+                        # and be sure not to change the kind of the parameter
+                        # or its default
+                        param = inserted_parameters[param.name].replace(kind=param.kind, default=param.default)
+
+                    new_params.append(param)
+            for param in inserted_parameters.values():
+                if param.name not in sig_params and var_kwarg:
+                    new_params.append(
+                        param.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+                    )
+            # If I had a variation keyword argument, and I did not do a super.* include
+            # add the variational keyword argument back in
+            if var_kwarg and not replaced_super_star:
+                new_params.append(var_kwarg)
+            signature = inspect.Signature(parameters=new_params)
+
+        # the wrapper carries its own signature from here on.
+        _SIGNATURE_CACHE.pop(func, None)
+        func = bind_signature_to_function(signature, func, validate_calls)
+    func.__doc__ = doc if resolved_doc is None else resolved_doc
     return func
 
 
+class _InheritedArguments:
+    """The argument dictionaries of a class, merged over its method resolution order.
+
+    ``index[func_name]`` is the dictionary made by updating an empty dictionary with
+    ``base._arg_dict[func_name]`` for every ``base`` in the class's MRO (except `object`), from the
+    most distant ancestor to the class itself. Each one is built once, on first use. A class with a
+    single parent builds it from its parent's merged dictionary instead of walking its whole MRO.
+
+    The merged dictionaries are shared between a class and its children, and must not be modified.
+    If two threads merge the same dictionary at once, both use the one that was stored first.
+    """
+
+    __slots__ = ("cls", "merged")
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        self.merged: dict[str, dict[str, DescribedParameter]] = {}
+
+    def __getitem__(self, func_name: str) -> dict[str, DescribedParameter]:
+        merged = self.merged.get(func_name)
+        if merged is None:
+            merged = self.merged.setdefault(func_name, self._merge(func_name))
+        return merged
+
+    def _merge(self, func_name: str) -> dict[str, DescribedParameter]:
+        cls = self.cls
+        bases = cls.__bases__
+        if len(bases) == 1 and "_inherited_arguments" in bases[0].__dict__:
+            inherited = bases[0]._inherited_arguments[func_name]
+            own = cls._arg_dict.get(func_name)
+            if not own:
+                return inherited
+            return inherited | own
+        merged = {}
+        for base in cls.__mro__[:-1][::-1]:  # don't bother checking `object`
+            if base_arg_dict := getattr(base, "_arg_dict", None):
+                merged.update(base_arg_dict.get(func_name, {}))
+        return merged
+
+
+def _inherited_arguments(cls: type) -> _InheritedArguments:
+    index = cls.__dict__.get("_inherited_arguments")
+    if index is None:
+        # cls was not created by DoceratorMeta, so it has no index of its own.
+        index = _InheritedArguments(cls)
+    return index
+
+
+def _doc_dependencies(cls: Optional[type], doc: str) -> set[str]:
+    # The modules that a resolved docstring of cls (or of a function if cls is None) was built from.
+    modules = set()
+    if cls is not None:
+        modules.update(base.__module__ for base in cls.__mro__ if "_arg_dict" in base.__dict__)
+    for match in REPLACE_REGEX.finditer(doc):
+        for item in ARG_SPLIT_REGEX.split(match.group("replace_key")):
+            source_name = item.rsplit(".", 1)[0]
+            if source_name != "super":
+                modules.add(_import_target(source_name).__module__)
+    return modules
+
+
+# The targets of every digest that names none (most of them), shared to save memory.
+_NO_TARGETS: frozenset[str] = frozenset()
+
+
+def _own_digest(
+        templates: list[tuple[str, Optional[str]]], bases: tuple[type, ...]
+) -> Optional[tuple[bytes, frozenset[str]]]:
+    # A hash of the docstring templates of a class (or function) and of the ancestors it inherits
+    # parameters from, and the replacement targets that any of them name. None if an ancestor's
+    # templates are unknown.
+    hasher = hashlib.sha256()
+    targets = set()
+    for base in bases:
+        if "_arg_dict" in base.__dict__:
+            base_digest = base.__dict__.get("_docerator_digest")
+            if base_digest is None:
+                return None
+            hasher.update(base_digest[0])
+            targets.update(base_digest[1])
+    for name, template in templates:
+        hasher.update(f"{name}\0{template}\0".encode("utf-8", "surrogatepass"))
+        if template and "%(" in template:
+            for match in REPLACE_REGEX.finditer(template):
+                for item in ARG_SPLIT_REGEX.split(match.group("replace_key")):
+                    source_name = item.rsplit(".", 1)[0]
+                    if source_name != "super":
+                        targets.add(source_name)
+    return hasher.digest(), frozenset(targets) if targets else _NO_TARGETS
+
+
+def _template_digest(own_digest: Optional[tuple[bytes, frozenset[str]]]) -> Optional[str]:
+    # The hash that cached (or frozen) entries are checked against: the templates, and the
+    # targets they name as they are now. None if it can not be known.
+    if own_digest is None:
+        return None
+    digest, targets = own_digest
+    if not targets:
+        return digest.hex()
+    hasher = hashlib.sha256(digest)
+    for source_name in sorted(targets):
+        try:
+            target = _registered_target(source_name)
+        except (ImportError, AttributeError, ValueError):
+            return None
+        target_digest = target.__dict__.get("_docerator_digest") if isinstance(target, type) else None
+        if target_digest is not None:
+            text = _template_digest(target_digest)
+            if text is None:
+                return None
+        else:
+            text = target.__doc__
+        hasher.update(f"{source_name}\0{text}\0".encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()
+
+
 def bind_signature_to_function(
-    signature: inspect.Signature, func: Callable
+    signature: inspect.Signature, func: Callable, validate_calls: Union[bool, int, str] = True
 ) -> Callable:
     """Binds a callable function to a new signature.
 
@@ -271,6 +543,15 @@ def bind_signature_to_function(
         The new signature to bind the function to.
     func : callable
         The function to bind the new signature to.
+    validate_calls : bool or int or "outermost", optional
+        Whether calls are checked against the new signature. If ``False``, no wrapper is
+        created. Instead, a copy of `func` (sharing its code) has the new signature attached to
+        it, so calls cost the same as calling `func`. If an integer ``n``, only one in every ``n``
+        calls is checked. If ``"outermost"`` and `func` is a method, a call made while another
+        ``"outermost"`` wrapper of a method with the same name is being called with the same first
+        argument in the same thread goes straight to `func`, unchecked, if the class of `func`
+        comes after that method's in the first argument's MRO (e.g. ``self`` in a chain of
+        ``super().__init__(**kwargs)`` calls). Functions that are not methods check every call.
 
     Returns
     -------
@@ -281,18 +562,50 @@ def bind_signature_to_function(
 
     # Note this function will not raise a `TypeError`, but the function returned
     # from this function will. Thus, `TypeError` is not included in the Raises doc section.
-    @functools.wraps(func)
-    def bind_signature(*args, **kwargs):
-        try:
-            params = signature.bind(*args, **kwargs)
-        except TypeError as err:
-            raise TypeError(f"{func.__qualname__}(): {err}") from None
-        return func(*params.args, **params.kwargs)
+    if validate_calls is not True and validate_calls is not False and validate_calls != "outermost":
+        if not isinstance(validate_calls, int) or validate_calls < 1:
+            raise ValueError(
+                f"validate_calls must be a bool, a positive integer or 'outermost', not {validate_calls!r}"
+            )
+        if validate_calls == 1:
+            validate_calls = True
+    if validate_calls is False and inspect.isfunction(func):
+        bind_signature = _copy_function(func)
+        bind_signature.__signature__ = signature
+        return bind_signature
 
+    # The wrapper is generated specifically for this signature, to avoid calling the (slow)
+    # `inspect.Signature.bind` on every call.
+    outermost = validate_calls == "outermost"
+    _, bind_signature = make_binder(signature, func, outermost)
+    if not outermost and validate_calls is not True and validate_calls is not False:
+        bind_signature = _sample_calls(bind_signature, func, validate_calls)
+    bind_signature = functools.wraps(func)(bind_signature)
     bind_signature.__signature__ = signature
     return bind_signature
 
 
+def _copy_function(func: types.FunctionType) -> types.FunctionType:
+    # A new function object sharing the code (and closure) of func, so it can have its own attributes.
+    new_func = types.FunctionType(
+        func.__code__, func.__globals__, func.__name__, func.__defaults__, func.__closure__
+    )
+    new_func.__kwdefaults__ = func.__kwdefaults__
+    return functools.update_wrapper(new_func, func)
+
+
+def _sample_calls(bind_signature: Callable, func: Callable, every: int) -> Callable:
+    # Only check one in every `every` calls against the new signature.
+    counter = itertools.count()
+
+    def sample_calls(*args, **kwargs):
+        if next(counter) % every:
+            return func(*args, **kwargs)
+        return bind_signature(*args, **kwargs)
+
+    return sample_calls
+
+
 class DoceratorMeta(type):
     """Metaclass that implements class constructor argument replacement.
 
@@ -382,6 +695,8 @@ class DoceratorMeta(type):
         doc_style=None,
         star_excludes: Optional[set] = None,
         update_signature: bool = True,
+        lazy: bool = False,
+        validate_calls: Union[bool, int, str] = True,
         **kwargs,
     ):
         """
@@ -396,31 +711,91 @@ class DoceratorMeta(type):
             Arguments to exclude from any (class_name.*) imports
         update_signature : bool, optional
             Whether to update the class's signature to match the updated docstring.
+        lazy : bool, optional
+            Whether to defer the docstring replacements and signature updates until they are first
+            accessed. The class's argument dictionary is still built when the class is created.
+        validate_calls : bool or int or "outermost", optional
+            Whether calls of the methods with updated signatures are checked against their new
+            signatures. If ``False``, the new signatures are attached to the methods without
+            wrapping them, and if an integer ``n``, only one in every ``n`` calls is checked. If
+            ``"outermost"``, only the outermost call of a chain of ``super()`` calls (of methods
+            with the same name, along the MRO of the object they are called on) is checked. See `bind_signature_to_function`.
         **kwargs
             Extra keyword arguments passed to the parent metaclass.
         """
         # construct the class
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        _process_class(cls, namespace, doc_style, star_excludes, update_signature, lazy, validate_calls)
+        return cls
+
 
+def _process_class(
+        cls: type,
+        namespace: dict,
+        doc_style: Optional[str] = None,
+        star_excludes: Optional[set] = None,
+        update_signature: bool = True,
+        lazy: bool = False,
+        validate_calls: Union[bool, int, str] = True,
+) -> None:
+    # Build the argument dictionary of a class, and resolve its replacements. `namespace` holds
+    # the members defined in the class body. See `DoceratorMeta.__new__` for the options.
+    if _REGISTERED:
+        # (its parents must be finalized first)
+        for base in cls.__mro__[1:-1]:
+            if base in _REGISTERED:
+                _finalize_class(base)
+
+    with _stats.phase(cls, "total"):
         if doc_style is None:
             doc_style = 'numpydoc'
         parser = PARSERS[doc_style]
 
+        static = _STATIC_TARGETS.get() is not None
+        if _OPTIMIZED and not static:
+            _apply_frozen_signatures(cls, namespace, star_excludes, validate_calls, doc_style)
+            return
+        cache_entry = None
+        # (the digests are only compared by the disk cache and the frozen entries)
+        if not static and (_disk_cache._ENABLED or _freeze.in_use(cls.__module__)):
+            # (to tell if the cached and frozen entries of this class, or its subclasses, are out of date)
+            templates = [("__doc__", namespace.get("__doc__"))]
+            templates.extend(
+                (item_name, item.__doc__) for item_name, item in namespace.items()
+                if inspect.ismethod(item) or inspect.isfunction(item)
+            )
+            own_digest = cls._docerator_digest = _own_digest(templates, cls.__mro__[1:-1])
+            digest = functools.partial(_template_digest, own_digest)
+            cache_entry = _freeze.lookup(cls.__module__, cls.__qualname__, doc_style, digest)
+            if cache_entry is None:
+                cache_entry = _disk_cache.lookup(cls.__module__, cls.__qualname__, doc_style, digest)
+
         # build the documentation argument dictionary for each of the functions
-        arguments = {}
-        for item_name, item in namespace.items():
-            if item_name in ["__module__", "__qualname__", "__doc__"]:
-                continue
-            # only work with callable things (that have a signature)
-            if inspect.ismethod(item) or inspect.isfunction(item):
-                arguments[item_name] = parser.parse_parameters(item)
-        # If this class has a `__doc__` parse its parameters (if any)
-        # and add them to __init__
-        if "__doc__" in namespace:
-            init = arguments.get("__init__", {})
-            arguments["__init__"] = init | parser.parse_parameters(cls)
+        with _stats.phase(cls, "parse"):
+            # (each function is only parsed when its entry is first needed)
+            arguments = _ArgumentDict(cls, parser, cache_entry)
+            for item_name, item in namespace.items():
+                if item_name in ["__module__", "__qualname__", "__doc__"]:
+                    continue
+                # only work with callable things (that have a signature)
+                if inspect.ismethod(item) or inspect.isfunction(item):
+                    arguments.defer(item_name, (item, item_name))
+            # If this class has a `__doc__` parse its parameters (if any)
+            # and add them to __init__
+            if "__doc__" in namespace:
+                class_doc = (cls, "__doc__")
+                init = namespace.get("__init__")
+                if _has_replacements(cls.__doc__) or _has_replacements(getattr(init, "__doc__", None)):
+                    # The replacements will change the class's signature, so parse its
+                    # docstring against the signature it has now.
+                    class_doc = (_DocSource(cls.__name__, cls.__doc__, _signature(cls)), "__doc__")
+                arguments.defer("__init__", class_doc)
+            if get_debug_level():
+                # report any problems with the docstrings when the class is created.
+                arguments.parse_all()
 
         cls._arg_dict = arguments
+        cls._inherited_arguments = _InheritedArguments(cls)
 
         # Now start deciding what to replace
         if star_excludes is None:
@@ -434,41 +809,1050 @@ class DoceratorMeta(type):
         # get all the excludes from the inheritance tree.
         excludes = set()
         for base in cls.__mro__[:-1]:
-            if excluded := getattr(base, "_excluded_parent_args"):
+            if excluded := getattr(base, "_excluded_parent_args", None):
                 excludes.update(excluded)
 
-        # replace things in the docstring, and bind functions that
-        # accepted **kwargs to new call signatures.
-        for name, item in namespace.items():
-            if name in ["__module__", "__qualname__"]:
-                continue
-            docstring = item.__doc__
-            # If the item doesn't have a docstring, continue
-            if not docstring:
-                continue
-            # If the docstring attribute is read-only, continue
+        if lazy:
+            _LazyResolution(
+                cls, namespace, star_excludes, parser, update_signature, validate_calls, cache_entry
+            ).install()
+        else:
+            _resolve_members(cls, namespace, star_excludes, parser, update_signature, validate_calls, cache_entry)
+            if "__doc__" in namespace:
+                _resolve_class_doc(cls, star_excludes, parser, update_signature, validate_calls, cache_entry)
+    if not static:
+        _class_created(cls)
+
+
+def _apply_frozen_signatures(
+        cls: type,
+        namespace: dict,
+        star_excludes: Optional[set[str]],
+        validate_calls: Union[bool, int, str],
+        doc_style: str,
+) -> None:
+    # The only work done for a class under ``python -OO``.
+    cls._arg_dict = {}
+    cls._inherited_arguments = _InheritedArguments(cls)
+    cls._excluded_parent_args = set(star_excludes) if star_excludes is not None else set()
+    frozen_entry = _freeze.lookup(cls.__module__, cls.__qualname__, doc_style)
+    if frozen_entry is None:
+        return
+    for name, item in namespace.items():
+        if inspect.isfunction(item):
+            signature = frozen_entry.resolved_signature(name, item)
+            if signature is not None:
+                setattr(cls, name, bind_signature_to_function(signature, item, validate_calls))
+    signature = frozen_entry.resolved_signature("__doc__", cls.__init__)
+    if signature is not None:
+        new_init = bind_signature_to_function(signature, cls.__init__, validate_calls)
+        new_init.__doc__ = None
+        cls.__init__ = new_init
+
+
+class _Registration:
+    """The options of a class decorated with `inherit` that was not finalized yet."""
+
+    __slots__ = ("options", "lock", "started")
+
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        self.lock = threading.RLock()
+        self.started = False
+
+
+# The classes decorated with `inherit` that were not finalized yet, in the order they were created.
+_REGISTERED: dict[type, _Registration] = {}
+
+
+def inherit(
+        cls: Optional[type] = None,
+        *,
+        doc_style: Optional[str] = None,
+        star_excludes: Optional[set] = None,
+        update_signature: bool = True,
+        lazy: bool = False,
+        validate_calls: Union[bool, int, str] = True,
+):
+    """Class decorator alternative to `DoceratorMeta`, for classes that have another metaclass.
+
+    The decorated class is only registered. Its replacements are resolved by `finalize`, or as soon
+    as another class needs them: when a subclass using `DoceratorMeta` is created, when a
+    registered subclass is finalized, or when it is the target of another replacement. Every class
+    of a hierarchy must be decorated, subclasses of decorated classes are not registered themselves.
+
+    Parameters
+    ----------
+    cls : type
+        The class to register, when used without arguments (``@inherit``).
+    doc_style, star_excludes, update_signature, lazy, validate_calls
+        The same options as the class keyword arguments of `DoceratorMeta`.
+
+    Examples
+    --------
+    >>> import abc
+    >>> from docerator import finalize, inherit
+    >>> @inherit
+    ... class Base(abc.ABC):
+    ...     '''Base
+    ...
+    ...     Parameters
+    ...     ----------
+    ...     a : int
+    ...         The a.
+    ...     '''
+    ...     def __init__(self, a): ...
+    >>> @inherit
+    ... class Child(Base):
+    ...     '''Child
+    ...
+    ...     Parameters
+    ...     ----------
+    ...     %(super.*)
+    ...     '''
+    ...     def __init__(self, **kwargs): ...
+    >>> finalize(__name__)  # doctest: +SKIP
+    """
+    options = {
+        "doc_style": doc_style,
+        "star_excludes": star_excludes,
+        "update_signature": update_signature,
+        "lazy": lazy,
+        "validate_calls": validate_calls,
+    }
+
+    def register(cls: type) -> type:
+        if not isinstance(cls, type):
+            raise TypeError("inherit can only decorate classes.")
+        if isinstance(cls, DoceratorMeta):
+            raise TypeError(f"{cls.__qualname__} already uses DoceratorMeta.")
+        _REGISTERED[cls] = _Registration(options)
+        return cls
+
+    return register if cls is None else register(cls)
+
+
+def _finalize_class(cls: type) -> bool:
+    # Process a registered class, returns whether this call did it.
+    registration = _REGISTERED.get(cls)
+    if registration is None:
+        return False
+    with registration.lock:
+        if registration.started or _REGISTERED.get(cls) is not registration:
+            # finalized by another thread, or being finalized by this one.
+            return False
+        registration.started = True
+        try:
+            namespace = {
+                name: item for name, item in cls.__dict__.items() if name not in ("__dict__", "__weakref__")
+            }
+            if namespace.get("__doc__") is None:
+                # (the class body had no docstring)
+                namespace.pop("__doc__", None)
+            _process_class(cls, namespace, **registration.options)
+        finally:
+            _REGISTERED.pop(cls, None)
+    return True
+
+
+def _registered_target(source_name: str) -> Any:
+    # `_import_target`, after finalizing the registered class that is (or owns) the target.
+    target = _import_target(source_name)
+    if _REGISTERED:
+        owner = target
+        if not isinstance(target, type):
             try:
-                item.__doc__ = docstring
-            except AttributeError:
-                continue
-            if inspect.isfunction(item):
-                item = _doc_wrap(item, star_excludes, parser, cls, update_signature)
-                setattr(cls, name, item)
-
-
-        if "__doc__" in namespace:
-            new_init = _doc_wrap(cls, star_excludes, parser, cls, update_signature)
-            # skip if _doc_wrap didn't do anything...
-            if new_init is not cls.__init__:
-                cls.__old_doc = cls.__doc__
-                cls.__doc__ = new_init.__doc__
-                if update_signature:
-                    # If I had an __init__ method, it would've been modified above
-                    # so pull it's docstring into this function.
-                    new_init.__doc__ = None
-                    cls.__init__ = new_init
+                owner = _import_target(source_name.rpartition(".")[0])
+            except (ImportError, AttributeError, ValueError):
+                return target
+        if owner in _REGISTERED and _finalize_class(owner):
+            target = _import_target(source_name)
+    return target
+
+
+def _dependencies(cls: type) -> list[type]:
+    # The registered classes that a registered class must be finalized after: its parents, and
+    # the classes that its replacements (may) pull parameters from.
+    dependencies = [base for base in cls.__mro__[1:-1] if base in _REGISTERED]
+    docs = [cls.__dict__.get("__doc__")]
+    docs += [item.__doc__ for item in cls.__dict__.values() if inspect.isfunction(item)]
+    for doc in docs:
+        if not doc:
+            continue
+        for match in REPLACE_REGEX.finditer(doc):
+            for item in ARG_SPLIT_REGEX.split(match.group("replace_key")):
+                source_name = item.rsplit(".", 1)[0]
+                if source_name == "super":
+                    continue
+                # (the target can be a class, or a method of one)
+                for name in (source_name, source_name.rpartition(".")[0]):
+                    try:
+                        target = _import_target(name)
+                    except (ImportError, AttributeError, ValueError):
+                        continue
+                    if target is not cls and isinstance(target, type) and target in _REGISTERED:
+                        dependencies.append(target)
+    return dependencies
+
+
+def finalize(module: Union[str, ModuleType, None] = None, max_workers: Optional[int] = None) -> list[str]:
+    """Resolve the replacements of the classes registered with `inherit`.
+
+    Every class is finalized after the registered classes it depends on: its parents, and the
+    classes its replacements pull parameters from (which are finalized too, even if they are in
+    other modules). All of them share the parsed docstrings, merged parameters and imported targets.
+
+    Parameters
+    ----------
+    module : str or module, optional
+        Only finalize the classes of this module (or module name). Defaults to every registered class.
+    max_workers : int, optional
+        Finalize hierarchies that do not depend on each other in a pool of this many threads. By
+        default, everything is finalized in the calling thread.
 
+    Returns
+    -------
+    list of str
+        The ``"module:qualname"`` of every class that was finalized.
+    """
+    if module is not None and not isinstance(module, str):
+        module = module.__name__
+    classes = [cls for cls in list(_REGISTERED) if module is None or cls.__module__ == module]
+
+    # the registered classes each one depends on, and which of them are connected.
+    dependencies = {}
+    group = {}
+
+    def root(cls):
+        while group[cls] is not cls:
+            group[cls] = group[group[cls]]
+            cls = group[cls]
         return cls
 
+    pending = list(classes)
+    while pending:
+        cls = pending.pop()
+        if cls in dependencies:
+            continue
+        dependencies[cls] = _dependencies(cls)
+        group.setdefault(cls, cls)
+        for dependency in dependencies[cls]:
+            group.setdefault(dependency, dependency)
+            group[root(dependency)] = root(cls)
+            pending.append(dependency)
+
+    # the classes of each group, each one after its dependencies.
+    groups = {}
+    visited = set()
+
+    def visit(cls):
+        if cls in visited:
+            return
+        visited.add(cls)
+        for dependency in dependencies[cls]:
+            visit(dependency)
+        groups.setdefault(root(cls), []).append(cls)
+
+    for cls in classes:
+        visit(cls)
+
+    finalized = []
+
+    def finalize_group(ordered):
+        for cls in ordered:
+            if _finalize_class(cls):
+                finalized.append(_stats.stats_key(cls))
+
+    if max_workers is None or len(groups) < 2:
+        for ordered in groups.values():
+            finalize_group(ordered)
+    else:
+        # (only imported here, as it takes a noticeable part of the time to import docerator)
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            for future in [executor.submit(finalize_group, ordered) for ordered in groups.values()]:
+                future.result()
+    return sorted(finalized)
+
+
+def _has_replacements(doc: Optional[str]) -> bool:
+    return bool(doc) and REPLACE_REGEX.search(doc) is not None
+
+
+class _ArgumentDict(dict):
+    """The ``_arg_dict`` of a class: the described parameters of each of its methods, by name.
+
+    It is a dictionary, except that each method's docstring is only parsed the first time its
+    entry is looked up. Threads that look up the same entry at once may each parse it, but end
+    up with equal parameters. The sources of each entry are kept, so that `release` can drop the
+    parsed parameters, to be parsed again when they are next looked up.
+    """
+
+    __slots__ = ("_cls", "_parser", "_cache_entry", "_sources")
+
+    def __init__(
+            self,
+            cls: type,
+            parser: ParameterParser,
+            cache_entry: Optional[_disk_cache._CacheEntry] = None,
+    ) -> None:
+        super().__init__()
+        self._cls = cls
+        self._parser = parser
+        self._cache_entry = cache_entry
+        # the sources of the entries that were parsed from them. The values of the entries that
+        # were not parsed yet are the `_Deferred` list of the things to parse.
+        self._sources: dict[str, _Deferred] = {}
+
+    def defer(self, name: str, source: Union[tuple[Any, str], dict[str, DescribedParameter]]) -> None:
+        """Add a source of the parameters of `name`: an ``(item, table_name)`` pair to parse, or a parsed dict."""
+        sources = dict.get(self, name)
+        if type(sources) is not _Deferred:
+            # (an entry that was already parsed is parsed again, with the new source)
+            sources = self._sources.pop(name, None) or _Deferred()
+        sources.append(source)
+        dict.__setitem__(self, name, sources)
+
+    def parse_all(self) -> None:
+        for name, value in list(dict.items(self)):
+            if type(value) is _Deferred:
+                self[name]
+
+    def release(self) -> None:
+        """Drop the parsed parameters of every entry that can be parsed again from its sources.
+
+        The others forget how they were formatted.
+        """
+        kept = {}
+        for name, value in list(dict.items(self)):
+            if type(value) is _Deferred:
+                continue
+            sources = self._sources.get(name)
+            if sources is not None and all(type(source) is tuple for source in sources):
+                dict.__setitem__(self, name, sources)
+            else:
+                if sources is not None:
+                    kept[name] = sources
+                _forget_formatted(value.values())
+        # (a new dictionary, as removing keys does not make one any smaller)
+        self._sources = kept
+
+    def __getitem__(self, name: str) -> dict[str, DescribedParameter]:
+        value = dict.__getitem__(self, name)
+        if type(value) is _Deferred:
+            with _stats.phase(self._cls, "parse"):
+                parsed = {}
+                for source in value:
+                    if type(source) is tuple:
+                        source = _parse_parameters(self._parser, *source, self._cache_entry)
+                    parsed |= source
+            self._sources[name] = value
+            dict.__setitem__(self, name, parsed)
+            value = parsed
+        return value
+
+    def __setitem__(self, name: str, value: dict[str, DescribedParameter]) -> None:
+        dict.__setitem__(self, name, value)
+        self._sources.pop(name, None)
+
+    def __delitem__(self, name: str) -> None:
+        dict.__delitem__(self, name)
+        self._sources.pop(name, None)
+
+    # (overriding ``__iter__`` also makes ``dict(d)``, ``{**d}`` and ``{} | d`` look up each
+    # entry through ``__getitem__``, instead of copying the storage as it is)
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name not in self:
+            return dict.pop(self, name, *default)
+        value = self[name]
+        del self[name]
+        return value
+
+    def popitem(self) -> tuple[str, dict[str, DescribedParameter]]:
+        name = next(reversed(self.keys()))
+        return name, self.pop(name)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._sources = {}
+
+    def update(self, *args, **kwargs) -> None:
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def values(self):
+        self.parse_all()
+        return dict.values(self)
+
+    def items(self):
+        self.parse_all()
+        return dict.items(self)
+
+    def copy(self) -> dict[str, dict[str, DescribedParameter]]:
+        return dict(self.items())
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        new.update(other)
+        return new
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = dict(other)
+        new.update(self.items())
+        return new
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class _Deferred(list):
+    """The sources of an `_ArgumentDict` entry that has not been parsed yet."""
+    __slots__ = ()
+
+
+class _DocSource:
+    """A docstring to parse against a fixed signature, for a class whose signature will change."""
+
+    def __init__(self, name: str, doc: str, signature: inspect.Signature) -> None:
+        self.__name__ = name
+        self.__doc__ = doc
+        # only keep the parameters, the mapping of a `Signature` is much larger.
+        self._parameters = tuple(signature.parameters.values())
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        return inspect.Signature(self._parameters, __validate_parameters__=False)
+
+    def __call__(self, *args, **kwargs):
+        raise TypeError(f"the docstring source of {self.__name__} can not be called")
+
+
+def _parse_parameters(
+        parser: ParameterParser,
+        item: Any,
+        name: str,
+        cache_entry: Optional[_disk_cache._CacheEntry],
+) -> dict[str, DescribedParameter]:
+    if cache_entry is None:
+        return parser.parse_parameters(item)
+    table = cache_entry.tables.get(name)
+    if table is None:
+        table = parser.doc_parameter_parser(item.__doc__) if item.__doc__ else {}
+        cache_entry.store_table(name, table)
+    return parser.parse_parameters(item, table)
+
+
+def _resolve_members(
+        cls: type,
+        members: dict,
+        star_excludes: set[str],
+        parser: ParameterParser,
+        update_signature: bool,
+        validate_calls: Union[bool, int, str] = True,
+        cache_entry: Optional[_disk_cache._CacheEntry] = None,
+) -> None:
+    # replace things in the docstring, and bind functions that
+    # accepted **kwargs to new call signatures.
+    for name, item in members.items():
+        if name in ["__module__", "__qualname__", "__doc__"]:
+            continue
+        docstring = item.__doc__
+        # If the item doesn't have a docstring, continue
+        if not docstring:
+            continue
+        # If the docstring attribute is read-only, continue
+        try:
+            item.__doc__ = docstring
+        except AttributeError:
+            continue
+        if inspect.isfunction(item):
+            if _has_replacements(docstring):
+                _remember(cls, name, item, docstring, star_excludes, parser, update_signature, validate_calls)
+            resolved_doc = cache_entry.resolved_doc(name) if cache_entry is not None else None
+            signature = None
+            if resolved_doc is not None:
+                signature = cache_entry.resolved_signature(name, item)
+            if signature is not None:
+                # everything is already known, so skip the replacements.
+                item = bind_signature_to_function(signature, item, validate_calls)
+                item.__doc__ = resolved_doc
+            else:
+                item = _doc_wrap(item, star_excludes, parser, cls, update_signature, resolved_doc, validate_calls)
+            setattr(cls, name, item)
+            if cache_entry is not None and resolved_doc is None and item.__doc__ != docstring:
+                cache_entry.store_doc(name, item.__doc__, _doc_dependencies(cls, docstring), item)
+
+
+def _resolve_class_doc(
+        cls: type,
+        star_excludes: set[str],
+        parser: ParameterParser,
+        update_signature: bool,
+        validate_calls: Union[bool, int, str] = True,
+        cache_entry: Optional[_disk_cache._CacheEntry] = None,
+) -> None:
+    if _has_replacements(cls.__doc__):
+        init = cls.__dict__.get("__init__", _void)
+        if type(init) is _LazyMember:
+            # (the class is being resolved lazily)
+            init = init.resolution.resolving.get("__init__", _void)
+        _remember(cls, "__doc__", init, cls.__doc__, star_excludes, parser, update_signature, validate_calls)
+    resolved_doc = cache_entry.resolved_doc("__doc__") if cache_entry is not None else None
+    signature = None
+    if resolved_doc is not None and update_signature:
+        signature = cache_entry.resolved_signature("__doc__", cls.__init__)
+    if resolved_doc is not None and (signature is not None or not update_signature):
+        # everything is already known, so skip the replacements.
+        doc = resolved_doc
+        new_init = None if signature is None else bind_signature_to_function(signature, cls.__init__, validate_calls)
+    else:
+        new_init = _doc_wrap(cls, star_excludes, parser, cls, update_signature, resolved_doc, validate_calls)
+        # skip if _doc_wrap didn't do anything...
+        if new_init is cls.__init__:
+            return
+        doc = new_init.__doc__
+        if cache_entry is not None and resolved_doc is None:
+            cache_entry.store_doc("__doc__", doc, _doc_dependencies(cls, cls.__doc__), new_init)
+    cls._DoceratorMeta__old_doc = cls.__doc__
+    cls.__doc__ = doc
+    if update_signature:
+        # If I had an __init__ method, it would've been modified above
+        # so pull it's docstring into this function.
+        new_init.__doc__ = None
+        cls.__init__ = new_init
+
+
+class _LazyResolution:
+    """Defers the docstring replacements of a class until they are first needed.
+
+    Every member of the class that would be modified by the replacements is swapped for
+    a `_LazyMember`. Accessing one of them (e.g. through ``cls.__doc__``, ``inspect.signature``
+    or calling the method) performs its replacements and puts the result on the class. The class
+    docstring and ``__init__`` are resolved together, as the class docstring can modify ``__init__``.
+
+    Each class has its own (reentrant) lock, and the placeholders stay on the class until the
+    resolved members replace them, so a thread that accesses a member while another thread is
+    resolving it waits for the resolved member. The resolving thread itself sees the original
+    members in the meantime.
+    """
+
+    def __init__(
+            self,
+            cls: type,
+            namespace: dict,
+            star_excludes: set[str],
+            parser: ParameterParser,
+            update_signature: bool,
+            validate_calls: Union[bool, int, str] = True,
+            cache_entry: Optional[_disk_cache._CacheEntry] = None,
+    ) -> None:
+        self.cls = cls
+        self.star_excludes = star_excludes
+        self.parser = parser
+        self.update_signature = update_signature
+        self.validate_calls = validate_calls
+        self.cache_entry = cache_entry
+        self.lock = threading.RLock()
+        # The original items that are being resolved (by the thread holding the lock).
+        self.resolving = {}
+
+        # only the items that have something to replace need to be deferred.
+        self.members = {}
+        for name, item in namespace.items():
+            if inspect.isfunction(item) and item.__doc__ and REPLACE_REGEX.search(item.__doc__):
+                self.members[name] = item
+        # Store what was originally on the class for the items that the class doc can replace.
+        self.class_items = {}
+        if cls.__doc__ and REPLACE_REGEX.search(cls.__doc__):
+            self.class_items["__doc__"] = cls.__doc__
+            if update_signature:
+                self.class_items["__init__"] = cls.__dict__.get("__init__", _void)
+
+    def install(self) -> None:
+        for name in self.members.keys() | self.class_items.keys():
+            type.__setattr__(self.cls, name, _LazyMember(self, name))
+
+    def resolve(self, name: str) -> None:
+        with self.lock:
+            if name in self.members or name in self.class_items:
+                with _stats.phase(self.cls, "total"):
+                    self._resolve(name)
+
+    def _resolve(self, name: str) -> None:
+        cls = self.cls
+        if name in self.class_items:
+            class_items = self.class_items
+            self.class_items = {}
+            self.resolving.update(class_items)
+            try:
+                if "__init__" in self.members:
+                    self._resolve("__init__")
+                _resolve_class_doc(
+                    cls, self.star_excludes, self.parser, self.update_signature, self.validate_calls,
+                    self.cache_entry,
+                )
+            finally:
+                # put the original items back on the class if they were not replaced.
+                for item_name, item in class_items.items():
+                    if self._is_placeholder(item_name):
+                        if item is _void:
+                            type.__delattr__(cls, item_name)
+                        else:
+                            type.__setattr__(cls, item_name, item)
+                    self.resolving.pop(item_name, None)
+        elif name in self.members:
+            item = self.members.pop(name)
+            self.resolving[name] = item
+            try:
+                _resolve_members(
+                    cls, {name: item}, self.star_excludes, self.parser, self.update_signature,
+                    self.validate_calls, self.cache_entry,
+                )
+            finally:
+                if self._is_placeholder(name):
+                    type.__setattr__(cls, name, item)
+                del self.resolving[name]
+
+    def _is_placeholder(self, name: str) -> bool:
+        item = self.cls.__dict__.get(name)
+        return type(item) is _LazyMember and item.resolution is self
+
+
+class _LazyMember:
+    """Placeholder for a class member whose docstring replacement was deferred."""
+
+    __slots__ = ("resolution", "name")
+
+    def __init__(self, resolution: _LazyResolution, name: str) -> None:
+        self.resolution = resolution
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        resolution = self.resolution
+        resolution.resolve(self.name)
+        cls = resolution.cls
+        item = cls.__dict__.get(self.name, _void)
+        if item is self:
+            # This thread is resolving the member, so it gets the original one.
+            item = resolution.resolving.get(self.name, _void)
+            if item is _void:
+                return getattr(super(cls, owner if instance is None else instance), self.name)
+        if item is _void:
+            # The member was inherited, so look it up again now that this placeholder is gone.
+            return getattr(owner if instance is None else instance, self.name)
+        if hasattr(type(item), "__get__"):
+            return item.__get__(instance, owner)
+        return item
+
+
+class _Templates:
+    """The unresolved members of a class (or a function), kept to resolve them again.
+
+    ``items`` maps each resolved member's name to the original item and its docstring template.
+    A class's ``"__doc__"`` item is the ``__init__`` its docstring was resolved with (or `_void`
+    if it was inherited).
+    """
+
+    __slots__ = ("star_excludes", "parser", "update_signature", "validate_calls", "items")
+
+    def __init__(
+            self,
+            star_excludes: set[str],
+            parser: ParameterParser,
+            update_signature: bool,
+            validate_calls: Union[bool, int, str],
+    ) -> None:
+        self.star_excludes = star_excludes
+        self.parser = parser
+        self.update_signature = update_signature
+        self.validate_calls = validate_calls
+        self.items: dict[str, tuple[Any, str]] = {}
+
+
+# Whether the templates of classes and functions are kept, to resolve them again when the things
+# they were built from are reloaded (see `enable_reloading`).
+_RELOADING: bool = False
+# Every class created by DoceratorMeta.
+_CLASSES: "weakref.WeakSet[type]" = weakref.WeakSet()
+# While reloading is enabled, the latest class (or function) created with each key (see
+# `_stats.stats_key`), and the spec of its module when it was created, to notice when it is
+# re-created by executing its module again.
+_LATEST: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+_SPECS: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+# While reloading is enabled, the functions wrapped with `doc_wrap` that had replacements (each
+# keeps its templates, as classes do).
+_FUNCTIONS: "weakref.WeakSet[Callable]" = weakref.WeakSet()
+_REFRESH_LOCK = threading.RLock()
+# While refreshing, targets are looked up on the latest version of each class, as a class that is
+# being re-created is not yet bound to its name in its module.
+_REFRESHING: int = 0
+
+
+def enable_reloading() -> None:
+    """Keep what docerator needs to resolve classes and functions again when their sources change.
+
+    Classes and functions that are created while reloading is enabled keep their docstring
+    templates, so that they are resolved again when a class they are built from is re-created by
+    reloading its module, or by `refresh`. Reloading is enabled while IPython's ``autoreload``
+    extension is loaded, and can also be enabled by setting the ``DOCERATOR_RELOAD`` environment
+    variable to ``1`` before importing docerator.
+    """
+    global _RELOADING
+    _RELOADING = True
+
+
+def disable_reloading() -> None:
+    """Stop keeping the templates of new classes and functions. Those that were kept stay kept."""
+    global _RELOADING
+    _RELOADING = False
+
+
+def _reloading() -> bool:
+    return _RELOADING or "IPython.extensions.autoreload" in sys.modules
+
+
+def _remember(
+        cls: type,
+        name: str,
+        item: Any,
+        template: str,
+        star_excludes: set[str],
+        parser: ParameterParser,
+        update_signature: bool,
+        validate_calls: Union[bool, int, str],
+) -> None:
+    if not _reloading():
+        return
+    templates = cls.__dict__.get("_docerator_templates")
+    if templates is None:
+        templates = _Templates(star_excludes, parser, update_signature, validate_calls)
+        type.__setattr__(cls, "_docerator_templates", templates)
+    templates.items[name] = (item, template)
+
+
+def _latest(target: Any) -> Any:
+    latest = _LATEST.get(_stats.stats_key(target))
+    return target if latest is None else latest
+
+
+def _matches(keys: set[str]) -> Callable[[str], bool]:
+    # Whether a source key is one of keys, or a member of one of them.
+    prefixes = tuple(f"{key}." for key in keys)
+    return lambda source: source in keys or source.startswith(prefixes)
+
+
+def _recreated(key: str, new: Any) -> Any:
+    # The previous version of `new` if it is being re-created by executing its module again (e.g.
+    # by `importlib.reload`), otherwise None. Other classes that happen to have the same key, like
+    # the ones created by calling a factory function twice, are left alone.
+    module = sys.modules.get(new.__module__)
+    spec = getattr(module, "__spec__", None)
+    old = _LATEST.get(key)
+    _LATEST[key] = new
+    previous_spec = _SPECS.get(old) if old is not None else None
+    if spec is not None:
+        _SPECS[new] = spec
+    # (reloading a module executes it with a new spec)
+    if old is None or old is new or spec is None or previous_spec is spec:
+        return None
+    namespace = module.__dict__
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals is namespace and frame.f_code.co_name == "<module>":
+            return old
+        frame = frame.f_back
+    return None
+
+
+def _class_created(cls: type) -> None:
+    # Called at the end of DoceratorMeta.__new__.
+    _CLASSES.add(cls)
+    key = _stats.stats_key(cls)
+    if "<" in key or not _reloading():
+        # local classes are re-created every time their function runs.
+        return
+    old = _recreated(key, cls)
+    if old is not None:
+        # The classes that still inherit from the old class get the new parameters.
+        type.__setattr__(old, "_arg_dict", cls._arg_dict)
+        type.__setattr__(old, "_excluded_parent_args", cls._excluded_parent_args)
+        old._inherited_arguments.merged.clear()
+        # (the rest of a module that is executed again re-creates its own classes anyways)
+        _refresh(_matches({key}), skip_module=cls.__module__)
+
+
+def _function_created(
+        func: Callable,
+        template: Optional[str],
+        new_func: Callable,
+        star_excludes: set[str],
+        parser: ParameterParser,
+        update_signature: bool,
+        validate_calls: Union[bool, int, str],
+) -> None:
+    # Called after `doc_wrap` resolved a function.
+    key = _stats.stats_key(func)
+    if "<" in key or not _reloading():
+        return
+    if _has_replacements(template):
+        templates = _Templates(star_excludes, parser, update_signature, validate_calls)
+        templates.items["__doc__"] = (func, template)
+        new_func._docerator_templates = templates
+        _FUNCTIONS.add(new_func)
+    if _recreated(key, new_func) is not None:
+        _refresh(_matches({key}), skip_module=func.__module__)
+
+
+def _source_keys(cls: Optional[type], templates: _Templates) -> set[str]:
+    # The keys of the classes (and functions) that the resolved members were built from.
+    keys = set()
+    if cls is not None:
+        keys.update(_stats.stats_key(base) for base in cls.__mro__[1:-1] if "_arg_dict" in base.__dict__)
+    for _, template in templates.items.values():
+        for match in REPLACE_REGEX.finditer(template):
+            for item in ARG_SPLIT_REGEX.split(match.group("replace_key")):
+                source_name = item.rsplit(".", 1)[0]
+                if source_name != "super":
+                    try:
+                        keys.add(_stats.stats_key(_import_target(source_name)))
+                    except (ImportError, AttributeError, ValueError):
+                        pass
+    return keys
+
+
+def _refresh_class(cls: type) -> None:
+    templates = cls.__dict__.get("_docerator_templates")
+    if templates is None:
+        # nothing was resolved yet (e.g. a lazy class).
+        return
+    members = {}
+    for name, (item, template) in templates.items.items():
+        if name != "__doc__":
+            item.__doc__ = template
+            members[name] = item
+    options = (templates.star_excludes, templates.parser, templates.update_signature, templates.validate_calls)
+    _resolve_members(cls, members, *options)
+    if "__doc__" in templates.items:
+        init, template = templates.items["__doc__"]
+        if "__init__" not in members:
+            # put back the __init__ that the class docstring was resolved with.
+            if init is not _void:
+                type.__setattr__(cls, "__init__", init)
+            elif "__init__" in cls.__dict__:
+                type.__delattr__(cls, "__init__")
+        type.__setattr__(cls, "__doc__", template)
+        _resolve_class_doc(cls, *options)
+
+
+def _refresh_function(old_func: Callable) -> None:
+    templates = old_func._docerator_templates
+    func, template = templates.items["__doc__"]
+    func.__doc__ = template
+    new_func = _doc_wrap(
+        func, templates.star_excludes, templates.parser, update_signature=templates.update_signature,
+        validate_calls=templates.validate_calls,
+    )
+    if new_func is old_func:
+        return
+    # the templates move to the new function.
+    del old_func._docerator_templates
+    _FUNCTIONS.discard(old_func)
+    new_func._docerator_templates = templates
+    _FUNCTIONS.add(new_func)
+    # update the function that others may have already imported, and replace it in its module.
+    old_func.__doc__ = new_func.__doc__
+    if "__signature__" in old_func.__dict__:
+        old_func.__signature__ = new_func.__signature__
+    module = sys.modules.get(func.__module__)
+    if module is not None and getattr(module, func.__qualname__, None) is old_func:
+        setattr(module, func.__qualname__, new_func)
+
+
+def _refresh(changed: Callable[[str], bool], skip_module: Optional[str] = None) -> list[str]:
+    # Resolve everything that was built from a changed class or function again, then everything
+    # that was built from those, and so on. The direct dependents in `skip_module` are skipped.
+    global _REFRESHING
+    with _REFRESH_LOCK:
+        _REFRESHING += 1
+        try:
+            return _refresh_all(changed, skip_module, [])
+        finally:
+            _REFRESHING -= 1
+
+
+def _refresh_all(
+        changed: Callable[[str], bool], skip_module: Optional[str], refreshed: list[str]
+) -> list[str]:
+    done = set()
+    while True:
+        classes = [
+            cls for cls in list(_CLASSES)
+            if cls not in done and cls.__module__ != skip_module
+            and any(changed(key) for key in _class_sources(cls))
+        ]
+        functions = [
+            func for func in list(_FUNCTIONS)
+            if _stats.stats_key(func) not in done and func.__module__ != skip_module
+            and any(changed(source) for source in _source_keys(None, func._docerator_templates))
+        ]
+        if not classes and not functions:
+            return refreshed
+        # clear every merged dictionary first, they are built from each other.
+        for cls in classes:
+            if "_inherited_arguments" in cls.__dict__:
+                cls._inherited_arguments.merged.clear()
+        keys = set()
+        for cls in classes:
+            done.add(cls)
+            _refresh_class(cls)
+            keys.add(_stats.stats_key(cls))
+        for func in functions:
+            key = _stats.stats_key(func)
+            done.add(key)
+            _refresh_function(func)
+            keys.add(key)
+        refreshed += sorted(keys)
+        changed = _matches(keys)
+        skip_module = None
+
+
+def _class_sources(cls: type) -> set[str]:
+    templates = cls.__dict__.get("_docerator_templates")
+    if templates is None:
+        templates = _Templates(set(), None, True, True)
+    return _source_keys(cls, templates)
+
+
+def refresh(*modules: Union[str, ModuleType]) -> list[str]:
+    """Resolve the docstrings and signatures that were built from the given modules again.
+
+    Classes that inherit from, and members that pull parameters from the classes (or
+    functions) of these modules are resolved again with their current parameters, as are the
+    classes and functions that were built from those, and so on.
+
+    Only the classes and functions that were created while reloading is enabled (see
+    `enable_reloading`) can be resolved again. This happens automatically when a class is created
+    again with the same module and qualified name, for example when its module is reloaded with
+    `importlib.reload` or IPython's ``%autoreload``. Call this after changing things that
+    docerator can not notice, such as the docstring of a plain function that is used as a
+    replacement target.
+
+    Parameters
+    ----------
+    *modules : str or module
+        The modules (or their names) that changed.
+
+    Returns
+    -------
+    list of str
+        The ``"module:qualname"`` of every class and function that was resolved again.
+    """
+    names = {module if isinstance(module, str) else module.__name__ for module in modules}
+    return _refresh(lambda source: source.partition(":")[0] in names)
+
+
+def reclaim(*modules: Union[str, ModuleType]) -> list[str]:
+    """Release the memory that docerator only needs while classes are being created.
+
+    Each class created by `DoceratorMeta` keeps the parsed parameters of its methods (its
+    ``_arg_dict``), the parameters merged over its ancestors, its docstring templates from before
+    the replacements (while reloading is enabled), and the text each parser formatted its
+    parameters as. They are only needed
+    to create (or resolve) its subclasses, and to resolve its own members again. This drops them
+    from every class (or the classes of the given modules) that no class with unresolved lazy
+    members inherits from, as well as the parsers' caches of parsed docstrings, the cached
+    signatures of functions, and the table that parameters share their descriptions through.
+
+    The docstrings and signatures stay resolved. Parameters that are needed again later, for
+    example to create another subclass, are parsed again from the original docstrings, so calling
+    this in the middle of importing a package only costs time. Without their templates, released
+    classes are no longer resolved again by `refresh` (or when a module they are built from is
+    reloaded), but the classes that are created from them later still are.
+
+    Parameters
+    ----------
+    *modules : str or module
+        Only release the classes of these modules (or their names). Defaults to every class.
+
+    Returns
+    -------
+    list of str
+        The ``"module:qualname"`` of every class that was released.
+    """
+    names = {module if isinstance(module, str) else module.__name__ for module in modules}
+    classes = list(_CLASSES)
+    # the classes that lazy classes still need to resolve their members.
+    needed = set()
+    for cls in classes:
+        if any(type(item) is _LazyMember for item in list(cls.__dict__.values())):
+            needed.update(cls.__mro__)
+    released = []
+    for cls in classes:
+        if cls in needed or (names and cls.__module__ not in names):
+            continue
+        arguments = cls.__dict__.get("_arg_dict")
+        if isinstance(arguments, _ArgumentDict):
+            arguments.release()
+        if "_inherited_arguments" in cls.__dict__:
+            for merged in cls._inherited_arguments.merged.values():
+                _forget_formatted(merged.values())
+            cls._inherited_arguments.merged.clear()
+        for item in list(cls.__dict__.values()):
+            if isinstance(item, (classmethod, staticmethod)):
+                item = item.__func__
+            if inspect.isfunction(item) and isinstance(item.__dict__.get("__signature__"), inspect.Signature):
+                _forget_formatted(item.__signature__.parameters.values())
+        for name in ("_DoceratorMeta__old_doc", "_docerator_templates"):
+            if name in cls.__dict__:
+                type.__delattr__(cls, name)
+        released.append(_stats.stats_key(cls))
+    for parser in set(PARSERS.values()):
+        parser.cache_clear()
+    _SIGNATURE_CACHE.clear()
+    _params._DESCRIPTIONS.clear()
+    return sorted(released)
+
+
+def _forget_formatted(params: Iterable[inspect.Parameter]) -> None:
+    # drop the text that the parsers formatted these parameters as (it is formatted again if needed).
+    for param in params:
+        if isinstance(param, DescribedParameter):
+            param._formatted = None
+
 
-# Could also add this functionality as a wrapper for a class.
+if os.environ.get("DOCERATOR_RELOAD", "0") not in ("", "0"):
+    enable_reloading()
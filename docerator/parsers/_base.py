@@ -1,12 +1,91 @@
+import functools
 import inspect
 import abc
 from typing import Any, Optional, Union
 
 from docerator import get_debug_level, DoceratorParsingError
+from docerator._base import CacheInfo, _LRUCache, signature as _signature
 from docerator._params import DescribedParameter
 
+DEFAULT_CACHE_SIZE = 1024
+
+
+def _cached_parser(parser):
+    # Wrap a `doc_parameter_parser` implementation to look its results up in the cache of the
+    # class it is called on, keyed by the cleaned docstring.
+    @functools.wraps(parser)
+    def doc_parameter_parser(cls, docstring):
+        cache = cls._parse_cache
+        if cache.maxsize <= 0:
+            return parser(cls, docstring)
+        # The debug level decides whether problems with the docstring raise errors.
+        key = (inspect.cleandoc(docstring), get_debug_level())
+        table = cache.get(key)
+        if table is None:
+            table = parser(cls, docstring)
+            cache.put(key, table)
+        # callers are free to modify the table they get.
+        return dict(table)
+
+    return doc_parameter_parser
+
+
+def _cached_formatter(formatter):
+    # Wrap a `format_parameter` implementation to keep its results on the (first) parameter it
+    # formats, keyed by the class it is called on (and the names of a group of parameters).
+    @functools.wraps(formatter)
+    def format_parameter(cls, param):
+        if isinstance(param, DescribedParameter):
+            first, key = param, cls
+        elif param and isinstance(param[0], DescribedParameter):
+            first, key = param[0], (cls, tuple(par.name for par in param))
+        else:
+            return formatter(cls, param)
+        formatted = first._formatted
+        if formatted is None:
+            formatted = first._formatted = {}
+        text = formatted.get(key)
+        if text is None:
+            text = formatted[key] = formatter(cls, param)
+        return text
+
+    return format_parameter
+
 
 class ParameterParser(metaclass=abc.ABCMeta):
+    """Base class of the docstring parsers.
+
+    The results of each subclass's `doc_parameter_parser` are kept in a least recently used cache,
+    keyed by the cleaned docstring, so identical docstrings are only parsed once. The results of
+    its `format_parameter` are kept on the formatted parameters, so a parameter that is inserted
+    into many docstrings is only formatted once. They must only depend on the names, type
+    descriptions and long descriptions of the parameters.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._parse_cache = _LRUCache(DEFAULT_CACHE_SIZE)
+        parser = cls.__dict__.get("doc_parameter_parser")
+        if isinstance(parser, classmethod) and not getattr(parser, "__isabstractmethod__", False):
+            cls.doc_parameter_parser = classmethod(_cached_parser(parser.__func__))
+        formatter = cls.__dict__.get("format_parameter")
+        if isinstance(formatter, classmethod) and not getattr(formatter, "__isabstractmethod__", False):
+            cls.format_parameter = classmethod(_cached_formatter(formatter.__func__))
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int) -> None:
+        """Set the number of parsed docstrings to keep in this parser's cache (0 disables it)."""
+        cls._parse_cache.resize(maxsize)
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """The hits, misses, maximum size and current size of this parser's cache."""
+        return cls._parse_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Empty this parser's cache, and reset its statistics."""
+        cls._parse_cache.clear()
 
     @classmethod
     @abc.abstractmethod
@@ -19,16 +98,36 @@ class ParameterParser(metaclass=abc.ABCMeta):
         ...
 
     @classmethod
-    def parse_parameters(cls, method: Any) -> dict[str, DescribedParameter]:
+    def parse_parameters(
+            cls,
+            method: Any,
+            described_params: Optional[dict[str, tuple[Optional[str], Optional[str]]]] = None,
+    ) -> dict[str, DescribedParameter]:
+        """Parse the described parameters of a method and combine them with its signature.
+
+        Parameters
+        ----------
+        method : callable
+        described_params : dict[str, tuple[str|None, str|None]], optional
+            The already parsed descriptions of `method`'s docstring, as returned by
+            `doc_parameter_parser`. If not given, `method`'s docstring is parsed.
 
-        docstring = method.__doc__
+        Returns
+        -------
+        dict[str, DescribedParameter]
+        """
         # build a dictionary of argument names and their corresponding Parameter
         out_dict = {}
-        if not docstring:
-            return out_dict
-        described_params = cls.doc_parameter_parser(docstring)
+        if described_params is None:
+            docstring = method.__doc__
+            if not docstring:
+                return out_dict
+            described_params = cls.doc_parameter_parser(docstring)
+        else:
+            # make a copy, we pop items out of it below.
+            described_params = dict(described_params)
 
-        signature = inspect.signature(method)
+        signature = _signature(method)
         func_params = signature.parameters
 
         # First, add all the parameters from my call signature that were described.
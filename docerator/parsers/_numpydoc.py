@@ -40,6 +40,14 @@ for section in _numpydoc_sections:
 NUMPY_SECTION_REGEX: re.Pattern = re.compile(
     rf"^(?P<summary>[\s\S]+?)??{'?'.join(_section_regexs)}?$"
 )
+# Candidate section headers for the single pass section scanner: a section name on its own line,
+# followed by a line of hyphens.
+NUMPY_SECTION_HEADER_REGEX: re.Pattern = re.compile(
+    rf"^({'|'.join(re.escape(section) for section in _numpydoc_sections)})\n(-+)\n", re.MULTILINE
+)
+_SECTION_INDEX = {section: index for index, section in enumerate(_numpydoc_sections)}
+_LAST_PARAMETER_SECTION = max(_SECTION_INDEX["Parameters"], _SECTION_INDEX["Other Parameters"])
+
 # Next parses for "arg : type" items.
 NUMPY_ARG_TYPE_REGEX: re.Pattern = re.compile(
     r"^(?P<arg_name>\S.*?)(?:\s*:\s*(?P<type>.*?))?$", re.MULTILINE
@@ -49,6 +57,50 @@ NUMPY_ARG_TYPE_REGEX: re.Pattern = re.compile(
 NUMPY_ARG_SPLIT_REGEX: re.Pattern = re.compile(r"\s*,\s*")
 
 
+def _scan_parameter_sections(docstring: str) -> tuple[Optional[str], Optional[str]]:
+    """Find the contents of the Parameters and Other Parameters sections of a cleaned docstring.
+
+    This gives the same contents for those sections as `NUMPY_SECTION_REGEX`, but in a single
+    pass over the section headers, and stops once it is past the Other Parameters section.
+
+    Parameters
+    ----------
+    docstring : str
+
+    Returns
+    -------
+    parameters, other_parameters : str or None
+        The contents of the sections, or None if the section was not found.
+    """
+    contents = {}
+    current = None
+    current_index = -1
+    content_start = 0
+    for match in NUMPY_SECTION_HEADER_REGEX.finditer(docstring):
+        section, hyphens = match.groups()
+        index = _SECTION_INDEX[section]
+        start = match.start()
+        # Sections must be in order, and the hyphen line must match the length of the name.
+        if index <= current_index or len(hyphens) != len(section):
+            continue
+        # The new line before a header cannot be the one that ended the previous header.
+        if current is not None:
+            if start - 1 < content_start:
+                continue
+            contents[current] = docstring[content_start:start - 1]
+        current = section
+        current_index = index
+        content_start = match.end()
+        if current_index > _LAST_PARAMETER_SECTION:
+            break
+    else:
+        if current is not None:
+            # The last section runs to the end (excluding a trailing new line).
+            end = len(docstring) - 1 if docstring.endswith("\n") else len(docstring)
+            contents[current] = docstring[content_start:end]
+    return contents.get("Parameters"), contents.get("Other Parameters")
+
+
 def _pairwise(iterable):
     a, b = itertools.tee(iterable)
     next(b, None)
@@ -73,8 +125,7 @@ class NumpydocParser(ParameterParser):
              type descriptions and long descriptions.
         """
         docstring = inspect.cleandoc(docstring)
-        doc_sections = NUMPY_SECTION_REGEX.search(docstring).groupdict()
-        parameters = doc_sections.get("parameters")
+        parameters, others = _scan_parameter_sections(docstring)
         debug_level = get_debug_level()
         if parameters is None:
             if debug_level and "Parameters\n-" in docstring:
@@ -85,7 +136,6 @@ class NumpydocParser(ParameterParser):
                 )
             parameters = ""
 
-        others = doc_sections.get("other_parameters")
         if debug_level and others is None and "Other Parameters\n-" in docstring:
             raise DoceratorParsingError(
                 "Unable to parse docstring for other parameters section, but it looks like there "
@@ -0,0 +1,158 @@
+"""Profile the import time docerator adds to a package.
+
+Usage::
+
+    python -m docerator.profile <package> [--limit N] [--no-submodules]
+
+The package (and by default every one of its submodules) is imported in a fresh interpreter
+with docerator's statistics enabled (see `docerator.enable_stats`). The time docerator spent
+on each module and class is then reported next to the total import time, worst offenders first.
+"""
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+# Run in the fresh interpreter as ``python -c _SCRIPT package output submodules``.
+_SCRIPT = """\
+import importlib, json, pkgutil, sys, time
+
+package_name, output, submodules = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+import docerator
+
+failed = []
+start = time.perf_counter()
+package = importlib.import_module(package_name)
+if submodules and hasattr(package, "__path__"):
+    for module_info in pkgutil.walk_packages(package.__path__, package_name + ".", failed.append):
+        try:
+            importlib.import_module(module_info.name)
+        except Exception:
+            failed.append(module_info.name)
+import_time = time.perf_counter() - start
+
+with open(output, "w") as f:
+    json.dump({"import_time": import_time, "failed": failed, "stats": docerator.stats()}, f)
+"""
+
+# The phases reported for each class, besides its own total.
+PHASES = ("parse", "mro_merge", "target_import", "replace", "signature")
+
+
+def profile_package(package_name: str, submodules: bool = True) -> dict:
+    """Import a package in a fresh interpreter, recording docerator's statistics.
+
+    Parameters
+    ----------
+    package_name : str
+        The importable name of the package (or module) to profile.
+    submodules : bool, optional
+        Whether to also import every submodule of the package.
+
+    Returns
+    -------
+    dict
+        The total ``"import_time"`` in seconds, the submodules that ``"failed"`` to import, and
+        the ``"stats"`` as returned by `docerator.stats` in the fresh interpreter.
+    """
+    env = dict(os.environ)
+    env["DOCERATOR_STATS"] = "1"
+    # make sure the fresh interpreter uses this copy of docerator.
+    docerator_path = str(pathlib.Path(__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [docerator_path, env.get("PYTHONPATH")]))
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "profile.json")
+        subprocess.run(
+            [sys.executable, "-c", _SCRIPT, package_name, output, "1" if submodules else "0"],
+            env=env, check=True,
+        )
+        with open(output) as f:
+            return json.load(f)
+
+
+def summarize(result: dict) -> tuple[list[dict], list[dict]]:
+    """Break down the docerator time of a `profile_package` result by module and by class.
+
+    The time of each class excludes its ``"target_import"`` phase, as importing the targets of
+    its replacement keys can create (and so also count) the classes of other modules.
+
+    Returns
+    -------
+    modules : list of dict
+        The ``"module"``, its total docerator ``"time"`` and number of ``"classes"``.
+    classes : list of dict
+        The ``"module"``, ``"name"``, total docerator ``"time"`` and the time of each phase of
+        every class or function.
+
+    Both lists are sorted by time, largest first.
+    """
+    classes = []
+    for key, phases in result["stats"].items():
+        module, _, name = key.partition(":")
+        row = {name: phases.get(name, {"time": 0.0})["time"] for name in PHASES}
+        total = phases.get("total", {"time": 0.0})["time"]
+        row.update(module=module, name=name, time=total - row["target_import"])
+        classes.append(row)
+    classes.sort(key=lambda row: row["time"], reverse=True)
+
+    modules = {}
+    for row in classes:
+        module = modules.setdefault(row["module"], {"module": row["module"], "time": 0.0, "classes": 0})
+        module["time"] += row["time"]
+        module["classes"] += 1
+    return sorted(modules.values(), key=lambda row: row["time"], reverse=True), classes
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}"
+
+
+def format_report(result: dict, limit: Optional[int] = 20) -> str:
+    """Format a `profile_package` result as a plain text report."""
+    modules, classes = summarize(result)
+    import_time = result["import_time"]
+    docerator_time = sum(row["time"] for row in modules)
+    share = docerator_time / import_time if import_time else 0.0
+    lines = [
+        f"Total import time: {_ms(import_time)} ms",
+        f"Time in docerator: {_ms(docerator_time)} ms ({share:.1%})",
+    ]
+    for name in result["failed"]:
+        lines.append(f"Unable to import {name}")
+
+    lines += ["", f"{'ms':>10} {'share':>7} {'classes':>8}  module"]
+    for row in modules[:limit]:
+        share = row["time"] / import_time if import_time else 0.0
+        lines.append(f"{_ms(row['time']):>10} {share:>7.1%} {row['classes']:>8}  {row['module']}")
+
+    header = "".join(f" {name:>13}" for name in PHASES)
+    lines += ["", f"{'ms':>10}{header}  class"]
+    for row in classes[:limit]:
+        phases = "".join(f" {_ms(row[name]):>13}" for name in PHASES)
+        lines.append(f"{_ms(row['time']):>10}{phases}  {row['module']}.{row['name']}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m docerator.profile",
+        description="Report the import time docerator adds to each module and class of a package.",
+    )
+    parser.add_argument("package", help="The importable name of the package to profile.")
+    parser.add_argument("--limit", type=int, default=20, help="The number of modules and classes to list.")
+    parser.add_argument(
+        "--no-submodules", dest="submodules", action="store_false",
+        help="Only import the package itself, not all of its submodules.",
+    )
+    args = parser.parse_args(argv)
+    result = profile_package(args.package, submodules=args.submodules)
+    print(format_report(result, limit=args.limit))
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
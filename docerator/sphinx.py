@@ -0,0 +1,78 @@
+"""A Sphinx extension that keeps docerator's work in the Sphinx build environment.
+
+Add ``"docerator.sphinx"`` to the ``extensions`` in your ``conf.py``. The parameter tables,
+resolved docstrings and signatures of every class (and function wrapped with `doc_wrap`) imported
+while reading the documents are then stored in the (pickled) Sphinx environment. On the next
+build, a class is only resolved again if the source of its module, or of any module its
+docstrings were built from (e.g. the modules of its ancestors), changed. The same modules are
+recorded as dependencies of the documents that describe the class, so that Sphinx also re-reads
+those documents when a parent class changes.
+
+This uses the same entries as ``python -m docerator freeze``, see `docerator._freeze`. The
+extension is safe for parallel reading and writing (``sphinx-build -j``): the entries recorded
+by each reading process are merged back into the main environment.
+
+Classes that are imported before the builder is initialized (e.g. in ``conf.py``) are resolved
+as usual.
+"""
+import sys
+
+from docerator import _freeze
+from docerator._disk_cache import docerator_fingerprint
+
+# Bump this whenever the stored data changes in an incompatible way.
+ENV_VERSION = 1
+
+
+def _env_modules(env) -> dict:
+    modules = getattr(env, "docerator_modules", None)
+    if modules is None or getattr(env, "docerator_fingerprint", None) != docerator_fingerprint():
+        modules = env.docerator_modules = {}
+        env.docerator_fingerprint = docerator_fingerprint()
+    return modules
+
+
+def _builder_inited(app) -> None:
+    _freeze.supply(_env_modules(app.env))
+    _freeze.start_recording()
+
+
+def _store_recorded(app, *args) -> None:
+    # Called after each document is read, so that a parallel reading process sends its
+    # entries back together with its environment. Only the modules whose entries changed since
+    # the previous document are frozen again.
+    _env_modules(app.env).update(_freeze.recorded(changed_only=True))
+
+
+def _merge_info(app, env, docnames, other) -> None:
+    _env_modules(env).update(_env_modules(other))
+
+
+def _note_dependencies(app, what, name, obj, options, lines) -> None:
+    module_name = getattr(obj, "__module__", None)
+    if not isinstance(module_name, str):
+        return
+    for dependency in sorted(_freeze.dependencies(module_name)):
+        path = getattr(sys.modules.get(dependency), "__file__", None)
+        if path is not None:
+            app.env.note_dependency(path)
+
+
+def _build_finished(app, exception) -> None:
+    # (the environment was already saved, entries are stored when each document is read)
+    _freeze.stop_recording()
+
+
+def setup(app) -> dict:
+    app.setup_extension("sphinx.ext.autodoc")
+    app.connect("builder-inited", _builder_inited)
+    app.connect("doctree-read", _store_recorded)
+    app.connect("env-merge-info", _merge_info)
+    app.connect("autodoc-process-docstring", _note_dependencies)
+    app.connect("build-finished", _build_finished)
+    return {
+        "version": docerator_fingerprint(),
+        "env_version": ENV_VERSION,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,399 @@
+"""Resolve docstrings and signatures from source code, without importing it.
+
+Usage::
+
+    python -m docerator.static <module> [--path DIR ...]
+
+The source of a module is parsed with `ast`, and every class that uses `DoceratorMeta` (directly,
+or through one of its bases) and every function decorated with `doc_wrap` is rebuilt as a
+stand-in: a class (or function) with the same name, docstrings and signatures, but without any
+of the code. The stand-ins are then resolved by `DoceratorMeta` and `doc_wrap` themselves, so the
+results match what the real modules would give. Bases and ``%(module.Class.arg)`` targets are
+looked up in the source of the modules they come from, which are found the same way ``import``
+finds them (on `sys.path`, or the given paths), but are never executed.
+
+Defaults and annotations that are not literals are represented by a `SourceExpression` of their
+source text. Classes and functions whose source can not be found (e.g. from extension modules)
+are left out of the bases and can not be used as targets.
+"""
+import argparse
+import ast
+import importlib.machinery
+import inspect
+import sys
+import tokenize
+from typing import Any, NamedTuple, Optional
+
+from docerator.doc_inherit import _STATIC_TARGETS, DoceratorMeta, _doc_wrap
+from docerator.parsers import PARSERS
+
+__all__ = ["SourceExpression", "StaticDoc", "StaticResolver", "resolve_module"]
+
+
+class StaticDoc(NamedTuple):
+    """The resolved docstring and signature of a class or function."""
+    doc: Optional[str]
+    signature: Optional[inspect.Signature]
+
+
+class SourceExpression:
+    """A default value or annotation that is not a literal, represented by its source."""
+
+    __slots__ = ("source", )
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def __repr__(self) -> str:
+        return self.source
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SourceExpression) and other.source == self.source
+
+    def __hash__(self) -> int:
+        return hash(self.source)
+
+
+class _ModuleRef(NamedTuple):
+    name: str
+
+
+# A definition that is being built, to detect circular references.
+_BUILDING = object()
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_DECORATORS = {"staticmethod": staticmethod, "classmethod": classmethod, "property": property}
+
+
+def _runtime_doc(node: ast.AST) -> Optional[str]:
+    doc = ast.get_docstring(node, clean=False)
+    if doc is None:
+        return None
+    # Compile it, as some versions of python clean docstrings up when compiling them (and keep
+    # it even under ``python -OO``).
+    namespace = {}
+    exec(compile(f"def f():\n    {doc!r}\n", "<docstring>", "exec", optimize=0), namespace)
+    return namespace["f"].__doc__
+
+
+def _value(node: Optional[ast.expr]) -> Any:
+    if node is None:
+        return inspect.Parameter.empty
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return SourceExpression(ast.unparse(node))
+
+
+def _annotation(node: Optional[ast.expr]) -> Any:
+    if node is None:
+        return inspect.Parameter.empty
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        # string annotations are kept as strings.
+        return node.value
+    return SourceExpression(ast.unparse(node))
+
+
+def _signature(node: ast.FunctionDef) -> inspect.Signature:
+    P = inspect.Parameter
+    arguments = node.args
+    parameters = []
+    positional = arguments.posonlyargs + arguments.args
+    defaults = [None] * (len(positional) - len(arguments.defaults)) + arguments.defaults
+    for i, (arg, default) in enumerate(zip(positional, defaults)):
+        kind = P.POSITIONAL_ONLY if i < len(arguments.posonlyargs) else P.POSITIONAL_OR_KEYWORD
+        parameters.append(P(arg.arg, kind, default=_value(default), annotation=_annotation(arg.annotation)))
+    if arguments.vararg is not None:
+        parameters.append(P(arguments.vararg.arg, P.VAR_POSITIONAL, annotation=_annotation(arguments.vararg.annotation)))
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        parameters.append(P(arg.arg, P.KEYWORD_ONLY, default=_value(default), annotation=_annotation(arg.annotation)))
+    if arguments.kwarg is not None:
+        parameters.append(P(arguments.kwarg.arg, P.VAR_KEYWORD, annotation=_annotation(arguments.kwarg.annotation)))
+    return inspect.Signature(parameters, return_annotation=_annotation(node.returns))
+
+
+def _stub_function(node: ast.FunctionDef, module_name: str, qualname: str):
+    def stub(*args, **kwargs):
+        raise TypeError(f"{qualname} is a stand-in built from source, and can not be called.")
+
+    stub.__name__ = node.name
+    stub.__qualname__ = qualname
+    stub.__module__ = module_name
+    stub.__doc__ = _runtime_doc(node)
+    stub.__signature__ = _signature(node)
+    return stub
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _keywords(node: ast.Call, names: tuple[str, ...]) -> dict[str, Any]:
+    # The literal arguments of a call, with its positional arguments named by `names`.
+    values = {}
+    arguments = [(name, arg) for name, arg in zip(names, node.args)]
+    arguments += [(keyword.arg, keyword.value) for keyword in node.keywords if keyword.arg is not None]
+    for name, arg in arguments:
+        try:
+            values[name] = ast.literal_eval(arg)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            pass
+    return values
+
+
+class _SourceModule:
+    """The definitions and imports at the top level of a module's source."""
+
+    def __init__(self, resolver: "StaticResolver", name: str, filename: str, is_package: bool) -> None:
+        self.resolver = resolver
+        self.name = name
+        self.package = name if is_package else name.rpartition(".")[0]
+        with tokenize.open(filename) as f:
+            self.tree = ast.parse(f.read(), filename)
+        self.definitions: dict[str, ast.AST] = {}
+        self.imports: dict[str, tuple] = {}
+        self.objects: dict[str, Any] = {}
+        for node in self.tree.body:
+            if isinstance(node, (ast.ClassDef, *_FUNCTION_NODES)):
+                self.definitions[node.name] = node
+                self.imports.pop(node.name, None)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname is not None:
+                        self.imports[alias.asname] = ("module", alias.name)
+                    else:
+                        top = alias.name.partition(".")[0]
+                        self.imports[top] = ("module", top)
+                    self.definitions.pop(alias.asname or alias.name.partition(".")[0], None)
+            elif isinstance(node, ast.ImportFrom):
+                module = self._absolute(node.module, node.level)
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.imports[alias.asname or alias.name] = ("from", module, alias.name)
+                        self.definitions.pop(alias.asname or alias.name, None)
+
+    def _absolute(self, module: Optional[str], level: int) -> str:
+        if not level:
+            return module
+        package = self.package
+        for _ in range(level - 1):
+            package = package.rpartition(".")[0]
+        return f"{package}.{module}" if module else package
+
+    def lookup(self, name: str) -> Any:
+        """The (stand-in) object bound to `name` in this module, or None if it is unknown."""
+        obj = self.objects.get(name)
+        if obj is _BUILDING:
+            raise ImportError(f"circular definition of {self.name}.{name}")
+        if obj is not None:
+            return obj
+        node = self.definitions.get(name)
+        if node is not None:
+            self.objects[name] = _BUILDING
+            try:
+                obj = self._build(node)
+            finally:
+                self.objects.pop(name)
+            self.objects[name] = obj
+            return obj
+        imported = self.imports.get(name)
+        if imported is None:
+            return None
+        if imported[0] == "module":
+            return _ModuleRef(imported[1])
+        return self.resolver.attribute(imported[1], imported[2])
+
+    def evaluate(self, node: ast.expr) -> Any:
+        """The object a (dotted) name refers to, or None if it is unknown."""
+        if isinstance(node, ast.Name):
+            return self.lookup(node.id)
+        if isinstance(node, ast.Attribute):
+            value = self.evaluate(node.value)
+            if isinstance(value, _ModuleRef):
+                return self.resolver.attribute(value.name, node.attr)
+            if isinstance(value, type):
+                return getattr(value, node.attr, None)
+        return None
+
+    def _build(self, node: ast.AST) -> Any:
+        if isinstance(node, ast.ClassDef):
+            return self._build_class(node)
+        func = _stub_function(node, self.name, node.name)
+        for decorator in node.decorator_list:
+            if _decorator_name(decorator) == "doc_wrap":
+                options = {}
+                if isinstance(decorator, ast.Call):
+                    options = _keywords(decorator, ("doc_style", "star_excludes", "update_signature"))
+                star_excludes = set(options.get("star_excludes") or ())
+                parser = PARSERS[options.get("doc_style") or "numpydoc"]
+                func = _doc_wrap(
+                    func, star_excludes, parser, update_signature=options.get("update_signature", True),
+                    validate_calls=False,
+                )
+        return func
+
+    def _build_class(self, node: ast.ClassDef) -> type:
+        bases = []
+        for base in node.bases:
+            base = self.evaluate(base)
+            if isinstance(base, type):
+                bases.append(base)
+        uses_docerator = any(isinstance(base, DoceratorMeta) for base in bases)
+        kwargs = {}
+        for keyword in node.keywords:
+            if keyword.arg == "metaclass":
+                uses_docerator |= _decorator_name(keyword.value) == "DoceratorMeta"
+            elif keyword.arg is not None:
+                try:
+                    kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+                except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                    pass
+
+        namespace = {"__module__": self.name, "__qualname__": node.name}
+        doc = _runtime_doc(node)
+        if doc is not None:
+            namespace["__doc__"] = doc
+        for item in node.body:
+            if isinstance(item, _FUNCTION_NODES):
+                member = _stub_function(item, self.name, f"{node.name}.{item.name}")
+                for decorator in reversed(item.decorator_list):
+                    wrap = _DECORATORS.get(_decorator_name(decorator))
+                    if wrap is not None:
+                        member = wrap(member)
+                namespace[item.name] = member
+
+        if not uses_docerator:
+            return type(node.name, tuple(bases), namespace)
+        # everything is resolved right away, and nothing needs to be called.
+        kwargs.update(lazy=False, validate_calls=False)
+        return DoceratorMeta(node.name, tuple(bases), namespace, **kwargs)
+
+
+class StaticResolver:
+    """Resolves the docstrings and signatures of modules from their source.
+
+    Parameters
+    ----------
+    path : list of str, optional
+        The directories to find modules in. Defaults to `sys.path`.
+    """
+
+    def __init__(self, path: Optional[list[str]] = None) -> None:
+        self.path = path
+        self._modules: dict[str, Optional[_SourceModule]] = {}
+
+    def module(self, name: str) -> Optional[_SourceModule]:
+        """The parsed source of a module, or None if it can not be found."""
+        if name not in self._modules:
+            self._modules[name] = self._find(name)
+        return self._modules[name]
+
+    def _find(self, name: str) -> Optional[_SourceModule]:
+        search = self.path if self.path is not None else sys.path
+        spec = None
+        parts = name.split(".")
+        for i in range(len(parts)):
+            if search is None:
+                return None
+            spec = importlib.machinery.PathFinder.find_spec(".".join(parts[:i + 1]), search)
+            if spec is None:
+                return None
+            search = spec.submodule_search_locations
+        if spec.origin is None or not spec.origin.endswith(".py"):
+            return None
+        return _SourceModule(self, name, spec.origin, spec.submodule_search_locations is not None)
+
+    def attribute(self, module_name: str, name: str) -> Any:
+        """The (stand-in) object `name` of a module, which may also be a submodule."""
+        module = self.module(module_name)
+        obj = None if module is None else module.lookup(name)
+        if obj is None and self.module(f"{module_name}.{name}") is not None:
+            obj = _ModuleRef(f"{module_name}.{name}")
+        return obj
+
+    def _target(self, source_name: str) -> Any:
+        # The static version of `doc_inherit._resolve_target`.
+        module_name, _, name = source_name.rpartition(".")
+        if not module_name:
+            raise ValueError(
+                f"{source_name} does not include the module information. "
+                f"Should be included as module.to.import.from.{source_name}"
+            )
+        module = self.module(module_name)
+        if module is not None:
+            target = module.lookup(name)
+            if target is None or isinstance(target, _ModuleRef):
+                raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+            return target
+        module_name, _, class_name = module_name.rpartition(".")
+        module = None if not module_name else self.module(module_name)
+        target = None if module is None else module.lookup(class_name)
+        if not isinstance(target, type):
+            raise ImportError(f"Unable to import class {source_name} for docstring replacement")
+        return getattr(target, name)
+
+    def resolve(self, module_name: str) -> dict[str, StaticDoc]:
+        """Resolve every docerator class and function of a module.
+
+        Returns
+        -------
+        dict[str, StaticDoc]
+            The docstring and signature of every class using `DoceratorMeta`, of the methods
+            defined in those classes, and of every function decorated with `doc_wrap`, by their
+            qualified names.
+        """
+        module = self.module(module_name)
+        if module is None:
+            raise ImportError(f"Unable to find the source of {module_name}")
+        token = _STATIC_TARGETS.set(self._target)
+        try:
+            resolved = {}
+            for name, node in module.definitions.items():
+                obj = module.lookup(name)
+                if isinstance(obj, DoceratorMeta):
+                    resolved[name] = StaticDoc(obj.__doc__, inspect.signature(obj))
+                    for item in node.body:
+                        if isinstance(item, _FUNCTION_NODES):
+                            member = obj.__dict__[item.name]
+                            if inspect.isfunction(member):
+                                resolved[member.__qualname__] = StaticDoc(member.__doc__, inspect.signature(member))
+                elif inspect.isfunction(obj) and any(
+                        _decorator_name(decorator) == "doc_wrap" for decorator in node.decorator_list
+                ):
+                    resolved[name] = StaticDoc(obj.__doc__, inspect.signature(obj))
+            return resolved
+        finally:
+            _STATIC_TARGETS.reset(token)
+
+
+def resolve_module(module_name: str, path: Optional[list[str]] = None) -> dict[str, StaticDoc]:
+    """Resolve every docerator class and function of a module from source, see `StaticResolver.resolve`."""
+    return StaticResolver(path).resolve(module_name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m docerator.static",
+        description="Print the resolved docstrings and signatures of a module, without importing it.",
+    )
+    parser.add_argument("module", help="The importable name of the module.")
+    parser.add_argument(
+        "--path", action="append", help="A directory to find modules in (instead of sys.path), can be repeated."
+    )
+    args = parser.parse_args(argv)
+    for qualname, (doc, signature) in resolve_module(args.module, args.path).items():
+        print(f"{qualname}{signature}")
+        if doc:
+            print(inspect.cleandoc(doc))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
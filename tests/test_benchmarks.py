@@ -0,0 +1,69 @@
+import inspect
+import json
+import sys
+
+import pytest
+
+benchmarks = pytest.importorskip("benchmarks.run")
+from benchmarks import compare, synthetic
+
+
+def test_synthetic_hierarchy():
+    module = synthetic.build_module(
+        "_docerator_synthetic_test", synthetic.hierarchy_source(depth=3, width=2, n_params=2)
+    )
+    try:
+        leaf = module.C1_2
+        params = inspect.signature(leaf).parameters
+        assert list(params) == ["p2_0", "p2_1", "p0_0", "p0_1", "p1_0", "p1_1"]
+        assert "p0_1 : int, optional" in leaf.__doc__
+        assert "x : int, optional" in leaf.compute.__doc__
+    finally:
+        del sys.modules["_docerator_synthetic_test"]
+
+
+def test_benchmark_suite(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    argv = ["--depth", "2", "--width", "2", "--params", "2", "--repeat", "1", "--parse-params", "10",
+            "--memory-classes", "40", "--quick"]
+    benchmarks.main(argv + ["--output", str(output)])
+    results = json.loads(output.read_text())
+    assert set(results["results"]) == {
+        "class_creation", "class_creation_lazy", "parse", "calls", "chain", "chain_per_level", "memory", "threads"
+    }
+    assert set(results["results"]["chain_per_level"]) == {"True", "outermost", "False"}
+    assert results["results"]["class_creation"]["n_classes"] == 4
+    assert results["results"]["memory"]["n_classes"] == 40
+    assert results["results"]["memory"]["reclaimed_retained_bytes"] < results["results"]["memory"]["retained_bytes"]
+    assert set(results["results"]["threads"]["threads"]) == {"1", "2", "4"}
+
+    compared = compare.compare(results, results)
+    assert all(ratio == 1 for _, _, ratio in compared.values() if _)
+    compare.main([str(output), str(output)])
+    assert "class_creation.time" in capsys.readouterr().out
+
+
+def test_memory_baseline(tmp_path, capsys):
+    from benchmarks import bench_memory
+
+    output = tmp_path / "memory.json"
+    bench_memory.main(["--classes", "40", "--output", str(output)])
+    usage = json.loads(output.read_text())["results"]["memory"]
+    # the plain classes are kept alive while they are measured.
+    assert usage["plain_retained_bytes"] > 40 * 1000
+    assert usage["reclaimed_retained_bytes"] < usage["retained_bytes"]
+
+    compared = bench_memory.compare_to_baseline(usage, {"results": {"memory": usage}})
+    assert compared["retained_vs_baseline"] == 1
+    assert compared["overhead_vs_baseline"] == 1
+    # after reclaim is compared against what the baseline retains by default.
+    assert compared["reclaimed_vs_baseline"] == usage["reclaimed_retained_bytes"] / usage["retained_bytes"]
+    assert compared["reclaimed_overhead_vs_baseline"] == (
+        usage["reclaimed_bytes_per_class"] / usage["bytes_per_class"]
+    )
+    bench_memory.main(["--classes", "40", "--baseline", str(output)])
+    out = capsys.readouterr().out
+    assert "reclaimed_vs_baseline" in out
+    assert "compared to the baseline's default" in out
+    with pytest.raises(ValueError):
+        bench_memory.compare_to_baseline(dict(usage, n_classes=20), {"results": {"memory": usage}})
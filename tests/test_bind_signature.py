@@ -0,0 +1,259 @@
+import inspect
+from inspect import Parameter
+
+import pytest
+
+from docerator import bind_signature_to_function
+from docerator._binding import make_binder
+
+
+def recorder(*args, **kwargs):
+    return args, kwargs
+
+
+SIGNATURES = {
+    "positional": inspect.Signature([
+        Parameter("self", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("x", Parameter.POSITIONAL_OR_KEYWORD),
+    ]),
+    "defaults": inspect.Signature([
+        Parameter("x", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("y", Parameter.POSITIONAL_OR_KEYWORD, default=None),
+        Parameter("z", Parameter.POSITIONAL_OR_KEYWORD, default=2),
+    ]),
+    "keyword_only": inspect.Signature([
+        Parameter("x", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("a", Parameter.KEYWORD_ONLY),
+        Parameter("b", Parameter.KEYWORD_ONLY, default=1),
+    ]),
+    "var": inspect.Signature([
+        Parameter("x", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("y", Parameter.POSITIONAL_OR_KEYWORD, default=None),
+        Parameter("args", Parameter.VAR_POSITIONAL),
+        Parameter("a", Parameter.KEYWORD_ONLY, default=None),
+        Parameter("kwargs", Parameter.VAR_KEYWORD),
+    ]),
+    "positional_only": inspect.Signature([
+        Parameter("x", Parameter.POSITIONAL_ONLY),
+        Parameter("y", Parameter.POSITIONAL_OR_KEYWORD, default=None),
+    ]),
+}
+
+CALLS = [
+    ((), {}),
+    ((1,), {}),
+    ((1, 2), {}),
+    ((1, 2, 3), {}),
+    ((1, 2, 3, 4), {}),
+    ((1,), {"x": 2}),
+    ((), {"x": 1, "z": 3}),
+    ((1,), {"z": 3}),
+    ((1,), {"a": 1}),
+    ((1,), {"a": 1, "b": 2}),
+    ((1,), {"a": 1, "c": 2}),
+    ((1, 2), {"a": 1, "y": 3}),
+    ((), {"self": 1, "x": 2}),
+]
+
+
+@pytest.mark.parametrize("name", SIGNATURES.keys())
+@pytest.mark.parametrize("args, kwargs", CALLS)
+def test_binder_matches_signature_bind(name, args, kwargs):
+    signature = SIGNATURES[name]
+    binder, wrapped = make_binder(signature, recorder)
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError as err:
+        with pytest.raises(TypeError) as binder_err:
+            binder(*args, **kwargs)
+        with pytest.raises(TypeError) as wrapped_err:
+            wrapped(*args, **kwargs)
+        assert str(wrapped_err.value) == f"recorder(): {err}"
+    else:
+        bound_args, bound_kwargs = binder(*args, **kwargs)
+        assert tuple(bound_args) == bound.args and bound_kwargs == bound.kwargs
+        # kwargs should also be passed on in the same order.
+        assert list(bound_kwargs) == list(bound.kwargs)
+        assert wrapped(*args, **kwargs) == (bound.args, bound.kwargs)
+
+
+def test_binder_prefixed_names():
+    signature = inspect.Signature([
+        Parameter("_docerator_args", Parameter.POSITIONAL_OR_KEYWORD),
+    ])
+    _, wrapped = make_binder(signature, recorder)
+    assert wrapped(1) == ((1, ), {})
+    with pytest.raises(TypeError, match="recorder\\(\\): missing a required argument"):
+        wrapped()
+
+
+def test_binder_generated_on_first_call():
+    from docerator._binding import _CHECKED_BIND, _generated_binder, _shape
+
+    def other(*args, **kwargs):
+        return "other"
+
+    _generated_binder.cache_clear()
+    signature = SIGNATURES["var"]
+    _, wrapped = make_binder(signature, recorder)
+    _, other_wrapped = make_binder(signature.replace(), other)
+    assert _generated_binder.cache_info().currsize == 0
+
+    assert wrapped(1) == ((1, ), {})
+    assert other_wrapped(1) == "other"
+    # both signatures have the same parameters, so they share the generated binder.
+    assert _generated_binder.cache_info().currsize == 1
+    assert wrapped.__code__ is other_wrapped.__code__
+    binders = [func.__closure__[_CHECKED_BIND].cell_contents for func in (wrapped, other_wrapped)]
+    assert binders == [_generated_binder(_shape(signature))] * 2
+
+
+def test_wrapped_function_errors_are_not_rewritten():
+    def func(x):
+        raise TypeError("raised by func")
+
+    wrapped = bind_signature_to_function(inspect.signature(func), func)
+    with pytest.raises(TypeError, match="^raised by func$"):
+        wrapped(1)
+    assert wrapped.__wrapped__ is func
+    assert inspect.signature(wrapped) == inspect.signature(func)
+
+
+def test_no_call_validation():
+    def func(x, **kwargs):
+        """func"""
+        return x, kwargs
+
+    signature = inspect.Signature([
+        Parameter("x", Parameter.POSITIONAL_OR_KEYWORD),
+        Parameter("y", Parameter.KEYWORD_ONLY),
+    ])
+    bound = bind_signature_to_function(signature, func, validate_calls=False)
+    assert bound is not func
+    assert bound.__code__ is func.__code__
+    assert bound.__doc__ == "func"
+    assert inspect.signature(bound) == signature
+    assert inspect.signature(func) != signature
+    # calls are not checked against the new signature.
+    assert bound(1, z=2) == (1, {"z": 2})
+
+
+def test_sampled_call_validation():
+    def func(x, **kwargs):
+        return x
+
+    signature = inspect.Signature([Parameter("x", Parameter.POSITIONAL_OR_KEYWORD)])
+    bound = bind_signature_to_function(signature, func, validate_calls=3)
+    assert inspect.signature(bound) == signature
+    failures = 0
+    for i in range(9):
+        try:
+            bound(i, z=2)
+        except TypeError:
+            failures += 1
+    assert failures == 3
+
+    with pytest.raises(ValueError):
+        bind_signature_to_function(signature, func, validate_calls=0)
+
+
+def test_signature_cache():
+    import gc
+    import weakref
+    from docerator._base import _SIGNATURE_CACHE, signature
+
+    def func(a, b=1): ...
+
+    sig = signature(func)
+    assert sig == inspect.signature(func)
+    assert signature(func) is sig
+    assert func in _SIGNATURE_CACHE
+
+    # reassigning any of the attributes the signature is computed from invalidates it.
+    func.__defaults__ = (2, )
+    assert signature(func).parameters["b"].default == 2
+
+    explicit = inspect.Signature([Parameter("c", Parameter.KEYWORD_ONLY)])
+    func.__signature__ = explicit
+    assert signature(func) is explicit
+    func.__signature__ = sig
+    assert signature(func) is sig
+    del func.__signature__
+    assert signature(func).parameters["b"].default == 2
+
+    # the cache does not keep functions alive.
+    func_ref = weakref.ref(func)
+    del func
+    gc.collect()
+    assert func_ref() is None
+
+
+@pytest.mark.parametrize("name", ["defaults", "positional_only"])
+def test_outermost_calls_skip_inner_binding(name):
+    import sys
+
+    signature = SIGNATURES[name]
+
+    def chain(depth):
+        # `depth` subclasses, each of whose `step` calls its parent's with the same first argument.
+        def step(x, y=None):
+            return 0
+        cls = object
+        for d in range(depth + 1):
+            step.__qualname__ = f"Step{d}.step"
+            cls = type(f"Step{d}", (cls,), {"step": bind_signature_to_function(signature, step, "outermost")})
+
+            def step(x, y=None, parent=cls):
+                return parent.step(x, y) + 1
+        return cls
+
+    for depth in [1, 4, 16]:
+        leaf = chain(depth)()
+        leaf.step()
+        names = []
+        sys.setprofile(lambda frame, event, arg: names.append(frame.f_code.co_name) if event == "call" else None)
+        try:
+            assert leaf.step() == depth
+        finally:
+            sys.setprofile(None)
+        # only the outermost call binds its arguments, the inner ones go straight from their
+        # wrapper to the method they wrap.
+        wrapper = "bind_signature"
+        assert names[names.index("step"):] == ["step"] + [wrapper, "step"] * depth
+        assert names.count("bind" if name == "positional_only" else "_docerator_bind") == 1
+        if name != "positional_only":
+            # (the outermost call first looks up its chain)
+            assert names[:names.index("step")] == [wrapper, "_chain", "get", "_docerator_bind"]
+
+
+@pytest.mark.parametrize("name", ["defaults", "positional_only"])
+def test_outermost_calls_of_unrelated_functions(name):
+    signature = SIGNATURES[name]
+    calls = []
+
+    class Other:
+        def step(x, y=None, **kwargs):
+            calls.append(y)
+        step = bind_signature_to_function(signature, step, "outermost")
+
+    class Base:
+        def step(x, y=None):
+            # a method with the same name, of a class that is not in the MRO of x
+            Other.step(x, w=1)
+        step = bind_signature_to_function(signature, step, "outermost")
+
+    with pytest.raises(TypeError):
+        Base().step()
+
+    # functions that are not methods check all of their calls, whatever their first argument.
+    def recurse(x, y=None, **kwargs):
+        if not kwargs:
+            wrapped(x, w=1)
+
+    wrapped = bind_signature_to_function(signature, recurse, "outermost")
+    with pytest.raises(TypeError):
+        wrapped(None)
+    wrapped = bind_signature_to_function(signature, Other.step.__wrapped__, "outermost")
+    with pytest.raises(TypeError):
+        bind_signature_to_function(signature, lambda x, y=None: wrapped(x, w=1), "outermost")(None)
+    assert calls == []
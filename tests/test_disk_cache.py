@@ -0,0 +1,230 @@
+import importlib.util
+import inspect
+import json
+import sys
+import textwrap
+
+import pytest
+
+import docerator
+from docerator import _disk_cache
+from docerator.parsers import NumpydocParser
+
+MODULE_SOURCE = '''
+import docerator
+
+def helper(b):
+    """Helper
+
+    Parameters
+    ----------
+    b : float
+        The helper's b.
+    """
+
+class Base(metaclass=docerator.DoceratorMeta):
+    """Base
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    b : float, optional
+        The b.
+    """
+    def __init__(self, a, b=1.0): ...
+
+class Child(Base):
+    """Child
+
+    Parameters
+    ----------
+    c : str
+        The c.
+    %(super.*)
+    """
+    def __init__(self, c, **kwargs): ...
+
+    def method(self, b):
+        """Method
+
+        Parameters
+        ----------
+        %({module}.helper.b)
+        """
+'''
+
+
+def import_from_path(module_name, file_path):
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def cached_module(tmp_path):
+    module_name = "docerator_disk_cache_module"
+    path = tmp_path / f"{module_name}.py"
+    path.write_text(MODULE_SOURCE.format(module=module_name))
+    cache_dir = tmp_path / "cache"
+    docerator.enable_disk_cache(cache_dir)
+    yield module_name, path, cache_dir
+    docerator.disable_disk_cache()
+    sys.modules.pop(module_name, None)
+
+
+def count_parses(monkeypatch):
+    calls = []
+    parse = NumpydocParser.doc_parameter_parser.__func__
+
+    def counting_parser(cls, docstring):
+        calls.append(docstring)
+        return parse(cls, docstring)
+
+    monkeypatch.setattr(NumpydocParser, "doc_parameter_parser", classmethod(counting_parser))
+    return calls
+
+
+def test_disk_cache_roundtrip(cached_module, monkeypatch):
+    module_name, path, cache_dir = cached_module
+    first = import_from_path(module_name, path)
+    docerator.flush_disk_cache()
+
+    cache_files = list(cache_dir.iterdir())
+    assert len(cache_files) == 1
+    data = json.loads(cache_files[0].read_text())
+    assert data["source_hash"] == _disk_cache.module_source_hash(module_name)
+    child_entry = data["classes"]["Child:numpydoc"]
+    assert child_entry["tables"]["__doc__"]["c"] == ["str", "    The c."]
+    assert child_entry["docs"]["__doc__"] == first.Child.__doc__
+    assert child_entry["docs"]["method"] == first.Child.method.__doc__
+
+    # a new process would start without anything in memory.
+    _disk_cache._MODULE_CACHES.clear()
+    calls = count_parses(monkeypatch)
+    second = import_from_path(module_name, path)
+    # Only the plain function target (which is not cached) should be parsed again.
+    assert [call.split("\n")[0] for call in calls] == ["Helper"]
+    for name in ["Base", "Child"]:
+        first_cls, second_cls = getattr(first, name), getattr(second, name)
+        assert first_cls.__doc__ == second_cls.__doc__
+        assert first_cls._arg_dict == second_cls._arg_dict
+        assert inspect.signature(first_cls) == inspect.signature(second_cls)
+    assert first.Child.method.__doc__ == second.Child.method.__doc__
+
+
+def test_disk_cache_source_change(cached_module, monkeypatch):
+    module_name, path, cache_dir = cached_module
+    import_from_path(module_name, path)
+    docerator.flush_disk_cache()
+
+    path.write_text(path.read_text().replace("The c.", "The new c."))
+    _disk_cache._MODULE_CACHES.clear()
+    calls = count_parses(monkeypatch)
+    module = import_from_path(module_name, path)
+    assert calls != []
+    assert "The new c." in module.Child.__doc__
+
+
+def test_disk_cache_dependency_change(cached_module, tmp_path):
+    module_name, path, cache_dir = cached_module
+    import_from_path(module_name, path)
+    docerator.flush_disk_cache()
+
+    # A child in another module depends on the first module's source.
+    child_name = "docerator_disk_cache_child"
+    child_path = tmp_path / f"{child_name}.py"
+    child_path.write_text(textwrap.dedent(f'''
+    from {module_name} import Base
+
+    class Other(Base):
+        """Other
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+        def __init__(self, a): ...
+    '''))
+    try:
+        other = import_from_path(child_name, child_path).Other
+        assert "The a." in other.__doc__
+        docerator.flush_disk_cache()
+
+        path.write_text(path.read_text().replace("The a.", "The new a."))
+        _disk_cache._MODULE_CACHES.clear()
+        import_from_path(module_name, path)
+        other = import_from_path(child_name, child_path).Other
+        assert "The new a." in other.__doc__
+    finally:
+        sys.modules.pop(child_name, None)
+
+
+def test_disk_cache_runtime_docstring_change(tmp_path):
+    # docstrings built at runtime from another module change without the module's source changing.
+    consts_name = "docerator_disk_cache_consts"
+    consts_path = tmp_path / f"{consts_name}.py"
+    consts_path.write_text('DESC = "The a."\n')
+    module_name = "docerator_disk_cache_runtime"
+    path = tmp_path / f"{module_name}.py"
+    path.write_text(textwrap.dedent(f'''
+    import docerator
+    import {consts_name}
+
+    class Base(metaclass=docerator.DoceratorMeta):
+        __doc__ = "Base\\n\\nParameters\\n----------\\na : int\\n    " + {consts_name}.DESC
+        def __init__(self, a): ...
+
+    class Child(Base):
+        """Child
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+        def __init__(self, **kwargs): ...
+    '''))
+    docerator.enable_disk_cache(tmp_path / "cache")
+    try:
+        import_from_path(consts_name, consts_path)
+        module = import_from_path(module_name, path)
+        assert "The a." in module.Child.__doc__
+        docerator.flush_disk_cache()
+
+        consts_path.write_text('DESC = "The new a."\n')
+        _disk_cache._MODULE_CACHES.clear()
+        import_from_path(consts_name, consts_path)
+        module = import_from_path(module_name, path)
+        assert "The new a." in module.Base.__doc__
+        assert "The new a." in module.Child.__doc__
+    finally:
+        docerator.disable_disk_cache()
+        sys.modules.pop(consts_name, None)
+        sys.modules.pop(module_name, None)
+
+
+def test_disk_cache_disabled(tmp_path):
+    assert _disk_cache.lookup(__name__, "Anything", "numpydoc", lambda: "digest") is None
+
+
+def test_digests_only_kept_for_the_cache(tmp_path):
+    module_name = "docerator_disk_cache_module"
+    path = tmp_path / f"{module_name}.py"
+    path.write_text(MODULE_SOURCE.format(module=module_name))
+    try:
+        module = import_from_path(module_name, path)
+        # nothing compares the digests of the classes without the cache (or frozen entries).
+        assert "_docerator_digest" not in module.Base.__dict__
+        assert "_docerator_digest" not in module.Child.__dict__
+
+        docerator.enable_disk_cache(tmp_path / "cache")
+        try:
+            module = import_from_path(module_name, path)
+        finally:
+            docerator.disable_disk_cache()
+        assert "_docerator_digest" in module.Base.__dict__
+        assert "_docerator_digest" in module.Child.__dict__
+    finally:
+        sys.modules.pop(module_name, None)
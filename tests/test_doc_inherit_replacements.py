@@ -68,6 +68,34 @@ def test_doc_replace(args):
         with pytest.raises(ValueError, match="param cannot be an empty list."):
             formatted = NumpydocParser.format_parameter(params)
 
+def test_substitute_indentation():
+    formatted = "a : int\n    The a.\n\n    More."
+    docstring = "Summary\n\n    %(first)\n\n        %(second)\n  %(first)\n    %(not.replaced)\n    "
+    verified = (
+        "Summary\n\n"
+        "    a : int\n        The a.\n\n        More.\n\n"
+        "        b\n"
+        "  a : int\n      The a.\n\n      More.\n"
+        "    %(not.replaced)\n    "
+    )
+    assert doc_inherit._substitute(docstring, {"first": formatted, "second": "b"}) == verified
+
+
+def test_mixed_replacement_key():
+    class Mixed(Parent):
+        """Mixed
+
+        Parameters
+        ----------
+        %(super.arg1, super.*)
+        """
+        def __init__(self, arg1, **kwargs): ...
+
+    doc = Mixed.__doc__
+    assert doc.count("arg1 : object") == 1
+    assert doc.index("arg1 : object") < doc.index("arg2 : int") < doc.index("even_more : list")
+
+
 def test_do_nothing():
     class Undocced(metaclass=docerator.DoceratorMeta):
         def __init__(self): ...
@@ -472,3 +500,745 @@ def test_bind_signature():
         wrapped_func(1, 2)
 
 
+
+
+def _lazy_hierarchy(lazy):
+    class Base(metaclass=docerator.DoceratorMeta, lazy=lazy):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        b : float, optional
+            The b.
+        """
+        def __init__(self, a, b=1.0): ...
+
+        def method(self, x):
+            """Method
+
+            Parameters
+            ----------
+            x : object
+                The x.
+            """
+
+    class Child(Base, lazy=lazy):
+        """Child
+
+        Parameters
+        ----------
+        c : str
+            The c.
+        %(super.*)
+        """
+        def __init__(self, c, **kwargs): ...
+
+        def method(self, x):
+            """Child method
+
+            Parameters
+            ----------
+            %(super.x)
+            """
+            return x
+
+    class GrandChild(Child, lazy=lazy):
+        """GrandChild
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+
+    return Base, Child, GrandChild
+
+
+def test_lazy_resolution():
+    eager = _lazy_hierarchy(False)
+    lazy = _lazy_hierarchy(True)
+
+    # argument dictionaries are built eagerly
+    for eager_cls, lazy_cls in zip(eager, lazy):
+        assert eager_cls._arg_dict == lazy_cls._arg_dict
+
+    _, Child, GrandChild = lazy
+    # Nothing has been resolved yet, except what GrandChild needed from Child's __init__
+    # to build its argument dictionary.
+    assert isinstance(Child.__dict__["method"], doc_inherit._LazyMember)
+    for name in ["__doc__", "__init__"]:
+        assert isinstance(GrandChild.__dict__[name], doc_inherit._LazyMember)
+
+    # resolving the grandchild also resolves what it needs from the child.
+    assert inspect.signature(GrandChild) == inspect.signature(eager[2])
+    assert GrandChild.__doc__ == eager[2].__doc__
+    assert not isinstance(Child.__dict__["__init__"], doc_inherit._LazyMember)
+    assert GrandChild.__init__ is not Child.__init__
+
+    for eager_cls, lazy_cls in zip(eager, lazy):
+        assert eager_cls.__doc__ == lazy_cls.__doc__
+        assert inspect.signature(eager_cls) == inspect.signature(lazy_cls)
+        assert eager_cls.method.__doc__ == lazy_cls.method.__doc__
+        assert inspect.signature(eager_cls.method) == inspect.signature(lazy_cls.method)
+
+
+def test_lazy_resolution_on_call():
+    _, Child, _ = _lazy_hierarchy(True)
+    child = Child("c", a=1)
+    assert child.__doc__ == Child.__doc__
+    assert child.method(2) == 2
+    with pytest.raises(TypeError, match=".*got an unexpected keyword argument 'd'"):
+        Child("c", a=1, d=2)
+
+
+
+def test_import_target_cache(monkeypatch):
+    doc_inherit._clear_target_cache()
+    imported = []
+    import_module = importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        imported.append(name)
+        return import_module(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib, "import_module", counting_import)
+    target = doc_inherit._import_target("numpydoc_classes.Parent.a_function")
+    assert imported[-1] == "numpydoc_classes"
+
+    imported.clear()
+    assert doc_inherit._import_target("numpydoc_classes.Parent.a_function") is target
+    assert imported == []
+    # A different target skips trying to import the "numpydoc_classes.Parent" class as a module.
+    assert doc_inherit._import_target("numpydoc_classes.Parent.__init__") is not None
+    assert imported == ["numpydoc_classes"]
+
+    with pytest.raises(AttributeError):
+        doc_inherit._import_target("numpydoc_classes.NotAClass.a_function")
+
+
+def test_import_target_missing_module(tmp_path, monkeypatch):
+    doc_inherit._clear_target_cache()
+    with pytest.raises(ImportError):
+        doc_inherit._import_target("docerator_later_module.Target.method")
+
+    # the module becomes importable later.
+    (tmp_path / "docerator_later_module.py").write_text("class Target:\n    def method(self): ...\n")
+    monkeypatch.syspath_prepend(tmp_path)
+    try:
+        target = doc_inherit._import_target("docerator_later_module.Target.method")
+        assert target is sys.modules["docerator_later_module"].Target.method
+    finally:
+        sys.modules.pop("docerator_later_module", None)
+
+
+def test_import_target_cache_reload(tmp_path, monkeypatch):
+    doc_inherit._clear_target_cache()
+    monkeypatch.syspath_prepend(tmp_path)
+    module_path = tmp_path / "docerator_reloaded_module.py"
+    module_path.write_text("class Target:\n    value = 1\n")
+    module = importlib.import_module("docerator_reloaded_module")
+    try:
+        target = doc_inherit._import_target("docerator_reloaded_module.Target")
+        assert target.value == 1
+
+        # (change the size of the file, so the cached bytecode is not reused)
+        module_path.write_text("class Target:\n    value = 22\n")
+        importlib.invalidate_caches()
+        importlib.reload(module)
+        target = doc_inherit._import_target("docerator_reloaded_module.Target")
+        assert target.value == 22
+
+        # also handle the module being removed and imported again.
+        del sys.modules["docerator_reloaded_module"]
+        module = importlib.import_module("docerator_reloaded_module")
+        assert doc_inherit._import_target("docerator_reloaded_module.Target") is module.Target
+    finally:
+        sys.modules.pop("docerator_reloaded_module", None)
+
+
+def test_inherited_arguments_index():
+    def mro_walk(cls, func_name):
+        merged = {}
+        for base in inspect.getmro(cls)[:-1][::-1]:
+            if base_arg_dict := getattr(base, "_arg_dict", None):
+                merged.update(base_arg_dict.get(func_name, {}))
+        return merged
+
+    class Mixin(metaclass=docerator.DoceratorMeta):
+        """Mixin
+
+        Parameters
+        ----------
+        b : str
+            The mixin's b.
+        m : int
+            The m.
+        """
+        def __init__(self, b, m): ...
+
+    class Diamond(GrandchildClass, Mixin):
+        """Diamond
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+        def __init__(self, **kwargs): ...
+
+    class Leaf(Diamond):
+        def method(self): ...
+
+    for cls in [Parent, ChildClass, GrandchildClass, CousinClass, Mixin, Diamond, Leaf]:
+        for func_name in ["__init__", "a_function", "method"]:
+            merged = doc_inherit._inherited_arguments(cls)[func_name]
+            assert merged == mro_walk(cls, func_name)
+            assert list(merged) == list(mro_walk(cls, func_name))
+
+    # A class that does not describe a method shares its parent's merged dictionary
+    assert Leaf._inherited_arguments["__init__"] is Diamond._inherited_arguments["__init__"]
+
+
+@pytest.mark.parametrize("validate_calls", [True, False, 2, "outermost"])
+def test_validate_calls_option(validate_calls):
+    class Base(metaclass=docerator.DoceratorMeta):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        """
+        def __init__(self, a):
+            self.a = a
+
+    class Child(Base, validate_calls=validate_calls):
+        """Child
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+
+    assert list(inspect.signature(Child).parameters) == ["a", "kwargs"]
+    assert "The a." in Child.__doc__
+    assert Child(a=1).a == 1
+    # the parent's __init__ is never modified
+    assert not hasattr(Base.__init__, "__signature__")
+    if validate_calls is False:
+        assert Child.__init__.__code__ is Child.__init__.__wrapped__.__code__
+    else:
+        assert Child.__init__.__code__ is not Child.__init__.__wrapped__.__code__
+
+
+@pytest.mark.parametrize("validate_calls", [True, "outermost"])
+def test_outermost_call_validation(validate_calls):
+    class Base(metaclass=docerator.DoceratorMeta, validate_calls=validate_calls):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        """
+        def __init__(self, a, **kwargs):
+            self.a = a
+            self.kwargs = kwargs
+
+    class Mid(Base, validate_calls=validate_calls):
+        """Mid
+
+        Parameters
+        ----------
+        m : int
+            The m.
+        %(super.*)
+        """
+        def __init__(self, m, **kwargs):
+            super().__init__(**kwargs)
+            self.other = Base(a=m) if m else None
+
+    class Leaf(Mid, validate_calls=validate_calls):
+        """Leaf
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+        def __init__(self, **kwargs):
+            # passes on an argument that Mid's new signature does not accept.
+            super().__init__(extra=1, **kwargs)
+
+    assert list(inspect.signature(Mid).parameters) == ["m", "a"]
+    if validate_calls is True:
+        with pytest.raises(TypeError, match="extra"):
+            Leaf(m=0, a=1)
+    else:
+        # only Leaf's own call was checked.
+        leaf = Leaf(m=2, a=1)
+        assert leaf.kwargs == {"extra": 1}
+        assert leaf.other.a == 2
+    with pytest.raises(TypeError):
+        Mid(m=0, a=1, extra=1)
+    with pytest.raises(TypeError):
+        Leaf(m=0, a=1, b=2)
+
+
+def test_outermost_calls_of_unrelated_classes():
+    class OtherBase(metaclass=docerator.DoceratorMeta, validate_calls="outermost"):
+        """OtherBase
+
+        Parameters
+        ----------
+        b : int, optional
+            The b.
+        """
+        def __init__(self, b=0, **kwargs):
+            self.b = b
+
+    class Other(OtherBase, validate_calls="outermost"):
+        """Other
+
+        Parameters
+        ----------
+        o : int
+            The o.
+        %(super.*)
+        """
+        def __init__(self, o, **kwargs):
+            OtherBase.__init__(self, **kwargs)
+            self.o = o
+
+    class Root(metaclass=docerator.DoceratorMeta, validate_calls="outermost"):
+        """Root
+
+        Parameters
+        ----------
+        r : int, optional
+            The r.
+        """
+        def __init__(self, r=0):
+            self.r = r
+
+    class Base(Root, validate_calls="outermost"):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        %(super.*)
+        """
+        def __init__(self, a, **kwargs):
+            # an `__init__` that is not part of this chain, on the same object.
+            Other.__init__(self, a, extra=1)
+            super().__init__(**kwargs)
+
+    assert list(inspect.signature(Base).parameters) == ["a", "r"]
+
+    with pytest.raises(TypeError, match="extra"):
+        Base(a=1)
+
+
+def test_lazy_arg_dict(monkeypatch):
+    parsed = []
+    parse = NumpydocParser.doc_parameter_parser.__func__
+
+    def counting_parser(cls, docstring):
+        parsed.append(docstring.split("\n")[0])
+        return parse(cls, docstring)
+
+    monkeypatch.setattr(NumpydocParser, "doc_parameter_parser", classmethod(counting_parser))
+
+    class Base(metaclass=docerator.DoceratorMeta):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        """
+        def __init__(self, a): ...
+
+        def method(self, x):
+            """Method
+
+            Parameters
+            ----------
+            x : float
+                The x.
+            """
+
+        def other(self, y):
+            """Other
+
+            Parameters
+            ----------
+            y : str
+                The y.
+            """
+
+    assert parsed == []
+    assert list(Base._arg_dict) == ["__init__", "method", "other"]
+    assert "method" in Base._arg_dict and parsed == []
+
+    class Child(Base):
+        """Child
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+        def __init__(self, a): ...
+
+        def method(self, x):
+            """Child method
+
+            Parameters
+            ----------
+            %(super.x)
+            """
+
+    # Only the entries that were needed for the replacements are parsed.
+    assert sorted(parsed) == ["Base", "Child", "Child method", "Method"]
+    assert Base._arg_dict == {
+        "__init__": NumpydocParser.parse_parameters(Base),
+        "method": NumpydocParser.parse_parameters(Base.method),
+        "other": NumpydocParser.parse_parameters(Base.other),
+    }
+
+    docerator.set_debug_level(1)
+    try:
+        parsed.clear()
+
+        class Debugged(metaclass=docerator.DoceratorMeta):
+            def method(self, x):
+                """Debugged
+
+                Parameters
+                ----------
+                x : int
+                """
+        assert parsed == ["Debugged"]
+    finally:
+        docerator.set_debug_level(0)
+
+
+def test_lazy_arg_dict_is_a_dict():
+    def fresh():
+        class Base(metaclass=docerator.DoceratorMeta):
+            """Base
+
+            Parameters
+            ----------
+            a : int
+                The a.
+            """
+            def __init__(self, a): ...
+
+            def method(self, x):
+                """Method
+
+                Parameters
+                ----------
+                x : float
+                    The x.
+                """
+        return Base
+
+    base = fresh()
+    expected = {
+        "__init__": NumpydocParser.parse_parameters(base),
+        "method": NumpydocParser.parse_parameters(base.method),
+    }
+    extra = {"other": {}}
+
+    def arguments():
+        return fresh()._arg_dict
+
+    assert isinstance(arguments(), dict)
+    assert arguments() == expected and not arguments() != expected
+    assert arguments().copy() == expected and type(arguments().copy()) is dict
+    assert dict(arguments()) == expected
+    assert {**arguments()} == expected
+    assert arguments() | extra == expected | extra
+    assert extra | arguments() == extra | expected
+    assert {} | arguments() == expected
+    assert arguments().get("method") == expected["method"]
+    assert arguments().get("missing", 1) == 1
+    assert list(arguments().items()) == list(expected.items())
+    assert list(arguments().values()) == list(expected.values())
+    assert repr(arguments()) == repr(expected)
+    assert arguments().pop("method") == expected["method"]
+    assert arguments().popitem() == expected.copy().popitem()
+
+    updated = arguments()
+    updated |= extra
+    assert updated == expected | extra
+    updated.update(method={})
+    assert updated["method"] == {}
+    assert updated.setdefault("__init__") == expected["__init__"]
+
+
+RELOAD_BASE = '''
+import docerator
+
+
+def helper(h=None):
+    """Helper
+
+    Parameters
+    ----------
+    h : object
+        The h.
+    """
+
+
+class Base(metaclass=docerator.DoceratorMeta):
+    """Base
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    """
+    def __init__(self, a): ...
+
+    def method(self, x):
+        """Method
+
+        Parameters
+        ----------
+        x : int
+            The x.
+        """
+'''
+
+RELOAD_CHILD = '''
+import docerator
+from docerator_reload_base import Base
+
+
+class Child(Base):
+    """Child
+
+    Parameters
+    ----------
+    %(super.*)
+    """
+    def __init__(self, **kwargs): ...
+
+    def method(self, **kwargs):
+        """Child method
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+
+
+class GrandChild(Child, lazy=True):
+    """GrandChild
+
+    Parameters
+    ----------
+    %(super.*)
+    """
+    def __init__(self, **kwargs): ...
+
+
+@docerator.doc_wrap()
+def function(h=None, **kwargs):
+    """Function
+
+    Parameters
+    ----------
+    %(docerator_reload_base.helper.h)
+    %(docerator_reload_base.Base.method.*)
+    """
+'''
+
+
+def test_refresh_after_reload(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_inherit, "_RELOADING", True)
+    monkeypatch.syspath_prepend(tmp_path)
+    base_path = tmp_path / "docerator_reload_base.py"
+    base_path.write_text(RELOAD_BASE)
+    (tmp_path / "docerator_reload_child.py").write_text(RELOAD_CHILD)
+    try:
+        base = importlib.import_module("docerator_reload_base")
+        child = importlib.import_module("docerator_reload_child")
+        assert "The a." in child.Child.__doc__
+        assert "The x." in child.function.__doc__
+        # GrandChild is resolved after the reload.
+        grandchild_repr = repr(child.GrandChild.__dict__["__init__"])
+
+        base_path.write_text(
+            RELOAD_BASE.replace("The a.", "The new a.\\n    b : int, optional\\n        The b.")
+            .replace("def __init__(self, a)", "def __init__(self, a, b=1)")
+            .replace("The x.", "The new x.")
+        )
+        importlib.invalidate_caches()
+        importlib.reload(base)
+
+        for cls in [child.Child, child.GrandChild]:
+            assert "The new a." in cls.__doc__
+            assert "The b." in cls.__doc__
+            assert list(inspect.signature(cls).parameters) == ["a", "b"]
+        assert "_LazyMember" in grandchild_repr
+        assert "The new x." in child.Child.method.__doc__
+        assert "The new x." in child.function.__doc__
+        assert list(inspect.signature(child.Child.method).parameters) == ["self", "x"]
+
+        # things docerator can not notice are picked up by refreshing their module.
+        base.helper.__doc__ = base.helper.__doc__.replace("The h.", "The new h.")
+        old_function = child.function
+        refreshed = docerator.refresh("docerator_reload_base")
+        assert refreshed == [
+            "docerator_reload_child:Child", "docerator_reload_child:GrandChild", "docerator_reload_child:function"
+        ]
+        assert "The new h." in child.function.__doc__
+        assert "The new h." in old_function.__doc__
+    finally:
+        sys.modules.pop("docerator_reload_base", None)
+        sys.modules.pop("docerator_reload_child", None)
+
+
+def test_reload_templates_are_opt_in(tmp_path, monkeypatch):
+    import gc
+    import weakref
+
+    monkeypatch.syspath_prepend(tmp_path)
+    (tmp_path / "docerator_reload_base.py").write_text(RELOAD_BASE)
+    (tmp_path / "docerator_reload_child.py").write_text(RELOAD_CHILD)
+    # (the classes of other tests with the same names)
+    gc.collect()
+    try:
+        importlib.import_module("docerator_reload_base")
+        child = importlib.import_module("docerator_reload_child")
+        # nothing is kept to resolve the classes and functions again.
+        assert "_docerator_templates" not in child.Child.__dict__
+        assert "_docerator_templates" not in child.function.__dict__
+        assert child.function not in doc_inherit._FUNCTIONS
+        assert "docerator_reload_child:Child" not in doc_inherit._LATEST
+    finally:
+        sys.modules.pop("docerator_reload_base", None)
+        sys.modules.pop("docerator_reload_child", None)
+
+    # what is kept while reloading is enabled does not keep the classes and functions alive.
+    monkeypatch.setattr(doc_inherit, "_RELOADING", True)
+    try:
+        importlib.import_module("docerator_reload_base")
+        child = importlib.import_module("docerator_reload_child")
+        assert "_docerator_templates" in child.Child.__dict__
+        assert child.function in doc_inherit._FUNCTIONS
+        assert doc_inherit._LATEST["docerator_reload_child:Child"] is child.Child
+        refs = [weakref.ref(child.Child), weakref.ref(child.function)]
+    finally:
+        sys.modules.pop("docerator_reload_base", None)
+        sys.modules.pop("docerator_reload_child", None)
+    del child
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
+
+
+def test_same_key_is_not_a_reload():
+    # classes made by a factory share their module and qualname, without their module being reloaded.
+    def make(description):
+        return docerator.DoceratorMeta("Dyn", (), {
+            "__doc__": f"Dyn\n\nParameters\n----------\na : int\n    The {description} a.\n",
+            "__init__": lambda self, a: None,
+        })
+
+    first = make("first")
+    child = docerator.DoceratorMeta("DynChild", (first, ), {
+        "__doc__": "DynChild\n\nParameters\n----------\n%(super.a)\n",
+        "__init__": lambda self, **kwargs: None,
+    })
+    second = make("second")
+    assert "The first a." in child.__doc__
+    assert first._arg_dict["__init__"]["a"].long_description == "The first a."
+    assert second._arg_dict["__init__"]["a"].long_description == "The second a."
+
+
+def test_reclaim(monkeypatch):
+    parsed = []
+    parse = NumpydocParser.doc_parameter_parser.__func__
+
+    def counting_parser(cls, docstring):
+        parsed.append(docstring.split("\n")[0])
+        return parse(cls, docstring)
+
+    monkeypatch.setattr(NumpydocParser, "doc_parameter_parser", classmethod(counting_parser))
+
+    class Base(metaclass=docerator.DoceratorMeta):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        """
+        def __init__(self, a): ...
+
+    class Child(Base):
+        """Child
+
+        Parameters
+        ----------
+        b : float
+            The b.
+        %(super.*)
+        """
+        def __init__(self, b, **kwargs): ...
+
+    class LazyChild(Base, lazy=True):
+        """LazyChild
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+
+    def grandchild():
+        class GrandChild(Child):
+            """GrandChild
+
+            Parameters
+            ----------
+            %(super.*)
+            """
+        return GrandChild
+
+    before = grandchild()
+    child_doc = Child.__doc__
+    assert "_DoceratorMeta__old_doc" in Child.__dict__
+
+    released = docerator.reclaim(__name__)
+    key = f"{__name__}:{Child.__qualname__}"
+    assert key in released
+    # LazyChild still needs its parent.
+    assert f"{__name__}:{Base.__qualname__}" not in released
+    assert "_DoceratorMeta__old_doc" not in Child.__dict__
+    assert "_docerator_templates" not in Child.__dict__
+    assert Child._inherited_arguments.merged == {}
+    assert Child.__doc__ == child_doc
+    # nothing keeps the formatted text of the parameters in the released signatures.
+    params = inspect.signature(Child).parameters.values()
+    assert all(param._formatted is None for param in params if isinstance(param, DescribedParameter))
+
+    # the parameters are parsed again when they are needed.
+    parsed.clear()
+    after = grandchild()
+    assert "Child" in parsed
+    assert after.__doc__ == before.__doc__
+    assert inspect.signature(after) == inspect.signature(before)
+    assert list(inspect.signature(after).parameters) == ["b", "a"]
+    assert "The a." in LazyChild.__doc__
+
+    # the classes created from the released ones can still be resolved again.
+    assert f"{__name__}:{after.__qualname__}" in docerator.refresh(__name__)
+    assert after.__doc__ == before.__doc__
+    assert Child.__doc__ == child_doc
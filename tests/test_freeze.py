@@ -0,0 +1,245 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+REPO = pathlib.Path(__file__).parent.parent
+
+BASE_SOURCE = '''
+import enum
+
+import docerator
+
+class _Sentinel:
+    def __repr__(self):
+        return "SENTINEL"
+
+
+SENTINEL = _Sentinel()
+
+
+class Mode(enum.Enum):
+    FAST = 1
+
+
+def function(c, d=2):
+    """A function
+
+    Parameters
+    ----------
+    c : str
+        The c.
+    d : int, optional
+        The d.
+    """
+
+
+class Base(metaclass=docerator.DoceratorMeta):
+    """Base
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    b : float, optional
+        The b.
+    mode : Mode, optional
+        The mode.
+    """
+    def __init__(self, a: int, b=1.0, mode: Mode = Mode.FAST): ...
+
+    def method(self, x, y=SENTINEL):
+        """Method
+
+        Parameters
+        ----------
+        x : list
+            The x.
+        y : object, optional
+            The y.
+        """
+'''
+
+CHILD_SOURCE = '''
+import docerator
+
+from .base import Base
+
+
+class Child(Base):
+    """Child
+
+    Parameters
+    ----------
+    c : str
+        The c.
+    %(super.*)
+    """
+    def __init__(self, c="c", **kwargs): ...
+
+    def method(self, x, **kwargs):
+        """Child method
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+
+
+@docerator.doc_wrap()
+def function(c, **kwargs):
+    """A function
+
+    Parameters
+    ----------
+    %(frozen_package.base.function.*)
+    """
+'''
+
+REPORT = '''
+import inspect, json, sys
+from docerator.parsers import NumpydocParser
+
+parsed = []
+parse = NumpydocParser.doc_parameter_parser.__func__
+NumpydocParser.doc_parameter_parser = classmethod(lambda cls, doc: parsed.append(doc) or parse(cls, doc))
+
+from frozen_package import child
+from frozen_package.base import Base
+report = {"parsed": len(parsed)}
+for name, item in [
+    ("Base", Base), ("Base.method", Base.method), ("Child", child.Child),
+    ("Child.method", child.Child.method), ("function", child.function),
+]:
+    report[name] = [item.__doc__, str(inspect.signature(item)), repr(inspect.signature(item).parameters)]
+json.dump(report, sys.stdout)
+'''
+
+
+def run(tmp_path, *args, frozen=True):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), str(REPO)])
+    env["DOCERATOR_FROZEN"] = "1" if frozen else "0"
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return subprocess.run(
+        [sys.executable, *args], env=env, cwd=tmp_path, capture_output=True, text=True, check=True,
+    ).stdout
+
+
+@pytest.fixture
+def package(tmp_path):
+    package = tmp_path / "frozen_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(BASE_SOURCE)
+    (package / "child.py").write_text(CHILD_SOURCE)
+    return package
+
+
+def test_freeze(tmp_path, package):
+    expected = json.loads(run(tmp_path, "-c", REPORT, frozen=False))
+    assert expected["parsed"] > 0
+    unfrozen = json.loads(run(tmp_path, "-OO", "-c", REPORT, frozen=False))
+    assert unfrozen["parsed"] == 0
+    assert "**kwargs" in unfrozen["Child"][1]
+
+    output = run(tmp_path, "-m", "docerator", "freeze", "frozen_package")
+    assert "2 module(s) regenerated" in output
+    assert (package / "_docerator_frozen.py").exists()
+
+    frozen = json.loads(run(tmp_path, "-c", REPORT))
+    assert frozen.pop("parsed") == 0
+    expected.pop("parsed")
+    assert frozen == expected
+
+    # Without docstrings, only the frozen signatures are applied.
+    optimized = json.loads(run(tmp_path, "-OO", "-c", REPORT))
+    assert optimized.pop("parsed") == 0
+    # (the default of Child.method's inherited y can not be frozen)
+    assert optimized.pop("Child.method")[1] == "(self, x, **kwargs)"
+    for name, (doc, *signature) in optimized.items():
+        assert doc is None
+        assert signature == expected[name][1:]
+
+    # Only regenerate the modules that changed.
+    (package / "child.py").write_text(CHILD_SOURCE.replace("The c.", "The new c."))
+    stale = json.loads(run(tmp_path, "-c", REPORT))
+    assert "The new c." in stale["Child"][0]
+    assert stale["parsed"] > 0
+    output = run(tmp_path, "-m", "docerator", "freeze", "frozen_package")
+    assert "1 module(s) regenerated" in output
+    frozen = json.loads(run(tmp_path, "-c", REPORT))
+    assert frozen["parsed"] == 0
+    assert frozen["Child"] == stale["Child"]
+
+    # Children are also out of date when their parent changes.
+    (package / "base.py").write_text(BASE_SOURCE.replace("The a.", "The new a."))
+    stale = json.loads(run(tmp_path, "-c", REPORT))
+    assert "The new a." in stale["Child"][0]
+    output = run(tmp_path, "-m", "docerator", "freeze", "frozen_package")
+    assert "2 module(s) regenerated" in output
+
+
+def test_freeze_runtime_docstring(tmp_path):
+    # docstrings built at runtime from another module change without the module's source changing.
+    package = tmp_path / "frozen_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "consts.py").write_text('DESC = "The a."\n')
+    (package / "base.py").write_text(
+        "import docerator\n"
+        "from . import consts\n\n"
+        "class Base(metaclass=docerator.DoceratorMeta):\n"
+        "    __doc__ = 'Base\\n\\nParameters\\n----------\\na : int\\n    ' + consts.DESC\n"
+        "    def __init__(self, a): ...\n"
+    )
+    (package / "child.py").write_text(CHILD_SOURCE.split("\n\n@docerator.doc_wrap()")[0])
+    report = (
+        "import json, sys\n"
+        "from frozen_package.child import Base, Child\n"
+        "json.dump([Base.__doc__, Child.__doc__], sys.stdout)\n"
+    )
+    run(tmp_path, "-m", "docerator", "freeze", "frozen_package")
+    base_doc, child_doc = json.loads(run(tmp_path, "-c", report))
+    assert "The a." in base_doc and "The a." in child_doc
+
+    (package / "consts.py").write_text('DESC = "The new a."\n')
+    base_doc, child_doc = json.loads(run(tmp_path, "-c", report))
+    assert "The new a." in base_doc and "The new a." in child_doc
+
+    output = run(tmp_path, "-m", "docerator", "freeze", "frozen_package")
+    assert "2 module(s) regenerated" in output
+    assert json.loads(run(tmp_path, "-c", report)) == [base_doc, child_doc]
+
+
+def test_signature_encoding():
+    from docerator._freeze import decode_signature, encode_signature
+    from docerator._params import DescribedParameter
+    import inspect
+
+    sentinel = object()
+
+    def func(a: int, b=sentinel, *args, c=(1, "2"), **kwargs) -> pathlib.Path: ...
+
+    signature = inspect.signature(func)
+    params = list(signature.parameters.values())
+    params[0] = DescribedParameter.from_inspect_param(params[0], "int", "The a.")
+    signature = signature.replace(parameters=params)
+    encoded = encode_signature(signature, func)
+    assert encoded["parameters"][1]["default"] == ("own", )
+    assert encoded["return_annotation"] == ("own", )
+    decoded = decode_signature(encoded, func)
+    assert decoded == signature
+    assert decoded.parameters["b"].default is sentinel
+
+    inherited = inspect.Signature([inspect.Parameter("d", inspect.Parameter.KEYWORD_ONLY, annotation=pathlib.Path)])
+    encoded = encode_signature(inherited, func)
+    assert encoded["parameters"][0]["annotation"] == ("ref", pathlib.Path.__module__, "Path")
+    assert decode_signature(encoded, func) == inherited
+
+    # A default that can not be found again.
+    other = inspect.Signature([inspect.Parameter("d", inspect.Parameter.KEYWORD_ONLY, default=object())])
+    assert encode_signature(other, func) is None
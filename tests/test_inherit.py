@@ -0,0 +1,150 @@
+import abc
+import inspect
+
+import pytest
+
+import docerator
+from docerator import DoceratorMeta, finalize, inherit
+
+
+def hierarchy(decorate):
+    class Base(abc.ABC):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        b : float, optional
+            The b.
+        """
+        def __init__(self, a, b=1.0): ...
+
+        @abc.abstractmethod
+        def method(self, x):
+            """Method
+
+            Parameters
+            ----------
+            x : list
+                The x.
+            """
+
+    Base = decorate(Base)
+
+    class Child(Base):
+        """Child
+
+        Parameters
+        ----------
+        c : str
+            The c.
+        %(super.*)
+        """
+        def __init__(self, c, **kwargs): ...
+
+        def method(self, x):
+            """Child method
+
+            Parameters
+            ----------
+            %(super.x)
+            """
+
+    Child = decorate(Child)
+    return Base, Child
+
+
+class ABCDoceratorMeta(DoceratorMeta, abc.ABCMeta):
+    pass
+
+
+def as_metaclass(cls):
+    # the same class, created with the combined metaclass instead.
+    namespace = {name: item for name, item in cls.__dict__.items() if name not in ("__dict__", "__weakref__")}
+    bases = tuple(getattr(base, "_metaclass_version", base) for base in cls.__bases__)
+    cls._metaclass_version = ABCDoceratorMeta(cls.__name__, bases, namespace)
+    return cls._metaclass_version
+
+
+def test_finalize():
+    Base, Child = hierarchy(inherit)
+    assert "%(super.*)" in Child.__doc__
+    assert finalize(__name__) == [
+        f"{__name__}:{Base.__qualname__}", f"{__name__}:{Child.__qualname__}"
+    ]
+    assert finalize(__name__) == []
+
+    expected_base, expected_child = hierarchy(as_metaclass)
+    assert type(Child) is abc.ABCMeta
+    assert Child.__doc__ == expected_child.__doc__
+    assert Child.method.__doc__ == expected_child.method.__doc__
+    assert list(inspect.signature(Child).parameters) == ["c", "a", "b"]
+    assert inspect.signature(Child) == inspect.signature(expected_child)
+
+
+def test_finalized_when_needed():
+    Base, Child = hierarchy(inherit(star_excludes={"b"}))
+
+    class MetaChild(Child, metaclass=ABCDoceratorMeta):
+        """MetaChild
+
+        Parameters
+        ----------
+        %(super.*)
+        """
+        def __init__(self, **kwargs): ...
+
+        def method(self, x): ...
+
+    # creating a DoceratorMeta subclass finalized its parents.
+    assert finalize(__name__) == []
+    assert list(inspect.signature(Child).parameters) == ["c", "a"]
+    assert "The c." in MetaChild.__doc__
+
+
+def test_finalize_threads():
+    hierarchies = [hierarchy(inherit) for _ in range(8)]
+
+    @inherit
+    class Target:
+        """Target
+
+        Parameters
+        ----------
+        t : int
+            The t.
+        """
+        def __init__(self, t): ...
+
+    @inherit
+    class User:
+        """User
+
+        Parameters
+        ----------
+        %(test_inherit.Target.t)
+        """
+        def __init__(self, **kwargs): ...
+
+    # (targets are looked up by their module and name)
+    globals()["Target"] = Target
+    try:
+        finalized = finalize(__name__, max_workers=4)
+    finally:
+        del globals()["Target"]
+    assert len(finalized) == 2 * len(hierarchies) + 2
+    assert "The t." in User.__doc__
+    for _, Child in hierarchies:
+        assert list(inspect.signature(Child).parameters) == ["c", "a", "b"]
+
+
+def test_inherit_errors():
+    class Meta(metaclass=DoceratorMeta):
+        pass
+
+    with pytest.raises(TypeError):
+        inherit(Meta)
+    with pytest.raises(TypeError):
+        inherit(lambda: None)
+    assert docerator.inherit is inherit
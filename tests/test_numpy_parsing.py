@@ -1,4 +1,5 @@
 import inspect
+import textwrap
 from inspect import Parameter
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 import docerator
 import docerator._base as doc_base
 import docerator.parsers._numpydoc as np_doc
+from docerator.parsers._base import DEFAULT_CACHE_SIZE
 from docerator._params import DescribedParameter
 
 
@@ -468,3 +470,118 @@ def test_class_doc_with_extra_arg(debug):
         # Shouldn't throw if no debug
         assert np_doc.NumpydocParser.parse_parameters(TestClass) == verify_dict
     docerator.set_debug_level(0)
+
+
+def _regex_parameter_sections(docstring):
+    sections = np_doc.NUMPY_SECTION_REGEX.search(docstring).groupdict()
+    return sections["parameters"], sections["other_parameters"]
+
+
+def _random_docstring(rng):
+    lines = []
+    for _ in range(rng.randint(0, 25)):
+        kind = rng.random()
+        if kind < 0.4:
+            section = rng.choice(np_doc._numpydoc_sections)
+            lines.append(section)
+            # mostly the right number of hyphens, but sometimes not.
+            lines.append("-" * (len(section) + rng.choice([0, 0, 0, -1, 1])))
+        elif kind < 0.6:
+            lines.append("")
+        elif kind < 0.7:
+            lines.append(" " + rng.choice(np_doc._numpydoc_sections))
+        else:
+            lines.append(rng.choice(["arg : int", "    Description.", "text", "%(super.*)", "---"]))
+    docstring = "\n".join(lines)
+    if rng.random() < 0.2:
+        docstring += "\n"
+    return docstring
+
+
+def test_section_scanner_matches_regex():
+    import random
+
+    rng = random.Random(20241029)
+    for _ in range(2000):
+        docstring = _random_docstring(rng)
+        assert np_doc._scan_parameter_sections(docstring) == _regex_parameter_sections(docstring), docstring
+
+
+@pytest.mark.parametrize(
+    "docstring",
+    [
+        "",
+        "Parameters\n----------\n",
+        "Parameters\n----------\nitem\n",
+        "Summary\nParameters\n----------\nAttributes\n----------\nitem",
+        "Summary\nParameters\n----------\n\nAttributes\n----------\nitem",
+        "Summary\nOther Parameters\n----------------\nitem\nParameters\n----------\nother",
+        "\nParameters\n----------\nitem",
+        "Summary\nParameters\n---------\nitem\nParameters\n----------\nitem2",
+        "Summary\nExamples\n--------\nParameters\n----------\nitem",
+    ],
+)
+def test_section_scanner_edge_cases(docstring):
+    assert np_doc._scan_parameter_sections(docstring) == _regex_parameter_sections(docstring)
+
+
+@pytest.mark.parametrize(
+    "docstring",
+    [
+        # A very long summary without any sections.
+        "Summary\n" + "text line\n" * 100_000,
+        # Many lines that almost look like section headers.
+        "Summary\n" + "Parameters\n---------\nitem\n" * 50_000,
+        # Repeated sections, out of order.
+        "Summary\n" + "Examples\n--------\nitem\nParameters\n----------\nitem\n" * 25_000,
+        # Huge parameter sections.
+        "Summary\nParameters\n----------\n" + "item : type\n    description\n" * 50_000,
+    ],
+    ids=["long_summary", "near_miss_headers", "out_of_order", "long_parameters"],
+)
+def test_section_scanner_pathological_inputs(docstring):
+    import time
+
+    start = time.perf_counter()
+    np_doc._scan_parameter_sections(docstring)
+    np_doc.NumpydocParser.doc_parameter_parser(docstring)
+    # These are all ~1MB docstrings, this should be far below the bound.
+    assert time.perf_counter() - start < 5
+
+
+def test_parse_cache():
+    parser = np_doc.NumpydocParser
+    parser.cache_clear()
+    docstring = """Summary
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    """
+    # The same docstring at a different indentation level.
+    nested = textwrap.indent(docstring, "    ").lstrip()
+
+    first = parser.doc_parameter_parser(docstring)
+    assert parser.cache_info() == (0, 1, DEFAULT_CACHE_SIZE, 1)
+    first["b"] = None
+    assert parser.doc_parameter_parser(nested) == {"a": ("int", "    The a.")}
+    assert parser.cache_info().hits == 1
+
+    parser.set_cache_size(2)
+    try:
+        for i in range(3):
+            parser.doc_parameter_parser(docstring.replace("The a.", f"The {i}."))
+        info = parser.cache_info()
+        assert (info.misses, info.maxsize, info.currsize) == (4, 2, 2)
+        # The least recently used docstring was evicted.
+        parser.doc_parameter_parser(docstring)
+        assert parser.cache_info().misses == 5
+
+        parser.set_cache_size(0)
+        assert parser.cache_info().currsize == 0
+        assert parser.doc_parameter_parser(docstring) == {"a": ("int", "    The a.")}
+        assert parser.cache_info().currsize == 0
+    finally:
+        parser.set_cache_size(DEFAULT_CACHE_SIZE)
+        parser.cache_clear()
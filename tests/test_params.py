@@ -0,0 +1,120 @@
+import inspect
+import pickle
+from inspect import Parameter
+
+import pytest
+
+from docerator._params import DescribedParameter
+
+
+def described(**kwargs):
+    return DescribedParameter(
+        "a", Parameter.POSITIONAL_OR_KEYWORD, default=1, annotation=int,
+        type_description="int, optional", long_description="    The a.\n      More about a.", **kwargs
+    )
+
+
+def test_long_description_cleaned():
+    param = described()
+    assert param.long_description == "The a.\n  More about a."
+    # whitespace only lines are also cleaned up, even if nothing was indented.
+    param = DescribedParameter("a", Parameter.KEYWORD_ONLY, long_description="The a.\n   \nMore.")
+    assert param.long_description == "The a.\n\nMore."
+
+
+@pytest.mark.parametrize("description", ["type_description", "long_description"])
+def test_invalid_descriptions(description):
+    with pytest.raises(TypeError, match=f"^{description} must be a str, not a int$"):
+        DescribedParameter("a", Parameter.KEYWORD_ONLY, **{description: 1})
+    with pytest.raises(TypeError, match=f"^{description} must be a str, not a list$"):
+        described().replace(**{description: ["The a."]})
+
+
+def test_descriptions_shared():
+    a = DescribedParameter("a", Parameter.KEYWORD_ONLY, type_description="in" + "t", long_description="  The x.")
+    b = DescribedParameter("b", Parameter.KEYWORD_ONLY, type_description="i" + "nt", long_description="  The x.")
+    assert a.type_description is b.type_description
+    assert a.long_description is b.long_description
+
+
+def test_shared_descriptions_are_released(monkeypatch):
+    import gc
+    import weakref
+    import docerator
+    from docerator import _params
+
+    class Text(str):
+        pass
+
+    # the shared copies are not kept alive once nothing else needs them.
+    description = Text("A description that nothing else uses.")
+    ref = weakref.ref(description)
+    param = DescribedParameter("a", Parameter.KEYWORD_ONLY, long_description=description)
+    assert param.long_description is description
+    del param, description
+    docerator.reclaim()
+    gc.collect()
+    assert ref() is None
+
+    # and only a bounded number of them are kept.
+    monkeypatch.setattr(_params, "_MAX_DESCRIPTIONS", 3)
+    for i in range(10):
+        DescribedParameter("a", Parameter.KEYWORD_ONLY, long_description=f"The {i}.")
+    assert len(_params._DESCRIPTIONS) <= 3
+
+
+@pytest.mark.parametrize("changes", [
+    {},
+    {"kind": Parameter.KEYWORD_ONLY},
+    {"default": None},
+    {"annotation": str},
+    {"type_description": "str"},
+    {"long_description": "  Something else."},
+    {"name": "b"},
+    {"kind": Parameter.POSITIONAL_ONLY, "default": Parameter.empty},
+])
+def test_replace(changes):
+    param = described()
+    replaced = param.replace(**changes)
+    expected = {
+        "name": param.name, "kind": param.kind, "default": param.default, "annotation": param.annotation,
+        "type_description": param.type_description, "long_description": param.long_description,
+    } | changes
+    assert replaced == DescribedParameter(**expected)
+    assert hash(replaced) == hash(DescribedParameter(**expected))
+    assert type(replaced.kind) is type(param.kind)
+
+
+def test_replace_validates():
+    param = described()
+    with pytest.raises(ValueError):
+        param.replace(kind=Parameter.VAR_KEYWORD)
+    with pytest.raises(ValueError):
+        param.replace(name="not a name")
+    # no default is allowed though.
+    assert param.replace(kind=Parameter.VAR_KEYWORD, default=Parameter.empty).kind == Parameter.VAR_KEYWORD
+
+
+def test_hash_and_copies():
+    param = described()
+    assert hash(param) == hash(param)
+    assert param._hash is not None
+    copied = pickle.loads(pickle.dumps(param))
+    assert copied.name == param.name and copied.default == param.default
+    assert "_name" not in DescribedParameter.__slots__
+    assert inspect.Signature([param]).parameters["a"] is param
+
+
+def test_formatted_once():
+    from docerator.parsers import NumpydocParser
+
+    param = described()
+    text = NumpydocParser.format_parameter(param)
+    assert text == "a : int, optional\n    The a.\n      More about a."
+    # the formatted text is kept, and shared with copies that only change the kind or default.
+    moved = param.replace(kind=Parameter.KEYWORD_ONLY, default=2)
+    assert NumpydocParser.format_parameter(moved) is text
+    assert NumpydocParser.format_parameter([param, moved]) == "a, a : int, optional\n    The a.\n      More about a."
+    changed = param.replace(long_description="Other.")
+    assert NumpydocParser.format_parameter(changed) == "a : int, optional\n    Other."
+    assert NumpydocParser.format_parameter(param) is text
@@ -0,0 +1,97 @@
+import pathlib
+import subprocess
+import sys
+
+from docerator.profile import format_report, profile_package, summarize
+
+REPO = pathlib.Path(__file__).parent.parent
+
+BASE_SOURCE = '''
+import docerator
+
+
+class Base(metaclass=docerator.DoceratorMeta):
+    """Base
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    """
+    def __init__(self, a): ...
+'''
+
+CHILD_SOURCE = '''
+from .base import Base
+
+
+class Child(Base):
+    """Child
+
+    Parameters
+    ----------
+    b : int
+        The b.
+    %(super.*)
+    """
+    def __init__(self, b, **kwargs): ...
+'''
+
+
+def make_package(tmp_path, monkeypatch):
+    package = tmp_path / "profiled_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(BASE_SOURCE)
+    (package / "child.py").write_text(CHILD_SOURCE)
+    monkeypatch.chdir(tmp_path)
+
+
+def test_profile_package(tmp_path, monkeypatch):
+    make_package(tmp_path, monkeypatch)
+    result = profile_package("profiled_package")
+    assert result["failed"] == []
+    assert result["import_time"] > 0
+    assert "profiled_package.child:Child" in result["stats"]
+
+    modules, classes = summarize(result)
+    assert {row["module"] for row in modules} == {"profiled_package.base", "profiled_package.child"}
+    assert [row["time"] for row in classes] == sorted((row["time"] for row in classes), reverse=True)
+    assert sum(row["time"] for row in modules) <= result["import_time"]
+
+    report = format_report(result)
+    assert "Total import time" in report
+    assert "profiled_package.child.Child" in report
+
+    # only the package itself.
+    assert profile_package("profiled_package", submodules=False)["stats"] == {}
+
+
+def test_profile_uses_this_docerator(tmp_path, monkeypatch):
+    make_package(tmp_path, monkeypatch)
+    # another docerator that is already on the path.
+    other = tmp_path / "other" / "docerator"
+    other.mkdir(parents=True)
+    (other / "__init__.py").write_text("raise ImportError('the other docerator')")
+    monkeypatch.setenv("PYTHONPATH", str(other.parent))
+    assert "profiled_package.child:Child" in profile_package("profiled_package")["stats"]
+
+
+def test_profile_command(tmp_path, monkeypatch):
+    make_package(tmp_path, monkeypatch)
+    monkeypatch.setenv("PYTHONPATH", str(REPO))
+    output = subprocess.run(
+        [sys.executable, "-m", "docerator", "profile", "profiled_package", "--limit", "1"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    assert "Time in docerator" in output
+    assert output.count("profiled_package.") == 2
+
+
+def test_import_does_not_load_optional_modules():
+    # modules that only some features need are imported when those are used.
+    code = "import sys, docerator; print(sorted({'concurrent.futures', 'pkgutil', 'pprint'} & set(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=REPO,
+    ).stdout
+    assert output.strip() == "[]"
@@ -0,0 +1,174 @@
+import pickle
+import sys
+import types
+
+import pytest
+
+from docerator import _freeze
+from docerator.parsers import NumpydocParser
+from docerator.sphinx import setup
+
+BASE_SOURCE = '''
+import docerator
+
+
+class Base(metaclass=docerator.DoceratorMeta):
+    """Base
+
+    Parameters
+    ----------
+    a : int
+        The a.
+    """
+    def __init__(self, a): ...
+'''
+
+CHILD_SOURCE = '''
+from .base import Base
+
+
+class Child(Base):
+    """Child
+
+    Parameters
+    ----------
+    b : int
+        The b.
+    %(super.*)
+    """
+    def __init__(self, b, **kwargs): ...
+'''
+
+
+class FakeEnv:
+    def __init__(self):
+        self.dependencies = set()
+
+    def note_dependency(self, path):
+        self.dependencies.add(path)
+
+
+class FakeApp:
+    """Just enough of `sphinx.application.Sphinx` to emit the events the extension uses."""
+
+    def __init__(self, env):
+        self.env = env
+        self.extensions = []
+        self.listeners = {}
+
+    def setup_extension(self, name):
+        self.extensions.append(name)
+
+    def connect(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def emit(self, event, *args):
+        for callback in self.listeners.get(event, []):
+            callback(self, *args)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    package = tmp_path / "sphinx_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(BASE_SOURCE)
+    (package / "child.py").write_text(CHILD_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(_freeze, "_ENABLED", True)
+
+    parsed = []
+    parse = NumpydocParser.doc_parameter_parser.__func__.__wrapped__
+    monkeypatch.setattr(
+        NumpydocParser, "doc_parameter_parser", classmethod(lambda cls, doc: parsed.append(doc) or parse(cls, doc))
+    )
+    yield package, parsed
+    for name in list(sys.modules):
+        if name.startswith("sphinx_package"):
+            del sys.modules[name]
+    _freeze.stop_recording()
+
+
+def build(env):
+    # reads one document that documents Child, as a build would.
+    for name in list(sys.modules):
+        if name.startswith("sphinx_package"):
+            del sys.modules[name]
+    app = FakeApp(env)
+    metadata = setup(app)
+    app.emit("builder-inited")
+    from sphinx_package.child import Child
+    app.emit("autodoc-process-docstring", "class", "sphinx_package.child.Child", Child, {}, [])
+    app.emit("doctree-read", types.SimpleNamespace())
+    app.emit("build-finished", None)
+    return app, metadata, Child
+
+
+def test_sphinx_extension(package):
+    package, parsed = package
+    app, metadata, Child = build(FakeEnv())
+    assert metadata["parallel_read_safe"] and metadata["parallel_write_safe"]
+    assert "sphinx.ext.autodoc" in app.extensions
+    assert set(app.env.docerator_modules) == {"sphinx_package.base", "sphinx_package.child"}
+    assert app.env.dependencies == {str(package / "base.py")}
+    assert parsed
+    expected = Child.__doc__
+
+    # a second build with the pickled environment does not parse anything.
+    parsed.clear()
+    env = pickle.loads(pickle.dumps(app.env))
+    _, _, Child = build(env)
+    assert not parsed
+    assert Child.__doc__ == expected
+
+    # a change in the parent's module re-resolves the child.
+    (package / "base.py").write_text(BASE_SOURCE.replace("The a.", "The new a."))
+    _, _, Child = build(env)
+    assert parsed
+    assert "The new a." in Child.__doc__
+    assert "The new a." in env.docerator_modules["sphinx_package.child"]["entries"]["Child:numpydoc"]["docs"]["__doc__"]
+
+
+def test_sphinx_merge(package):
+    package, parsed = package
+    app, _, _ = build(FakeEnv())
+    main = FakeEnv()
+    app.emit("env-merge-info", main, ["index"], app.env)
+    assert main.docerator_modules == app.env.docerator_modules
+
+
+def test_sphinx_records_changed_modules(package, monkeypatch):
+    package, parsed = package
+    frozen = []
+    module_frozen = _freeze._ModuleRecord.frozen
+    monkeypatch.setattr(
+        _freeze._ModuleRecord, "frozen", lambda record: frozen.append(record.module_name) or module_frozen(record)
+    )
+    app = FakeApp(FakeEnv())
+    setup(app)
+    app.emit("builder-inited")
+    import sphinx_package.base
+    app.emit("doctree-read", types.SimpleNamespace())
+    assert frozen == ["sphinx_package.base"]
+
+    # documents that do not import anything new do not freeze anything again.
+    frozen.clear()
+    app.emit("doctree-read", types.SimpleNamespace())
+    assert frozen == []
+
+    import sphinx_package.child
+    app.emit("doctree-read", types.SimpleNamespace())
+    assert "sphinx_package.child" in frozen
+    assert set(app.env.docerator_modules) == {"sphinx_package.base", "sphinx_package.child"}
+    app.emit("build-finished", None)
+
+
+def test_sphinx_build_finished_stores_nothing(package):
+    # the environment is already saved when the build finishes, so nothing is stored into it then.
+    app = FakeApp(FakeEnv())
+    setup(app)
+    app.emit("builder-inited")
+    import sphinx_package.base
+    app.emit("build-finished", None)
+    assert getattr(app.env, "docerator_modules", {}) == {}
+    assert _freeze.recorded() == {}
@@ -0,0 +1,87 @@
+import inspect
+import pathlib
+import sys
+import textwrap
+
+import pytest
+
+import numpydoc_classes
+from docerator.static import SourceExpression, resolve_module
+
+TESTS = str(pathlib.Path(__file__).parent)
+
+
+def test_matches_runtime():
+    resolved = resolve_module("numpydoc_classes", [TESTS])
+    assert resolved
+    for qualname, (doc, signature) in resolved.items():
+        obj = numpydoc_classes
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+        assert doc == obj.__doc__, qualname
+        assert str(signature) == str(inspect.signature(obj)), qualname
+
+
+def test_does_not_import(tmp_path):
+    (tmp_path / "static_base.py").write_text(textwrap.dedent('''
+        from docerator import DoceratorMeta
+
+        raise RuntimeError("should not be executed")
+
+        class Base(metaclass=DoceratorMeta):
+            """Base.
+
+            Parameters
+            ----------
+            a : int
+                The a.
+            """
+            def __init__(self, a=DEFAULT): ...
+
+        def helper(y):
+            """Helper.
+
+            Parameters
+            ----------
+            y : bool
+                The y.
+            """
+    '''))
+    (tmp_path / "static_child.py").write_text(textwrap.dedent('''
+        from docerator import doc_wrap
+        from static_base import Base
+
+        class Child(Base):
+            """Child.
+
+            Parameters
+            ----------
+            %(super.a)
+            b : str
+                The b.
+            """
+            def __init__(self, b, **kwargs): ...
+
+        @doc_wrap()
+        def function(x):
+            """Function.
+
+            Parameters
+            ----------
+            %(static_base.helper.y)
+            x : float
+                The x.
+            """
+    '''))
+    resolved = resolve_module("static_child", [str(tmp_path)])
+    assert "static_base" not in sys.modules
+    # (python 3.13 strips the indentation of docstrings when they are compiled)
+    assert "a : int\n    The a." in inspect.cleandoc(resolved["Child"].doc)
+    assert list(resolved["Child"].signature.parameters) == ["b", "a", "kwargs"]
+    assert resolved["Child"].signature.parameters["a"].default == SourceExpression("DEFAULT")
+    assert "y : bool\n    The y." in inspect.cleandoc(resolved["function"].doc)
+
+
+def test_missing_module():
+    with pytest.raises(ImportError):
+        resolve_module("not_a_module_docerator_can_find", [TESTS])
@@ -0,0 +1,123 @@
+import pytest
+
+import docerator
+from docerator import _stats
+
+
+@pytest.fixture
+def recording():
+    docerator.reset_stats()
+    docerator.enable_stats()
+    yield
+    docerator.disable_stats()
+    docerator.reset_stats()
+
+
+def make_classes():
+    class Base(metaclass=docerator.DoceratorMeta):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        b : float, optional
+            The b.
+        """
+        def __init__(self, a, b=1.0): ...
+
+    class Child(Base):
+        """Child
+
+        Parameters
+        ----------
+        %(super.a)
+        %(super.*)
+        """
+        def __init__(self, a, **kwargs): ...
+
+        def method(self, x):
+            """Method
+
+            Parameters
+            ----------
+            %(docerator.doc_inherit.bind_signature_to_function.signature)
+            """
+
+    return Base, Child
+
+
+def test_stats_by_class_and_phase(recording):
+    Base, Child = make_classes()
+    results = docerator.stats()
+
+    base_stats = results[_stats.stats_key(Base)]
+    assert set(base_stats) == {"total", "parse"}
+
+    child_stats = results[_stats.stats_key(Child)]
+    assert {"total", "parse", "mro_merge", "target_import", "replace", "signature"} <= set(child_stats)
+    assert child_stats["total"]["count"] == 1
+    assert child_stats["target_import"]["count"] == 1
+    assert child_stats["mro_merge"]["count"] == 1
+    # formatting the two keys of the class docstring and the one of the method,
+    # then substituting them into the two docstrings.
+    assert child_stats["replace"]["count"] == 5
+    for phase in child_stats.values():
+        assert phase["time"] >= 0.0
+    phase_time = sum(value["time"] for name, value in child_stats.items() if name != "total")
+    assert phase_time <= child_stats["total"]["time"]
+
+
+def test_stats_doc_wrap(recording):
+    @docerator.doc_wrap()
+    def func(signature, func):
+        """A function
+
+        Parameters
+        ----------
+        %(docerator.doc_inherit.bind_signature_to_function.*)
+        """
+
+    func_stats = docerator.stats()[_stats.stats_key(func)]
+    assert func_stats["total"]["count"] == 1
+    assert func_stats["parse"]["count"] == 2
+
+
+def test_stats_lazy(recording):
+    class Base(metaclass=docerator.DoceratorMeta):
+        """Base
+
+        Parameters
+        ----------
+        a : int
+            The a.
+        """
+        def __init__(self, a): ...
+
+    class Child(Base, lazy=True):
+        """Child
+
+        Parameters
+        ----------
+        %(super.a)
+        """
+        def __init__(self, a): ...
+
+    key = _stats.stats_key(Child)
+    assert "replace" not in docerator.stats()[key]
+    assert "The a." in Child.__doc__
+    child_stats = docerator.stats()[key]
+    assert child_stats["total"]["count"] == 2
+    assert child_stats["replace"]["count"] == 2
+
+
+def test_stats_reset_and_disable(recording):
+    make_classes()
+    assert docerator.stats()
+    docerator.reset_stats()
+    assert docerator.stats() == {}
+
+    docerator.disable_stats()
+    make_classes()
+    assert docerator.stats() == {}
+    assert _stats.phase(None, "parse") is _stats._NULL_PHASE
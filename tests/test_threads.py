@@ -0,0 +1,70 @@
+import inspect
+import sys
+import threading
+
+import pytest
+
+synthetic = pytest.importorskip("benchmarks.synthetic")
+
+N_THREADS = 8
+
+
+def run_threads(target, n_threads=N_THREADS):
+    # start all of the threads at once, and re-raise the first error of any of them.
+    barrier = threading.Barrier(n_threads)
+    results = [None] * n_threads
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = target(i)
+        except BaseException as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run, args=(i, )) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def describe(module):
+    return {
+        name: (cls.__doc__, str(inspect.signature(cls)), cls.compute.__doc__, str(inspect.signature(cls.compute)))
+        for name, cls in vars(module).items() if isinstance(cls, type)
+    }
+
+
+@pytest.fixture
+def module_names():
+    names = []
+    yield names
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_concurrent_class_creation(module_names):
+    source = synthetic.hierarchy_source(depth=6, width=3, n_params=3)
+    module_names += [f"_docerator_threads_{i}" for i in range(N_THREADS + 1)]
+    expected = describe(synthetic.build_module(module_names[-1], source))
+
+    modules = run_threads(lambda i: synthetic.build_module(module_names[i], source))
+    for module in modules:
+        assert describe(module) == expected
+
+
+def test_concurrent_lazy_resolution(module_names):
+    source = synthetic.hierarchy_source(depth=6, width=3, n_params=3, class_kwargs={"lazy": True})
+    module_names += ["_docerator_threads_eager", "_docerator_threads_lazy"]
+    expected = describe(synthetic.build_module(
+        module_names[0], source.replace(", lazy=True", "")
+    ))
+    module = synthetic.build_module(module_names[1], source)
+
+    # every thread accesses the same unresolved members at once.
+    for result in run_threads(lambda i: describe(module)):
+        assert result == expected